@@ -0,0 +1,441 @@
+import asyncio
+import contextlib
+import time
+from .client import Client, Completions
+from .utils.hedging import acontinue_stream, aopen_stream, arace
+from .utils.rate_limit import estimate_tokens
+from .utils.streaming import asplit_thinking, response_to_chunks
+
+
+class AsyncClient(Client):
+    """
+    Asyncio counterpart of Client.
+
+    Provider configuration is identical to Client. Completions are awaitable, and
+    providers that ship a native async transport are called without a worker thread:
+
+        client = AsyncClient()
+        response = await client.chat.completions.create(
+            "openai:gpt-4o", messages=messages
+        )
+    """
+
+    @property
+    def chat(self):
+        """Return the async chat API interface."""
+        if not self._chat:
+            self._chat = AsyncChat(self)
+        return self._chat
+
+
+class AsyncChat:
+    def __init__(self, client: "AsyncClient"):
+        self.client = client
+        self._completions = AsyncCompletions(self.client)
+
+    @property
+    def completions(self):
+        """Return the async completions interface."""
+        return self._completions
+
+
+class AsyncCompletions(Completions):
+    async def _provider_create(
+        self, provider, model_name: str, messages: list, **kwargs
+    ):
+        """
+        Await a chat completion from the provider.
+
+        Providers that do not derive from Provider (and therefore have no
+        achat_completions_create) are run in a worker thread.
+        """
+        if hasattr(provider, "achat_completions_create"):
+            return await provider.achat_completions_create(
+                model_name, messages, **kwargs
+            )
+        return await asyncio.to_thread(
+            provider.chat_completions_create, model_name, messages, **kwargs
+        )
+
+    async def _acall_provider(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        use_cache: bool = True,
+        coalesce: bool = True,
+        **kwargs,
+    ):
+        """Async version of Completions._call_provider."""
+        cache = self.client.cache if use_cache else None
+        single_flight = self.client.single_flight if coalesce else None
+        if cache is None and single_flight is None:
+            return await self._asend(provider_key, model_name, messages, **kwargs)
+
+        key = self._cache_key(provider_key, model_name, messages, kwargs)
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+        async def fetch():
+            response = await self._asend(provider_key, model_name, messages, **kwargs)
+            if cache is not None:
+                cache.set(key, response)
+            return response
+
+        if single_flight is None:
+            return await fetch()
+        return await single_flight.ado(key, fetch)
+
+    async def _asend(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        stream: bool = False,
+        **kwargs,
+    ):
+        """Async version of Completions._send."""
+        if self.client.retry is None:
+            return await self._asend_once(
+                provider_key, model_name, messages, stream=stream, **kwargs
+            )
+        return await self.client.retry.acall(
+            lambda: self._asend_once(
+                provider_key, model_name, messages, stream=stream, **kwargs
+            )
+        )
+
+    async def _asend_once(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        stream: bool = False,
+        **kwargs,
+    ):
+        """Async version of Completions._send_once."""
+        provider = self._get_provider(provider_key)
+        messages = list(messages)
+        breaker = self.client.get_circuit_breaker(provider_key, model_name)
+        if breaker is not None:
+            breaker.check()
+        rate_limiter = self.client.get_rate_limiter(provider_key, model_name)
+        if rate_limiter is not None:
+            reserved = await rate_limiter.aacquire(estimate_tokens(messages, kwargs))
+        limiter = self.client.get_limiter(provider_key)
+        try:
+            async with limiter.aslot() if limiter else contextlib.nullcontext():
+                with breaker.guard() if breaker else contextlib.nullcontext():
+                    if stream:
+
+                        async def start():
+                            return self._provider_astream(
+                                provider, model_name, messages, **kwargs
+                            )
+
+                        response = await aopen_stream(start)
+                    else:
+                        response = await self._provider_create(
+                            provider, model_name, messages, **kwargs
+                        )
+        except Exception:
+            if rate_limiter is not None:
+                rate_limiter.release(reserved)
+            raise
+        if rate_limiter is not None:
+            rate_limiter.reconcile(reserved, getattr(response, "usage", None))
+        return response
+
+    async def _provider_astream(
+        self, provider, model_name: str, messages: list, **kwargs
+    ):
+        """Yield ChatCompletionChunk objects from the provider."""
+        if hasattr(provider, "achat_completions_create_stream"):
+            async for chunk in provider.achat_completions_create_stream(
+                model_name, messages, **kwargs
+            ):
+                yield chunk
+            return
+
+        response = await asyncio.to_thread(
+            provider.chat_completions_create, model_name, messages, **kwargs
+        )
+        for chunk in response_to_chunks(response):
+            yield chunk
+
+    async def _tool_runner(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        tools: any,
+        max_turns: int,
+        parallel_tools: bool = False,
+        tool_timeout: float = None,
+        **kwargs,
+    ):
+        """
+        Async version of Completions._tool_runner.
+
+        Args:
+            provider_key: Key of the provider to use for completions
+            model_name: Name of the model to use
+            messages: List of conversation messages
+            tools: Tools instance or list of callable tools
+            max_turns: Maximum number of tool execution turns
+            parallel_tools: Accepted for parity with Completions; the tool calls
+                of a turn always run concurrently here
+            tool_timeout: Seconds each tool call may run before it times out
+            **kwargs: Additional arguments to pass to the provider
+
+        Returns:
+            The final response from the model with intermediate responses and messages
+        """
+        tools_instance = self._prepare_tools(tools)
+        kwargs["tools"] = tools_instance.tools()
+
+        turns = 0
+        intermediate_responses = []  # Store intermediate responses
+        intermediate_messages = []  # Store all messages including tool interactions
+
+        while turns < max_turns:
+            # Make the API call
+            response = await self._acall_provider(
+                provider_key, model_name, messages, **kwargs
+            )
+            response = self._extract_thinking_content(response)
+
+            # Store intermediate response
+            intermediate_responses.append(response)
+
+            # Check if there are tool calls in the response
+            tool_calls = (
+                getattr(response.choices[0].message, "tool_calls", None)
+                if hasattr(response, "choices")
+                else None
+            )
+
+            # Store the model's message
+            intermediate_messages.append(response.choices[0].message)
+
+            if not tool_calls:
+                break
+
+            # Execute tools and get results
+            results, tool_messages = await tools_instance.aexecute_tool(
+                tool_calls, timeout=tool_timeout
+            )
+
+            # Add tool messages to intermediate messages
+            intermediate_messages.extend(tool_messages)
+
+            # Add the assistant's response and tool results to messages
+            messages.extend([response.choices[0].message, *tool_messages])
+
+            turns += 1
+
+        # Set the intermediate data in the final response
+        response.intermediate_responses = intermediate_responses[
+            :-1
+        ]  # Exclude final response
+        response.choices[0].intermediate_messages = intermediate_messages
+        return response
+
+    async def _acreate_with_fallbacks(
+        self, targets: list, messages: list, fallback_timeout: float = None, **kwargs
+    ):
+        """Async version of Completions._create_with_fallbacks."""
+        if kwargs.get("stream"):
+            raise ValueError("Fallback chains cannot be used with stream=True.")
+        if kwargs.get("max_turns") is not None:
+            raise ValueError(
+                "Fallback chains cannot be combined with max_turns, as tools could "
+                "run twice."
+            )
+        if not targets:
+            raise ValueError("A fallback chain needs at least one model.")
+
+        for index, target in enumerate(targets):
+            try:
+                response = await asyncio.wait_for(
+                    self.create(target, messages, **kwargs), fallback_timeout
+                )
+            except Exception as e:
+                if index == len(targets) - 1 or not self._should_fall_back(e):
+                    raise
+                continue
+            if getattr(response, "served_by", None) is None:
+                response.served_by = target
+            return response
+
+    async def _acreate_hedged(self, model: str, messages: list, hedge, **kwargs):
+        """
+        Async version of Completions._create_hedged. The losing request is
+        cancelled.
+        """
+        if kwargs.get("max_turns") is not None:
+            raise ValueError(
+                "hedge cannot be combined with max_turns, as tools could run twice."
+            )
+        policy = self.client.hedging
+        alternate = hedge if isinstance(hedge, str) else model
+        stream = kwargs.get("stream", False)
+        policy.record_request()
+
+        def attempt(target, duplicate=False):
+            async def call():
+                start = time.monotonic()
+                try:
+                    if stream:
+                        result = await aopen_stream(
+                            lambda: self.create(
+                                target,
+                                messages,
+                                _coalesce=not duplicate,
+                                **kwargs,
+                            )
+                        )
+                    else:
+                        result = await self.create(
+                            target, messages, _coalesce=not duplicate, **kwargs
+                        )
+                except asyncio.CancelledError:
+                    # A cancelled original took at least this long, and leaving
+                    # it out would bias the hedge delay low. A cancelled
+                    # duplicate started late and says nothing about its model.
+                    if not duplicate:
+                        policy.record_latency(target, time.monotonic() - start)
+                    raise
+                policy.record_latency(target, time.monotonic() - start)
+                return result
+
+            return call
+
+        delay = policy.hedge_delay(model)
+        if delay is None:
+            result, winner = await attempt(model)(), 0
+        else:
+            result, winner = await arace(
+                attempt(model),
+                attempt(alternate, duplicate=True),
+                delay,
+                policy.acquire_hedge,
+                discard=(lambda opened: opened[1].aclose()) if stream else None,
+            )
+        if winner == 1:
+            policy.record_hedge_win()
+        if stream:
+            return acontinue_stream(*result)
+        if getattr(result, "served_by", None) is None:
+            result.served_by = (model, alternate)[winner]
+        return result
+
+    async def create(self, model: str, messages: list, **kwargs):
+        """
+        Create chat completion based on the model, messages, and any extra arguments.
+        Supports automatic tool execution when max_turns is specified. Pass
+        parallel_tools=True to run the tool calls of each turn concurrently, and
+        tool_timeout to limit how long each tool call may run.
+
+        With stream=True an async iterator of ChatCompletionChunk is returned.
+        model may be a fallback chain, and hedge may be given, as in
+        Completions.create.
+        """
+        fallback_timeout = kwargs.pop("fallback_timeout", None)
+        targets = self._fallback_chain(model)
+        if targets is not None:
+            return await self._acreate_with_fallbacks(
+                targets, messages, fallback_timeout, **kwargs
+            )
+        hedge = kwargs.pop("hedge", None)
+        if hedge:
+            return await self._acreate_hedged(model, messages, hedge, **kwargs)
+
+        provider_key, model_name = self._parse_model(model)
+        provider = self._get_provider(provider_key, kwargs.get("base_url"))
+
+        # Extract tool-related parameters
+        max_turns = kwargs.pop("max_turns", None)
+        parallel_tools = kwargs.pop("parallel_tools", False)
+        tool_timeout = kwargs.pop("tool_timeout", None)
+        tools = kwargs.get("tools", None)
+        stream = kwargs.pop("stream", False)
+        use_cache = kwargs.pop("use_cache", True)
+        coalesce = kwargs.pop("_coalesce", True)
+        kwargs.pop("base_url", None)
+
+        if stream:
+            self._validate_stream_args(max_turns, tools)
+            return asplit_thinking(
+                acontinue_stream(
+                    *await self._asend(
+                        provider_key, model_name, messages, stream=True, **kwargs
+                    )
+                )
+            )
+
+        if max_turns is not None and tools is not None:
+            return await self._tool_runner(
+                provider_key,
+                model_name,
+                messages.copy(),
+                tools,
+                max_turns,
+                parallel_tools=parallel_tools,
+                tool_timeout=tool_timeout,
+                use_cache=use_cache,
+            )
+
+        response = await self._acall_provider(
+            provider_key,
+            model_name,
+            messages,
+            use_cache=use_cache,
+            coalesce=coalesce,
+            **kwargs,
+        )
+        return self._extract_thinking_content(response)
+
+    async def create_many(
+        self,
+        models: list,
+        messages: list,
+        timeout: float = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> list:
+        """
+        Send the same conversation to several models concurrently.
+
+        Args:
+            models: List of 'provider:model' strings.
+            messages: The conversation sent to every model.
+            timeout: Seconds to wait for each model, counted from when its request
+                is dispatched. A model that does not answer in time is cancelled
+                and gets a TimeoutError as its result.
+            max_concurrency: Maximum number of requests in flight at once.
+                Defaults to one per model.
+            **kwargs: Additional arguments passed to every create() call.
+
+        Returns:
+            A list with one entry per model, in the order of models. Each entry is
+            either the response or the exception raised for that model.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(models), 1))
+
+        async def run(model):
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.create(model, messages, **kwargs), timeout
+                    )
+                except asyncio.TimeoutError:
+                    return TimeoutError(
+                        f"'{model}' did not respond within {timeout} seconds"
+                    )
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    return e
+
+        return list(await asyncio.gather(*(run(model) for model in models)))
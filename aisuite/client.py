@@ -1,10 +1,36 @@
-from .provider import ProviderFactory
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .provider import CircuitOpenError, ProviderFactory, classify_error
 import os
+from .utils.cache import stable_hash
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    SingleFlight,
+    call_with_timeout,
+)
+from .utils.hedging import HedgePolicy, continue_stream, open_stream, race
+from .utils.rate_limit import RateLimiter, estimate_tokens
+from .utils.retry import RetryPolicy
+from .utils.streaming import response_to_chunks, split_thinking
 from .utils.tools import Tools
 
 
 class Client:
-    def __init__(self, provider_configs: dict = {}):
+    def __init__(
+        self,
+        provider_configs: dict = {},
+        cache=None,
+        adaptive_concurrency=False,
+        rate_limits: dict = None,
+        retry=None,
+        circuit_breaker=False,
+        fallbacks: dict = None,
+        hedging=None,
+        coalesce: bool = False,
+    ):
         """
         Initialize the client with provider configurations.
         Use the ProviderFactory to create provider instances.
@@ -22,19 +48,91 @@ class Client:
                         "aws_region": "us-west-2"
                     }
                 }
+            cache (ResponseCache, optional): Cache for exact-match responses, e.g.
+                MemoryCache or SQLiteCache from aisuite.utils.cache. Requests with
+                the same provider, model, messages and arguments are answered from
+                the cache. Pass use_cache=False to create() to bypass it.
+            adaptive_concurrency (bool or dict, optional): Limit the requests in
+                flight to each provider with an AdaptiveConcurrencyLimiter from
+                aisuite.utils.concurrency. The limit shrinks on rate limit and
+                overload errors or rising latency and grows back while the provider
+                keeps up; requests over the limit wait for a slot. Pass a dict of
+                AdaptiveConcurrencyLimiter arguments to tune it.
+            rate_limits (dict, optional): Requests and tokens per minute allowed for
+                each model, keyed by "provider:model" or by provider for all of its
+                models, e.g. {"openai:gpt-4o": {"requests_per_minute": 500,
+                "tokens_per_minute": 30000}}. Requests wait until both budgets
+                allow them; token use is estimated up front and corrected from the
+                reported usage.
+            retry (RetryPolicy, bool or dict, optional): Retry requests that fail
+                with rate limit, overload, timeout or connection errors, with
+                exponential backoff and jitter that honors Retry-After. Pass True
+                for the default RetryPolicy from aisuite.utils.retry or a dict of
+                its arguments.
+            circuit_breaker (bool or dict, optional): Put each provider behind a
+                CircuitBreaker from aisuite.utils.circuit_breaker, which fails
+                requests fast with CircuitOpenError while the provider's error rate
+                or latency is too high, and probes it again after a while. Pass a
+                dict of CircuitBreaker arguments to tune it, with "per_model": True
+                to keep a breaker per model instead of per provider.
+            fallbacks (dict, optional): Named fallback chains, mapping a name to a
+                list of 'provider:model' strings, e.g. {"claude": [
+                "anthropic:claude-3-5-sonnet-20240620",
+                "aws:anthropic.claude-3-5-sonnet-20240620-v1:0"]}. Pass the name
+                as the model to create() to use the chain.
+            hedging (HedgePolicy or dict, optional): When and how often requests
+                made with hedge=True are duplicated; see HedgePolicy in
+                aisuite.utils.hedging. By default a request is hedged after the
+                95th percentile latency of its model, for at most one request in
+                ten. Statistics are available from client.hedging.stats().
+            coalesce (bool, optional): Share one provider call between concurrent
+                requests with the same provider, model, messages and arguments,
+                with or without a cache. Every caller gets its own copy of the
+                response. client.single_flight.stats() counts coalesced requests.
         """
         self.providers = {}
+        self._providers_lock = threading.Lock()
         self.provider_configs = provider_configs
+        self.cache = cache
+        if adaptive_concurrency is True:
+            adaptive_concurrency = {}
+        self.adaptive_concurrency = (
+            adaptive_concurrency if isinstance(adaptive_concurrency, dict) else None
+        )
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+        self.rate_limits = rate_limits or {}
+        self._rate_limiters = {}
+        if retry is True:
+            retry = RetryPolicy()
+        elif isinstance(retry, dict):
+            retry = RetryPolicy(**retry)
+        self.retry = retry or None
+        if circuit_breaker is True:
+            circuit_breaker = {}
+        self.circuit_breaker = (
+            dict(circuit_breaker) if isinstance(circuit_breaker, dict) else None
+        )
+        self._breakers_per_model = bool(
+            self.circuit_breaker and self.circuit_breaker.pop("per_model", False)
+        )
+        self._breakers = {}
+        self.fallbacks = fallbacks or {}
+        if not isinstance(hedging, HedgePolicy):
+            hedging = HedgePolicy(**(hedging or {}))
+        self.hedging = hedging
+        self.single_flight = SingleFlight() if coalesce else None
         self._chat = None
         self._initialize_providers()
 
     def _initialize_providers(self):
         """Helper method to initialize or update providers."""
-        for provider_key, config in self.provider_configs.items():
-            provider_key = self._validate_provider_key(provider_key)
-            self.providers[provider_key] = ProviderFactory.create_provider(
-                provider_key, config
-            )
+        with self._providers_lock:
+            for provider_key, config in self.provider_configs.items():
+                provider_key = self._validate_provider_key(provider_key)
+                self.providers[provider_key] = ProviderFactory.create_provider(
+                    provider_key, config
+                )
 
     def _validate_provider_key(self, provider_key):
         """
@@ -60,6 +158,68 @@ class Client:
         self.provider_configs.update(provider_configs)
         self._initialize_providers()  # NOTE: This will override existing provider instances.
 
+    def get_limiter(self, provider_key: str):
+        """
+        Return the concurrency limiter for a provider, or None if adaptive
+        concurrency is off.
+        """
+        if self.adaptive_concurrency is None:
+            return None
+        with self._limiters_lock:
+            if provider_key not in self._limiters:
+                self._limiters[provider_key] = AdaptiveConcurrencyLimiter(
+                    **self.adaptive_concurrency
+                )
+            return self._limiters[provider_key]
+
+    def get_rate_limiter(self, provider_key: str, model_name: str):
+        """
+        Return the rate limiter for a model, or None if no rate limit applies.
+
+        A provider-wide entry in rate_limits gives each model its own budget.
+        """
+        model = f"{provider_key}:{model_name}"
+        config = self.rate_limits.get(model) or self.rate_limits.get(provider_key)
+        if config is None:
+            return None
+        with self._limiters_lock:
+            if model not in self._rate_limiters:
+                self._rate_limiters[model] = RateLimiter(**config)
+            return self._rate_limiters[model]
+
+    def get_circuit_breaker(self, provider_key: str, model_name: str):
+        """
+        Return the circuit breaker guarding a model, or None if circuit breaking is
+        off.
+        """
+        if self.circuit_breaker is None:
+            return None
+        key = (
+            f"{provider_key}:{model_name}" if self._breakers_per_model else provider_key
+        )
+        with self._limiters_lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(**self.circuit_breaker)
+            return self._breakers[key]
+
+    def circuit_stats(self) -> dict:
+        """
+        Return the state and recent failure and slow call rates of each circuit
+        breaker, keyed by provider (or "provider:model" when per model).
+        """
+        with self._limiters_lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.stats() for key, breaker in breakers.items()}
+
+    def concurrency_stats(self) -> dict:
+        """
+        Return the current limit, requests in flight and queue depth of each
+        provider's concurrency limiter.
+        """
+        with self._limiters_lock:
+            limiters = dict(self._limiters)
+        return {key: limiter.stats() for key, limiter in limiters.items()}
+
     @property
     def chat(self):
         """Return the chat API interface."""
@@ -111,39 +271,161 @@ class Completions:
 
         return response
 
+    def _prepare_tools(self, tools: any) -> Tools:
+        """Validate the tools argument and return it as a Tools instance."""
+        if isinstance(tools, Tools):
+            return tools
+
+        # Check if passed tools are callable
+        if not all(callable(tool) for tool in tools):
+            raise ValueError("One or more tools is not callable")
+        return Tools(tools)
+
+    def _cache_key(self, provider_key: str, model_name: str, messages: list, kwargs):
+        """Return the canonical hash identifying a request in the response cache."""
+        return stable_hash(
+            {
+                "provider": provider_key,
+                "model": model_name,
+                "messages": messages,
+                "kwargs": kwargs,
+            }
+        )
+
+    def _call_provider(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        use_cache: bool = True,
+        coalesce: bool = True,
+        **kwargs,
+    ):
+        """
+        Make a single chat completion call, answering from the client's response
+        cache when possible and sharing the call with identical requests in
+        flight when coalescing. Pass coalesce=False to make a call of its own, as a
+        hedge does so that it does not simply join the request it duplicates.
+        """
+        cache = self.client.cache if use_cache else None
+        single_flight = self.client.single_flight if coalesce else None
+        if cache is None and single_flight is None:
+            return self._send(provider_key, model_name, messages, **kwargs)
+
+        # The key is computed before the call since providers may modify messages.
+        key = self._cache_key(provider_key, model_name, messages, kwargs)
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+        def fetch():
+            response = self._send(provider_key, model_name, messages, **kwargs)
+            if cache is not None:
+                cache.set(key, response)
+            return response
+
+        if single_flight is None:
+            return fetch()
+        return single_flight.do(key, fetch)
+
+    def _send(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        stream: bool = False,
+        **kwargs,
+    ):
+        """Send a request, retrying transient failures under the client's policy."""
+        if self.client.retry is None:
+            return self._send_once(
+                provider_key, model_name, messages, stream=stream, **kwargs
+            )
+        return self.client.retry.call(
+            lambda: self._send_once(
+                provider_key, model_name, messages, stream=stream, **kwargs
+            )
+        )
+
+    def _send_once(
+        self,
+        provider_key: str,
+        model_name: str,
+        messages: list,
+        stream: bool = False,
+        **kwargs,
+    ):
+        """
+        Send a request to the provider, within its circuit breaker, rate and
+        concurrency limits if any.
+
+        With stream=True the stream is opened and its first chunk awaited within
+        the limits, and the pair is returned as by open_stream; the rest of the
+        stream is read outside them.
+        """
+        provider = self._get_provider(provider_key)
+        # A list of its own, so that a provider modifying it cannot affect retries
+        # or other requests sharing the caller's messages.
+        messages = list(messages)
+        breaker = self.client.get_circuit_breaker(provider_key, model_name)
+        if breaker is not None:
+            # Fail fast rather than wait for a rate limit or concurrency slot.
+            breaker.check()
+        rate_limiter = self.client.get_rate_limiter(provider_key, model_name)
+        if rate_limiter is not None:
+            reserved = rate_limiter.acquire(estimate_tokens(messages, kwargs))
+        limiter = self.client.get_limiter(provider_key)
+        try:
+            with limiter.slot() if limiter else contextlib.nullcontext():
+                with breaker.guard() if breaker else contextlib.nullcontext():
+                    if stream:
+                        response = open_stream(
+                            lambda: self._provider_stream(
+                                provider, model_name, messages, **kwargs
+                            )
+                        )
+                    else:
+                        response = provider.chat_completions_create(
+                            model_name, messages, **kwargs
+                        )
+        except Exception:
+            if rate_limiter is not None:
+                rate_limiter.release(reserved)
+            raise
+        if rate_limiter is not None:
+            rate_limiter.reconcile(reserved, getattr(response, "usage", None))
+        return response
+
     def _tool_runner(
         self,
-        provider,
+        provider_key: str,
         model_name: str,
         messages: list,
         tools: any,
         max_turns: int,
+        parallel_tools: bool = False,
+        tool_timeout: float = None,
         **kwargs,
     ):
         """
         Handle tool execution loop for max_turns iterations.
 
         Args:
-            provider: The provider instance to use for completions
+            provider_key: Key of the provider to use for completions
             model_name: Name of the model to use
             messages: List of conversation messages
             tools: Tools instance or list of callable tools
             max_turns: Maximum number of tool execution turns
+            parallel_tools: Execute the tool calls of a turn concurrently
+            tool_timeout: Seconds each tool call may run before it times out
             **kwargs: Additional arguments to pass to the provider
 
         Returns:
             The final response from the model with intermediate responses and messages
         """
-        # Handle tools validation and conversion
-        if isinstance(tools, Tools):
-            tools_instance = tools
-            kwargs["tools"] = tools_instance.tools()
-        else:
-            # Check if passed tools are callable
-            if not all(callable(tool) for tool in tools):
-                raise ValueError("One or more tools is not callable")
-            tools_instance = Tools(tools)
-            kwargs["tools"] = tools_instance.tools()
+        tools_instance = self._prepare_tools(tools)
+        kwargs["tools"] = tools_instance.tools()
 
         turns = 0
         intermediate_responses = []  # Store intermediate responses
@@ -151,7 +433,7 @@ class Completions:
 
         while turns < max_turns:
             # Make the API call
-            response = provider.chat_completions_create(model_name, messages, **kwargs)
+            response = self._call_provider(provider_key, model_name, messages, **kwargs)
             response = self._extract_thinking_content(response)
 
             # Store intermediate response
@@ -176,7 +458,9 @@ class Completions:
                 return response
 
             # Execute tools and get results
-            results, tool_messages = tools_instance.execute_tool(tool_calls)
+            results, tool_messages = tools_instance.execute_tool(
+                tool_calls, parallel=parallel_tools, timeout=tool_timeout
+            )
 
             # Add tool messages to intermediate messages
             intermediate_messages.extend(tool_messages)
@@ -193,11 +477,8 @@ class Completions:
         response.choices[0].intermediate_messages = intermediate_messages
         return response
 
-    def create(self, model: str, messages: list, **kwargs):
-        """
-        Create chat completion based on the model, messages, and any extra arguments.
-        Supports automatic tool execution when max_turns is specified.
-        """
+    def _parse_model(self, model: str) -> tuple[str, str]:
+        """Split a 'provider:model' string and validate the provider key."""
         # Check that correct format is used
         if ":" not in model:
             raise ValueError(
@@ -215,35 +496,280 @@ class Completions:
                 "Make sure the model string is formatted correctly as 'provider:model'."
             )
 
-        # Initialize provider if not already initialized
+        return provider_key, model_name
+
+    def _get_provider(self, provider_key: str, base_url: str = None):
+        """Return the provider instance for provider_key, initializing it if needed."""
+        # Initialize provider if not already initialized. Concurrent requests may
+        # get here at once, and each provider owns a connection pool, so only one
+        # of them creates it.
         if provider_key not in self.client.providers:
-            config = self.client.provider_configs.get(provider_key, {})
-            if kwargs.get("base_url"):
-                config["base_url"] = kwargs["base_url"]
-            self.client.providers[provider_key] = ProviderFactory.create_provider(
-                provider_key, config
-            )
+            with self.client._providers_lock:
+                if provider_key not in self.client.providers:
+                    config = self.client.provider_configs.get(provider_key, {})
+                    if base_url:
+                        config["base_url"] = base_url
+                    self.client.providers[provider_key] = (
+                        ProviderFactory.create_provider(provider_key, config)
+                    )
 
         provider = self.client.providers.get(provider_key)
         if not provider:
             raise ValueError(f"Could not load provider for '{provider_key}'.")
+        return provider
+
+    def _fallback_chain(self, model):
+        """Return the targets of a fallback chain, or None for a single model."""
+        if isinstance(model, (list, tuple)):
+            return list(model)
+        return self.client.fallbacks.get(model)
+
+    @staticmethod
+    def _should_fall_back(error: Exception) -> bool:
+        """Check whether a failed target should give way to the next one."""
+        if isinstance(error, (TimeoutError, CircuitOpenError)):
+            return True
+        return classify_error(error).retryable
+
+    def _create_with_fallbacks(
+        self, targets: list, messages: list, fallback_timeout: float = None, **kwargs
+    ):
+        """
+        Try each target in turn until one answers.
+
+        A target is abandoned for the next one when it fails with a transient
+        error, its circuit is open, or it does not answer within fallback_timeout
+        seconds. Other errors, and the error of the last target, are raised.
+        """
+        if kwargs.get("stream"):
+            raise ValueError("Fallback chains cannot be used with stream=True.")
+        if kwargs.get("max_turns") is not None:
+            raise ValueError(
+                "Fallback chains cannot be combined with max_turns, as tools could "
+                "run twice."
+            )
+        if not targets:
+            raise ValueError("A fallback chain needs at least one model.")
+
+        for index, target in enumerate(targets):
+            try:
+                response = call_with_timeout(
+                    lambda target=target: self.create(target, messages, **kwargs),
+                    fallback_timeout,
+                )
+            except Exception as e:
+                if index == len(targets) - 1 or not self._should_fall_back(e):
+                    raise
+                continue
+            if getattr(response, "served_by", None) is None:
+                response.served_by = target
+            return response
+
+    def _create_hedged(self, model: str, messages: list, hedge, **kwargs):
+        """
+        Create a completion, sending a duplicate request if the first is slow.
+
+        The duplicate goes to the same model, or to the model given as hedge. The
+        first to answer (or to produce a chunk, when streaming) wins.
+        """
+        if kwargs.get("max_turns") is not None:
+            raise ValueError(
+                "hedge cannot be combined with max_turns, as tools could run twice."
+            )
+        policy = self.client.hedging
+        alternate = hedge if isinstance(hedge, str) else model
+        stream = kwargs.get("stream", False)
+        policy.record_request()
+
+        def attempt(target, duplicate=False):
+            def call():
+                start = time.monotonic()
+                if stream:
+                    result = open_stream(
+                        lambda: self.create(
+                            target, messages, _coalesce=not duplicate, **kwargs
+                        )
+                    )
+                else:
+                    result = self.create(
+                        target, messages, _coalesce=not duplicate, **kwargs
+                    )
+                policy.record_latency(target, time.monotonic() - start)
+                return result
+
+            return call
+
+        delay = policy.hedge_delay(model)
+        if delay is None:
+            result, winner = attempt(model)(), 0
+        else:
+            result, winner = race(
+                attempt(model),
+                attempt(alternate, duplicate=True),
+                delay,
+                policy.acquire_hedge,
+                discard=(lambda opened: opened[1].close()) if stream else None,
+            )
+        if winner == 1:
+            policy.record_hedge_win()
+        if stream:
+            return continue_stream(*result)
+        if getattr(result, "served_by", None) is None:
+            result.served_by = (model, alternate)[winner]
+        return result
+
+    def _validate_stream_args(self, max_turns, tools):
+        """Reject argument combinations that cannot be streamed."""
+        if max_turns is not None and tools is not None:
+            raise ValueError(
+                "stream=True is not supported with automatic tool execution (max_turns)."
+            )
+
+    def _provider_stream(self, provider, model_name: str, messages: list, **kwargs):
+        """
+        Return an iterator of ChatCompletionChunk from the provider.
+
+        Providers that do not derive from Provider have no streaming method, so their
+        complete response is replayed as chunks.
+        """
+        if hasattr(provider, "chat_completions_create_stream"):
+            return provider.chat_completions_create_stream(
+                model_name, messages, **kwargs
+            )
+        return response_to_chunks(
+            provider.chat_completions_create(model_name, messages, **kwargs)
+        )
+
+    def create(self, model: str, messages: list, **kwargs):
+        """
+        Create chat completion based on the model, messages, and any extra arguments.
+        Supports automatic tool execution when max_turns is specified. Pass
+        parallel_tools=True to run the tool calls of each turn concurrently, and
+        tool_timeout to limit how long each tool call may run.
+
+        With stream=True an iterator of ChatCompletionChunk is returned instead of
+        a response. Chunks follow OpenAI's format for every provider, including
+        tool-call deltas, and the last chunk carries usage when the provider
+        reports it. A leading <think> block is moved to reasoning_content deltas
+        as it arrives. Opening the stream, up to its first chunk, is subject to
+        the circuit breaker, rate and concurrency limits and retry policy like
+        any other request.
+
+        When the client has a response cache, pass use_cache=False to bypass it for
+        this request. Streamed requests are never cached.
+
+        model may also be a list of 'provider:model' strings, or the name of a
+        fallback chain from the client config. Each model is tried in turn until one
+        answers, moving on after a transient error or after fallback_timeout
+        seconds; response.served_by records the model that answered.
+
+        Pass hedge=True to send a duplicate request when this one is slower than
+        usual, or hedge='provider:model' to send the duplicate to another model,
+        and use whichever answers first. The client's hedging policy sets the delay
+        and caps how many requests are duplicated.
+        """
+        fallback_timeout = kwargs.pop("fallback_timeout", None)
+        targets = self._fallback_chain(model)
+        if targets is not None:
+            return self._create_with_fallbacks(
+                targets, messages, fallback_timeout, **kwargs
+            )
+        hedge = kwargs.pop("hedge", None)
+        if hedge:
+            return self._create_hedged(model, messages, hedge, **kwargs)
+
+        provider_key, model_name = self._parse_model(model)
+        provider = self._get_provider(provider_key, kwargs.get("base_url"))
 
         # Extract tool-related parameters
         max_turns = kwargs.pop("max_turns", None)
+        parallel_tools = kwargs.pop("parallel_tools", False)
+        tool_timeout = kwargs.pop("tool_timeout", None)
         tools = kwargs.get("tools", None)
+        stream = kwargs.pop("stream", False)
+        use_cache = kwargs.pop("use_cache", True)
+        coalesce = kwargs.pop("_coalesce", True)
         kwargs.pop("base_url", None)
 
+        if stream:
+            self._validate_stream_args(max_turns, tools)
+            return split_thinking(
+                continue_stream(
+                    *self._send(
+                        provider_key, model_name, messages, stream=True, **kwargs
+                    )
+                )
+            )
+
         # Check environment variable before allowing multi-turn tool execution
         if max_turns is not None and tools is not None:
             return self._tool_runner(
-                provider,
+                provider_key,
                 model_name,
                 messages.copy(),
                 tools,
                 max_turns,
+                parallel_tools=parallel_tools,
+                tool_timeout=tool_timeout,
+                use_cache=use_cache,
             )
 
         # Default behavior without tool execution
         # Delegate the chat completion to the correct provider's implementation
-        response = provider.chat_completions_create(model_name, messages, **kwargs)
+        response = self._call_provider(
+            provider_key,
+            model_name,
+            messages,
+            use_cache=use_cache,
+            coalesce=coalesce,
+            **kwargs,
+        )
         return self._extract_thinking_content(response)
+
+    def create_many(
+        self,
+        models: list,
+        messages: list,
+        timeout: float = None,
+        max_concurrency: int = None,
+        **kwargs,
+    ) -> list:
+        """
+        Send the same conversation to several models concurrently.
+
+        Args:
+            models: List of 'provider:model' strings.
+            messages: The conversation sent to every model.
+            timeout: Seconds to wait for each model, counted from when its request
+                is dispatched. A model that does not answer in time gets a
+                TimeoutError as its result.
+            max_concurrency: Maximum number of requests in flight at once.
+                Defaults to one per model. A request that timed out keeps its slot
+                until the provider call actually returns, since blocking calls
+                cannot be interrupted.
+            **kwargs: Additional arguments passed to every create() call.
+
+        Returns:
+            A list with one entry per model, in the order of models. Each entry is
+            either the response or the exception raised for that model.
+        """
+        if not models:
+            return []
+        slots = threading.Semaphore(max_concurrency or len(models))
+
+        def run(model):
+            slots.acquire()
+
+            def call():
+                try:
+                    return self.create(model, messages, **kwargs)
+                finally:
+                    slots.release()
+
+            try:
+                return call_with_timeout(call, timeout)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(models)) as pool:
+            return list(pool.map(run, models))
@@ -1,3 +1,4 @@
 from .provider_interface import ProviderInterface
 from .chat_completion_response import ChatCompletionResponse
+from .chat_completion_chunk import ChatCompletionChunk
 from .message import Message
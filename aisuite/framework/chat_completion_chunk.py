@@ -0,0 +1,57 @@
+"""Defines the ChatCompletionChunk model returned when streaming."""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from aisuite.framework.message import CompletionUsage, ResponseMetrics
+
+
+class ChoiceDeltaFunctionCall(BaseModel):
+    """A fragment of a function call. Arguments arrive as partial JSON strings."""
+
+    name: Optional[str] = None
+    arguments: Optional[str] = None
+
+
+class ChoiceDeltaToolCall(BaseModel):
+    """A fragment of a tool call, identified across chunks by its index."""
+
+    index: int
+    id: Optional[str] = None
+    type: Optional[Literal["function"]] = None
+    function: Optional[ChoiceDeltaFunctionCall] = None
+
+
+class ChoiceDelta(BaseModel):
+    """The part of the assistant message carried by a single chunk."""
+
+    role: Optional[Literal["user", "assistant", "system", "tool"]] = None
+    content: Optional[str] = None
+    reasoning_content: Optional[str] = None
+    tool_calls: Optional[List[ChoiceDeltaToolCall]] = None
+
+
+class ChunkChoice(BaseModel):
+    """A choice within a streamed chunk."""
+
+    index: int = 0
+    delta: ChoiceDelta = Field(default_factory=ChoiceDelta)
+    finish_reason: Optional[str] = None
+
+
+class ChatCompletionChunk(BaseModel):
+    """
+    Used to conform to the streaming response model of OpenAI.
+
+    The last chunk of a stream may have no choices and carry only usage and
+    metrics.
+    """
+
+    id: Optional[str] = None
+    object: Literal["chat.completion.chunk"] = "chat.completion.chunk"
+    created: Optional[int] = None
+    model: Optional[str] = None
+    choices: List[ChunkChoice] = Field(default_factory=list)
+    usage: Optional[CompletionUsage] = None
+    metrics: Optional[ResponseMetrics] = None
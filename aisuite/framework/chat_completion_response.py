@@ -3,7 +3,7 @@
 from typing import Optional
 
 from aisuite.framework.choice import Choice
-from aisuite.framework.message import CompletionUsage
+from aisuite.framework.message import CompletionUsage, ResponseMetrics
 
 
 # pylint: disable=too-few-public-methods
@@ -14,3 +14,6 @@ class ChatCompletionResponse:
         """Initializes the ChatCompletionResponse."""
         self.choices = [Choice()]  # Adjust the range as needed for more choices
         self.usage: Optional[CompletionUsage] = None
+        self.metrics: Optional[ResponseMetrics] = None
+        # "provider:model" that answered, set for fallback chains and hedged requests.
+        self.served_by: Optional[str] = None
@@ -68,6 +68,9 @@ class PromptTokensDetails(BaseModel):
     cached_tokens: Optional[int] = None
     """Cached tokens present in the prompt."""
 
+    cache_creation_tokens: Optional[int] = None
+    """Prompt tokens written to the provider's prompt cache."""
+
 
 class CompletionUsage(BaseModel):
     """Represents the token usage for a completion."""
@@ -86,3 +89,25 @@ class CompletionUsage(BaseModel):
 
     prompt_tokens_details: Optional[PromptTokensDetails] = None
     """Breakdown of tokens used in the prompt."""
+
+
+class ResponseMetrics(BaseModel):
+    """Provider-reported performance metrics for a completion."""
+
+    latency_ms: Optional[int] = None
+    """Time the provider spent serving the request, in milliseconds."""
+
+    load_duration_ms: Optional[float] = None
+    """Time spent loading the model before serving the request, in milliseconds."""
+
+    prompt_eval_duration_ms: Optional[float] = None
+    """Time spent processing the prompt, in milliseconds."""
+
+    eval_duration_ms: Optional[float] = None
+    """Time spent generating the completion, in milliseconds."""
+
+    prompt_tokens_per_second: Optional[float] = None
+    """Prompt processing throughput."""
+
+    completion_tokens_per_second: Optional[float] = None
+    """Generation (decode) throughput."""
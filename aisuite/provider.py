@@ -1,15 +1,173 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+import asyncio
+import email.utils
 import importlib
 import os
 import functools
+import time
+
+from aisuite.utils.concurrency import get_status_code
+from aisuite.utils.streaming import response_to_chunks
 
 
 class LLMError(Exception):
-    """Custom exception for LLM errors."""
+    """Custom exception for LLM errors.
+
+    status_code holds the HTTP status of the failed request when the provider
+    reports one, so callers can decide whether to retry without parsing the message.
+    retry_after holds the seconds the provider asked to wait before retrying.
+
+    Providers raise the subclasses below so failures can be handled the same way
+    for every provider; classify_error maps errors that were raised as a plain
+    LLMError or as another exception.
+    """
 
-    def __init__(self, message):
+    retryable = False
+
+    def __init__(self, message, status_code=None, retry_after=None):
         super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class RateLimitError(LLMError):
+    """The provider rejected the request because a rate limit or quota was hit."""
+
+    retryable = True
+
+
+class OverloadedError(LLMError):
+    """The provider is overloaded or failed with a transient server error."""
+
+    retryable = True
+
+
+class ProviderTimeoutError(LLMError):
+    """The request timed out before the provider answered."""
+
+    retryable = True
+
+
+class ProviderConnectionError(LLMError):
+    """The provider could not be reached."""
+
+    retryable = True
+
+
+class NonRetryableError(LLMError):
+    """The request failed in a way that retrying will not fix, e.g. a bad request."""
+
+
+class CircuitOpenError(LLMError):
+    """
+    The request was refused without being sent because the circuit breaker of its
+    provider is open. retry_after holds the seconds until it probes again.
+    """
+
+
+_STATUS_ERROR_CLASSES = {
+    408: ProviderTimeoutError,
+    429: RateLimitError,
+    500: OverloadedError,
+    502: OverloadedError,
+    503: OverloadedError,
+    504: ProviderTimeoutError,
+    529: OverloadedError,
+}
+
+_CLASSIFIED_ERRORS = (
+    RateLimitError,
+    OverloadedError,
+    ProviderTimeoutError,
+    ProviderConnectionError,
+    NonRetryableError,
+    CircuitOpenError,
+)
+
+
+def classify_error(error: BaseException, message: str = None) -> LLMError:
+    """
+    Map any error raised while calling a provider into the LLMError taxonomy.
+
+    The error and the errors it was raised from are inspected, so SDK and httpx
+    errors wrapped in a plain LLMError are classified too. An HTTP status decides
+    first; without one, timeout and connection errors are recognized by type, which
+    covers httpx, the vendor SDKs and the builtin exceptions. Anything else is
+    non-retryable. An error that is already classified is returned unchanged unless
+    a message is given.
+    """
+    if isinstance(error, _CLASSIFIED_ERRORS) and message is None:
+        return error
+
+    status_code = get_status_code(error)
+    error_class = _STATUS_ERROR_CLASSES.get(status_code)
+    if error_class is None:
+        error_class = _error_class_from_type(error)
+    if error_class is None:
+        error_class = NonRetryableError
+    return error_class(
+        message or str(error),
+        status_code=status_code,
+        retry_after=get_retry_after(error),
+    )
+
+
+def _error_class_from_type(error):
+    for cause in _error_chain(error):
+        if isinstance(cause, _CLASSIFIED_ERRORS):
+            return type(cause)
+        names = [cls.__name__ for cls in type(cause).__mro__]
+        if isinstance(cause, TimeoutError) or any("Timeout" in n for n in names):
+            return ProviderTimeoutError
+        if isinstance(cause, ConnectionError) or any(
+            "Connect" in n or n == "NetworkError" for n in names
+        ):
+            return ProviderConnectionError
+    return None
+
+
+def get_retry_after(error: BaseException):
+    """
+    Return the seconds to wait before retrying, as requested by the provider.
+
+    Reads an LLMError's retry_after, or the retry-after-ms and Retry-After headers
+    (delay in seconds or an HTTP date) of the response an error carries.
+    """
+    for cause in _error_chain(error):
+        retry_after = getattr(cause, "retry_after", None)
+        if retry_after is not None:
+            return retry_after
+        headers = getattr(getattr(cause, "response", None), "headers", None)
+        if not headers:
+            continue
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return max(0.0, float(retry_after_ms) / 1000)
+            except ValueError:
+                pass
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                continue
+            return max(0.0, retry_at.timestamp() - time.time())
+    return None
+
+
+def _error_chain(error):
+    """Yield error and the errors it was raised from."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
 
 
 class Provider(ABC):
@@ -18,11 +176,49 @@ class Provider(ABC):
         """Abstract method for chat completion calls, to be implemented by each provider."""
         pass
 
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Async chat completion call.
+
+        Providers with a native async client should override this. The default
+        runs the synchronous call in a worker thread so every provider can be
+        awaited.
+        """
+        return await asyncio.to_thread(
+            self.chat_completions_create, model, messages, **kwargs
+        )
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streaming chat completion call, yielding ChatCompletionChunk objects.
+
+        Providers with native streaming should override this. The default makes a
+        regular call and replays the complete response as chunks.
+        """
+        yield from response_to_chunks(
+            self.chat_completions_create(model, messages, **kwargs)
+        )
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Async streaming chat completion call, yielding ChatCompletionChunk objects.
+
+        The default iterates chat_completions_create_stream in a worker thread.
+        """
+        chunks = self.chat_completions_create_stream(model, messages, **kwargs)
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, done)
+            if chunk is done:
+                return
+            yield chunk
+
 
 provider_class_map = {
     "GooglegenaiProvider": "GoogleGenaiProvider",
 }
 
+
 class ProviderFactory:
     """Factory to dynamically load provider instances based on naming conventions."""
 
@@ -35,7 +231,9 @@ class ProviderFactory:
         provider_class_name = f"{provider_key.capitalize()}Provider"
         provider_module_name = f"{provider_key}_provider"
         # Translate any anomalies provider class names
-        provider_class_name = provider_class_map.get(provider_class_name, provider_class_name)
+        provider_class_name = provider_class_map.get(
+            provider_class_name, provider_class_name
+        )
 
         module_path = f"aisuite.providers.{provider_module_name}"
 
@@ -4,8 +4,22 @@
 
 import anthropic
 import json
-from aisuite.provider import Provider
+from aisuite.provider import (
+    NonRetryableError,
+    OverloadedError,
+    Provider,
+    RateLimitError,
+    classify_error,
+)
 from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChoiceDeltaFunctionCall,
+    ChoiceDeltaToolCall,
+    ChunkChoice,
+)
+from aisuite.utils.cache import ConversionCache
 from aisuite.framework.message import (
     Message,
     ChatCompletionMessageToolCall,
@@ -34,10 +48,31 @@ class AnthropicMessageConverter:
 
     def convert_request(self, messages):
         """Convert framework messages to Anthropic format."""
-        system_message = self._extract_system_message(messages)
-        converted_messages = [self._convert_single_message(msg) for msg in messages]
+        system_message, messages = self._extract_system_message(messages)
+        converted_messages = []
+        for msg in messages:
+            converted = self._convert_single_message(msg)
+            if self._is_tool_result_message(converted) and (
+                converted_messages
+                and self._is_tool_result_message(converted_messages[-1])
+            ):
+                # Anthropic expects the results of all tool_use blocks of a turn
+                # in a single user message.
+                converted_messages[-1]["content"].extend(converted["content"])
+            else:
+                converted_messages.append(converted)
         return system_message, converted_messages
 
+    def _is_tool_result_message(self, msg):
+        """Check whether a converted message only carries tool results."""
+        content = msg.get("content")
+        return (
+            msg.get("role") == self.ROLE_USER
+            and isinstance(content, list)
+            and bool(content)
+            and all(block.get("type") == "tool_result" for block in content)
+        )
+
     def convert_response(self, response):
         """Normalize the response from the Anthropic API to match OpenAI's response format."""
         normalized_response = ChatCompletionResponse()
@@ -46,6 +81,17 @@ class AnthropicMessageConverter:
         normalized_response.choices[0].message = self._get_message(response)
         return normalized_response
 
+    def convert_stream(self, events):
+        """
+        Convert Anthropic stream events to ChatCompletionChunk objects.
+
+        Accepts the event objects of a messages.create(stream=True) call or their
+        dict form, e.g. recorded SSE payloads. See AnthropicStreamConverter.
+        """
+        stream_converter = AnthropicStreamConverter(self.FINISH_REASON_MAPPING)
+        for event in events:
+            yield from stream_converter.convert_event(event)
+
     def _convert_single_message(self, msg):
         """Convert a single message to Anthropic format."""
         if isinstance(msg, dict):
@@ -113,15 +159,17 @@ class AnthropicMessageConverter:
         return {"role": self.ROLE_ASSISTANT, "content": message_content}
 
     def _extract_system_message(self, messages):
-        """Extract system message if present, otherwise return empty list."""
+        """
+        Split off the system message if present, otherwise use an empty list.
+        Returns the system message and the remaining messages; the caller's list is
+        left unchanged so the same request can be sent again.
+        """
         # TODO: This is a temporary solution to extract the system message.
         # User can pass multiple system messages, which can mingled with other messages.
         # This needs to be fixed to handle this case.
         if messages and messages[0]["role"] == "system":
-            system_message = messages[0]["content"]
-            messages.pop(0)
-            return system_message
-        return []
+            return messages[0]["content"], messages[1:]
+        return [], messages
 
     def _get_finish_reason(self, response):
         """Get the normalized finish reason."""
@@ -134,7 +182,10 @@ class AnthropicMessageConverter:
             prompt_tokens=response.usage.input_tokens,
             total_tokens=response.usage.input_tokens + response.usage.output_tokens,
             prompt_tokens_details=PromptTokensDetails(
-                cached_tokens=response.usage.cache_read_input_tokens,
+                cached_tokens=getattr(response.usage, "cache_read_input_tokens", None),
+                cache_creation_tokens=getattr(
+                    response.usage, "cache_creation_input_tokens", None
+                ),
             ),
         )
 
@@ -154,18 +205,19 @@ class AnthropicMessageConverter:
 
     def convert_response_with_tool_use(self, response):
         """Convert Anthropic tool use response to the framework's format."""
-        tool_call = next(
-            (content for content in response.content if content.type == "tool_use"),
-            None,
-        )
-
-        if tool_call:
-            function = Function(
-                name=tool_call.name, arguments=json.dumps(tool_call.input)
-            )
-            tool_call_obj = ChatCompletionMessageToolCall(
-                id=tool_call.id, function=function, type="function"
+        tool_calls = [
+            ChatCompletionMessageToolCall(
+                id=content.id,
+                function=Function(
+                    name=content.name, arguments=json.dumps(content.input)
+                ),
+                type="function",
             )
+            for content in response.content
+            if content.type == "tool_use"
+        ]
+
+        if tool_calls:
             text_content = next(
                 (
                     content.text
@@ -177,7 +229,7 @@ class AnthropicMessageConverter:
 
             return Message(
                 content=text_content or None,
-                tool_calls=[tool_call_obj] if tool_call else None,
+                tool_calls=tool_calls,
                 role="assistant",
                 refusal=None,
             )
@@ -206,28 +258,219 @@ class AnthropicMessageConverter:
         return anthropic_tools
 
 
+class AnthropicStreamConverter:
+    """
+    Converts the events of one Anthropic stream to ChatCompletionChunk objects.
+
+    Text and thinking deltas become content and reasoning_content deltas. Each
+    tool_use block becomes an indexed tool call whose input_json_delta fragments
+    arrive as argument fragments. Usage, including prompt cache reads and writes,
+    is reported in a final chunk once the message stops.
+    """
+
+    # Error event types that are worth retrying; other errors are not.
+    STREAM_ERROR_CLASSES = {
+        "rate_limit_error": RateLimitError,
+        "overloaded_error": OverloadedError,
+        "api_error": OverloadedError,
+    }
+
+    def __init__(self, finish_reason_mapping):
+        self.finish_reason_mapping = finish_reason_mapping
+        self.message_id = None
+        self.model = None
+        self.input_usage = {}
+        self.output_tokens = None
+        # Anthropic content block index -> OpenAI tool call index
+        self.tool_indexes = {}
+
+    def convert_event(self, event):
+        """Yield the chunks for a single stream event."""
+        if hasattr(event, "model_dump"):
+            event = event.model_dump()
+        event_type = event.get("type")
+
+        if event_type == "message_start":
+            message = event["message"]
+            self.message_id = message.get("id")
+            self.model = message.get("model")
+            self.input_usage = message.get("usage") or {}
+            yield self._chunk(ChoiceDelta(role="assistant"))
+
+        elif event_type == "content_block_start":
+            block = event["content_block"]
+            if block.get("type") == "tool_use":
+                yield self._chunk(
+                    self._tool_call_delta(
+                        event["index"], id=block["id"], name=block["name"]
+                    )
+                )
+            elif block.get("type") == "text" and block.get("text"):
+                yield self._chunk(ChoiceDelta(content=block["text"]))
+
+        elif event_type == "content_block_delta":
+            delta = event["delta"]
+            if delta["type"] == "text_delta":
+                yield self._chunk(ChoiceDelta(content=delta["text"]))
+            elif delta["type"] == "input_json_delta":
+                yield self._chunk(
+                    self._tool_call_delta(
+                        event["index"], arguments=delta["partial_json"]
+                    )
+                )
+            elif delta["type"] == "thinking_delta":
+                yield self._chunk(ChoiceDelta(reasoning_content=delta["thinking"]))
+
+        elif event_type == "message_delta":
+            self.output_tokens = (event.get("usage") or {}).get("output_tokens")
+            stop_reason = event["delta"].get("stop_reason")
+            if stop_reason:
+                yield self._chunk(
+                    finish_reason=self.finish_reason_mapping.get(stop_reason, "stop")
+                )
+
+        elif event_type == "message_stop":
+            yield self._chunk(usage=self._get_usage())
+
+        elif event_type == "error":
+            error = event.get("error") or {}
+            error_class = self.STREAM_ERROR_CLASSES.get(
+                error.get("type"), NonRetryableError
+            )
+            raise error_class(
+                f"Anthropic stream error ({error.get('type')}): {error.get('message')}"
+            )
+
+    def _chunk(self, delta=None, finish_reason=None, usage=None):
+        choices = []
+        if delta is not None or finish_reason is not None:
+            choices = [
+                ChunkChoice(delta=delta or ChoiceDelta(), finish_reason=finish_reason)
+            ]
+        return ChatCompletionChunk(
+            id=self.message_id, model=self.model, choices=choices, usage=usage
+        )
+
+    def _tool_call_delta(self, block_index, id=None, name=None, arguments=""):
+        """Create a delta carrying one fragment of the tool call in a content block."""
+        index = self.tool_indexes.setdefault(block_index, len(self.tool_indexes))
+        return ChoiceDelta(
+            tool_calls=[
+                ChoiceDeltaToolCall(
+                    index=index,
+                    id=id,
+                    type="function" if id else None,
+                    function=ChoiceDeltaFunctionCall(name=name, arguments=arguments),
+                )
+            ]
+        )
+
+    def _get_usage(self):
+        """Get the usage statistics reported over the stream."""
+        prompt_tokens = self.input_usage.get("input_tokens") or 0
+        completion_tokens = (
+            self.output_tokens or self.input_usage.get("output_tokens") or 0
+        )
+        return CompletionUsage(
+            completion_tokens=completion_tokens,
+            prompt_tokens=prompt_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            prompt_tokens_details=PromptTokensDetails(
+                cached_tokens=self.input_usage.get("cache_read_input_tokens"),
+                cache_creation_tokens=self.input_usage.get(
+                    "cache_creation_input_tokens"
+                ),
+            ),
+        )
+
+
 class AnthropicProvider(Provider):
     def __init__(self, **config):
         """Initialize the Anthropic provider with the given configuration."""
         self.client = anthropic.Anthropic(**config)
+        self.async_client = anthropic.AsyncAnthropic(**config)
         self.converter = AnthropicMessageConverter()
+        self.tool_spec_cache = ConversionCache()
 
     def chat_completions_create(self, model, messages, **kwargs):
         """Create a chat completion using the Anthropic API."""
         kwargs = self._prepare_kwargs(kwargs)
         system_message, converted_messages = self.converter.convert_request(messages)
 
-        response = self.client.messages.create(
-            model=model, system=system_message, messages=converted_messages, **kwargs
-        )
+        try:
+            response = self.client.messages.create(
+                model=model,
+                system=system_message,
+                messages=converted_messages,
+                **kwargs,
+            )
+        except anthropic.APIError as e:
+            raise classify_error(e, f"Anthropic request failed: {e}") from e
+        return self.converter.convert_response(response)
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """Create a chat completion using the async Anthropic client."""
+        kwargs = self._prepare_kwargs(kwargs)
+        system_message, converted_messages = self.converter.convert_request(messages)
+
+        try:
+            response = await self.async_client.messages.create(
+                model=model,
+                system=system_message,
+                messages=converted_messages,
+                **kwargs,
+            )
+        except anthropic.APIError as e:
+            raise classify_error(e, f"Anthropic request failed: {e}") from e
         return self.converter.convert_response(response)
 
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """Stream a chat completion using the Anthropic API."""
+        kwargs = self._prepare_kwargs(kwargs)
+        system_message, converted_messages = self.converter.convert_request(messages)
+
+        try:
+            events = self.client.messages.create(
+                model=model,
+                system=system_message,
+                messages=converted_messages,
+                stream=True,
+                **kwargs,
+            )
+            yield from self.converter.convert_stream(events)
+        except anthropic.APIError as e:
+            raise classify_error(e, f"Anthropic request failed: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """Stream a chat completion using the async Anthropic client."""
+        kwargs = self._prepare_kwargs(kwargs)
+        system_message, converted_messages = self.converter.convert_request(messages)
+
+        stream_converter = AnthropicStreamConverter(
+            self.converter.FINISH_REASON_MAPPING
+        )
+        try:
+            events = await self.async_client.messages.create(
+                model=model,
+                system=system_message,
+                messages=converted_messages,
+                stream=True,
+                **kwargs,
+            )
+            async for event in events:
+                for chunk in stream_converter.convert_event(event):
+                    yield chunk
+        except anthropic.APIError as e:
+            raise classify_error(e, f"Anthropic request failed: {e}") from e
+
     def _prepare_kwargs(self, kwargs):
         """Prepare kwargs for the API call."""
         kwargs = kwargs.copy()
         kwargs.setdefault("max_tokens", DEFAULT_MAX_TOKENS)
 
         if "tools" in kwargs:
-            kwargs["tools"] = self.converter.convert_tool_spec(kwargs["tools"])
+            kwargs["tools"] = self.tool_spec_cache.get_or_convert(
+                kwargs["tools"], self.converter.convert_tool_spec
+            )
 
         return kwargs
@@ -7,9 +7,26 @@ from typing import List, Dict, Any, Tuple, Optional
 import boto3
 import botocore
 
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import (
+    LLMError,
+    NonRetryableError,
+    OverloadedError,
+    Provider,
+    ProviderTimeoutError,
+    RateLimitError,
+    classify_error,
+)
 from aisuite.framework import ChatCompletionResponse
-from aisuite.framework.message import Message, CompletionUsage
+from aisuite.framework.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChoiceDeltaFunctionCall,
+    ChoiceDeltaToolCall,
+    ChunkChoice,
+)
+from aisuite.framework.message import Message, CompletionUsage, ResponseMetrics
+from aisuite.utils.cache import ConversionCache
+from aisuite.utils.streaming import generate_chunk_id
 
 
 # pylint: disable=too-few-public-methods
@@ -35,6 +52,38 @@ class BedrockConfig:
 class BedrockMessageConverter:
     """Converts messages between OpenAI and AWS Bedrock formats."""
 
+    # Bedrock stopReason values mapped to OpenAI finish_reason values.
+    STOP_REASONS = {
+        "end_turn": "stop",
+        "stop_sequence": "stop",
+        "complete": "stop",
+        "max_tokens": "length",
+        "tool_use": "tool_calls",
+        "content_filtered": "content_filter",
+        "guardrail_intervened": "content_filter",
+    }
+
+    # Bedrock error codes worth retrying; other errors are not.
+    ERROR_CLASSES = {
+        "ThrottlingException": RateLimitError,
+        "ServiceUnavailableException": OverloadedError,
+        "InternalServerException": OverloadedError,
+        "ModelNotReadyException": OverloadedError,
+        "ModelTimeoutException": ProviderTimeoutError,
+    }
+
+    @staticmethod
+    def to_llm_error(code: str, message: str, status_code: int = None) -> LLMError:
+        """
+        Map a Bedrock error code to the LLMError taxonomy.
+
+        Codes from stream events are camel-cased (throttlingException) and are
+        matched like their API counterparts.
+        """
+        code = code[:1].upper() + code[1:] if code else ""
+        error_class = BedrockMessageConverter.ERROR_CLASSES.get(code, NonRetryableError)
+        return error_class(f"{code}: {message}", status_code=status_code)
+
     @staticmethod
     def convert_request(
         messages: List[Dict[str, Any]],
@@ -195,9 +244,122 @@ class BedrockMessageConverter:
             norm_response.usage = BedrockMessageConverter.get_completion_usage(
                 usage_data
             )
+        norm_response.metrics = BedrockMessageConverter.get_response_metrics(
+            response.get("metrics")
+        )
 
         return norm_response
 
+    @staticmethod
+    def convert_stream(events, model: Optional[str] = None):
+        """
+        Convert the events of a converse_stream response to ChatCompletionChunk objects.
+
+        Text deltas become content deltas and reasoning deltas become
+        reasoning_content deltas. Each toolUse content block becomes a tool call
+        with its own index, whose arguments arrive as partial JSON strings.
+        Usage and latency come from the closing metadata event.
+        """
+        chunk_id = generate_chunk_id()
+        # Bedrock content block index -> OpenAI tool call index
+        tool_indexes = {}
+
+        def chunk(delta=None, finish_reason=None, **fields):
+            choices = []
+            if delta is not None or finish_reason is not None:
+                choices = [
+                    ChunkChoice(
+                        delta=delta or ChoiceDelta(), finish_reason=finish_reason
+                    )
+                ]
+            return ChatCompletionChunk(
+                id=chunk_id, model=model, choices=choices, **fields
+            )
+
+        for event in events:
+            if "messageStart" in event:
+                yield chunk(ChoiceDelta(role=event["messageStart"].get("role")))
+
+            elif "contentBlockStart" in event:
+                block = event["contentBlockStart"]
+                tool_use = block.get("start", {}).get("toolUse")
+                if tool_use is None:
+                    continue
+                index = tool_indexes.setdefault(
+                    block.get("contentBlockIndex"), len(tool_indexes)
+                )
+                yield chunk(
+                    ChoiceDelta(
+                        tool_calls=[
+                            ChoiceDeltaToolCall(
+                                index=index,
+                                id=tool_use["toolUseId"],
+                                type="function",
+                                function=ChoiceDeltaFunctionCall(
+                                    name=tool_use["name"], arguments=""
+                                ),
+                            )
+                        ]
+                    )
+                )
+
+            elif "contentBlockDelta" in event:
+                block = event["contentBlockDelta"]
+                delta = block.get("delta", {})
+                if "text" in delta:
+                    yield chunk(ChoiceDelta(content=delta["text"]))
+                elif "toolUse" in delta:
+                    index = tool_indexes.setdefault(
+                        block.get("contentBlockIndex"), len(tool_indexes)
+                    )
+                    yield chunk(
+                        ChoiceDelta(
+                            tool_calls=[
+                                ChoiceDeltaToolCall(
+                                    index=index,
+                                    function=ChoiceDeltaFunctionCall(
+                                        arguments=delta["toolUse"].get("input", "")
+                                    ),
+                                )
+                            ]
+                        )
+                    )
+                elif "reasoningContent" in delta:
+                    text = delta["reasoningContent"].get("text")
+                    if text:
+                        yield chunk(ChoiceDelta(reasoning_content=text))
+
+            elif "messageStop" in event:
+                stop_reason = event["messageStop"].get("stopReason")
+                yield chunk(
+                    finish_reason=BedrockMessageConverter.STOP_REASONS.get(
+                        stop_reason, stop_reason
+                    )
+                )
+
+            elif "metadata" in event:
+                metadata = event["metadata"]
+                usage = metadata.get("usage")
+                yield chunk(
+                    usage=(
+                        BedrockMessageConverter.get_completion_usage(usage)
+                        if usage
+                        else None
+                    ),
+                    metrics=BedrockMessageConverter.get_response_metrics(
+                        metadata.get("metrics")
+                    ),
+                )
+
+            else:
+                # Errors raised mid-stream arrive as events such as
+                # {"throttlingException": {"message": ...}}.
+                for key, value in event.items():
+                    if key.endswith("Exception"):
+                        raise BedrockMessageConverter.to_llm_error(
+                            key, value.get("message", value)
+                        )
+
     @staticmethod
     def get_completion_usage(usage_data: dict):
         """Get the usage statistics from a usage data dictionary."""
@@ -207,6 +369,13 @@ class BedrockMessageConverter:
             total_tokens=usage_data.get("totalTokens"),
         )
 
+    @staticmethod
+    def get_response_metrics(metrics_data: Optional[dict]):
+        """Get the response metrics from a Bedrock metrics dictionary."""
+        if not metrics_data:
+            return None
+        return ResponseMetrics(latency_ms=metrics_data.get("latencyMs"))
+
 
 class AwsProvider(Provider):
     """Provider for AWS Bedrock."""
@@ -216,6 +385,7 @@ class AwsProvider(Provider):
         self.config = BedrockConfig(**config)
         self.client = self.config.create_client()
         self.transformer = BedrockMessageConverter()
+        self.tool_spec_cache = ConversionCache()
 
     def convert_response(self, response: Dict[str, Any]) -> ChatCompletionResponse:
         """Normalize the response from the Bedrock API to match OpenAI's response format."""
@@ -226,19 +396,21 @@ class AwsProvider(Provider):
         if "tools" not in kwargs:
             return None
 
-        tool_config = {
-            "tools": [
-                {
-                    "toolSpec": {
-                        "name": tool["function"]["name"],
-                        "description": tool["function"].get("description", " "),
-                        "inputSchema": {"json": tool["function"]["parameters"]},
+        def convert(tools):
+            return {
+                "tools": [
+                    {
+                        "toolSpec": {
+                            "name": tool["function"]["name"],
+                            "description": tool["function"].get("description", " "),
+                            "inputSchema": {"json": tool["function"]["parameters"]},
+                        }
                     }
-                }
-                for tool in kwargs["tools"]
-            ]
-        }
-        return tool_config
+                    for tool in tools
+                ]
+            }
+
+        return self.tool_spec_cache.get_or_convert(kwargs["tools"], convert)
 
     def _prepare_request_config(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare the configuration for the Bedrock API request."""
@@ -268,24 +440,47 @@ class AwsProvider(Provider):
 
         return request_config
 
-    def chat_completions_create(
-        self, model: str, messages: List[Dict[str, Any]], **kwargs
-    ) -> ChatCompletionResponse:
-        """Create a chat completion request to AWS Bedrock."""
+    def _converse(self, operation, model: str, messages, kwargs) -> Dict[str, Any]:
+        """Call a Converse API operation (converse or converse_stream)."""
         system_message, formatted_messages = self.transformer.convert_request(messages)
         request_config = self._prepare_request_config(kwargs)
 
         try:
-            response = self.client.converse(
+            return operation(
                 modelId=model,
                 messages=formatted_messages,
                 system=system_message,
                 **request_config,
             )
         except botocore.exceptions.ClientError as e:
-            if e.response["Error"]["Code"] == "ValidationException":
-                error_message = e.response["Error"]["Message"]
-                raise LLMError(error_message) from e
-            raise
+            raise self._client_error_to_llm_error(e) from e
+        except botocore.exceptions.BotoCoreError as e:
+            raise classify_error(e, f"Bedrock request failed: {e}") from e
+
+    def _client_error_to_llm_error(self, error):
+        """Map a botocore ClientError to the LLMError taxonomy."""
+        error_info = error.response.get("Error", {})
+        return self.transformer.to_llm_error(
+            error_info.get("Code"),
+            error_info.get("Message", str(error)),
+            status_code=error.response.get("ResponseMetadata", {}).get(
+                "HTTPStatusCode"
+            ),
+        )
 
+    def chat_completions_create(
+        self, model: str, messages: List[Dict[str, Any]], **kwargs
+    ) -> ChatCompletionResponse:
+        """Create a chat completion request to AWS Bedrock."""
+        response = self._converse(self.client.converse, model, messages, kwargs)
         return self.convert_response(response)
+
+    def chat_completions_create_stream(
+        self, model: str, messages: List[Dict[str, Any]], **kwargs
+    ):
+        """Stream a chat completion from AWS Bedrock using converse_stream."""
+        response = self._converse(self.client.converse_stream, model, messages, kwargs)
+        try:
+            yield from self.transformer.convert_stream(response["stream"], model=model)
+        except botocore.exceptions.EventStreamError as e:
+            raise self._client_error_to_llm_error(e) from e
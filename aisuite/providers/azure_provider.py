@@ -1,10 +1,13 @@
-import urllib.request
-import json
 import os
 
-from aisuite.provider import Provider
+import httpx
+
+from aisuite.provider import Provider, LLMError, classify_error
 from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
 from aisuite.framework.message import Message, ChatCompletionMessageToolCall, Function
+from aisuite.utils.http_client import PooledHttpClient
+from aisuite.utils.streaming import aiter_sse_json, iter_sse_json
 
 # Azure provider is based on the documentation here -
 # https://learn.microsoft.com/en-us/azure/machine-learning/reference-model-inference-api?view=azureml-api-2&source=recommendations&tabs=python
@@ -77,6 +80,11 @@ class AzureMessageConverter:
 
         return completion_response
 
+    @staticmethod
+    def convert_stream_chunk(chunk_data) -> ChatCompletionChunk:
+        """Normalize a streamed chunk from the Azure API to match OpenAI's chunk format."""
+        return ChatCompletionChunk.model_validate(chunk_data)
+
 
 class AzureProvider(Provider):
     def __init__(self, **config):
@@ -89,13 +97,77 @@ class AzureProvider(Provider):
             raise ValueError(
                 "For Azure, base_url is required. Check your deployment page for a URL like this - https://<model-deployment-name>.<region>.models.ai.azure.com"
             )
+        self.http = PooledHttpClient.from_config(config)
         self.transformer = AzureMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
-        url = f"{self.base_url}/chat/completions"
+        url, params, data, headers = self._prepare_request(messages, kwargs)
 
-        if self.api_version:
-            url = f"{url}?api-version={self.api_version}"
+        try:
+            response = self.http.client.post(
+                url, params=params, json=data, headers=headers
+            )
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPError as error:
+            raise self._to_llm_error(error) from error
+        except (ValueError, KeyError, IndexError, TypeError) as error:
+            raise classify_error(
+                error, f"Azure returned an invalid response: {error}"
+            ) from error
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        url, params, data, headers = self._prepare_request(messages, kwargs)
+
+        try:
+            response = await self.http.async_client.post(
+                url, params=params, json=data, headers=headers
+            )
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPError as error:
+            raise self._to_llm_error(error) from error
+        except (ValueError, KeyError, IndexError, TypeError) as error:
+            raise classify_error(
+                error, f"Azure returned an invalid response: {error}"
+            ) from error
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        url, params, data, headers = self._prepare_request(messages, kwargs)
+        data["stream"] = True
+
+        try:
+            with self.http.client.stream(
+                "POST", url, params=params, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+                for chunk_data in iter_sse_json(response.iter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPError as error:
+            raise self._to_llm_error(error) from error
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        url, params, data, headers = self._prepare_request(messages, kwargs)
+        data["stream"] = True
+
+        try:
+            async with self.http.async_client.stream(
+                "POST", url, params=params, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for chunk_data in aiter_sse_json(response.aiter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPError as error:
+            raise self._to_llm_error(error) from error
+
+    def _prepare_request(self, messages, kwargs):
+        """Build the URL, query parameters, payload and headers for a request."""
+        url = f"{self.base_url}/chat/completions"
+        params = {"api-version": self.api_version} if self.api_version else None
 
         # Remove 'stream' from kwargs if present
         kwargs.pop("stream", None)
@@ -119,18 +191,20 @@ class AzureProvider(Provider):
         # Add remaining kwargs
         data.update(kwargs)
 
-        body = json.dumps(data).encode("utf-8")
         headers = {"Content-Type": "application/json", "Authorization": self.api_key}
+        return url, params, data, headers
 
-        try:
-            req = urllib.request.Request(url, body, headers)
-            with urllib.request.urlopen(req) as response:
-                result = response.read()
-                resp_json = json.loads(result)
-                return self.transformer.convert_response(resp_json)
-
-        except urllib.error.HTTPError as error:
-            error_message = f"The request failed with status code: {error.code}\n"
-            error_message += f"Headers: {error.info()}\n"
-            error_message += error.read().decode("utf-8", "ignore")
-            raise Exception(error_message)
+    @staticmethod
+    def _to_llm_error(error: httpx.HTTPError) -> LLMError:
+        """Map a transport or HTTP status failure to the LLMError taxonomy."""
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            error_message = (
+                f"The request failed with status code: {response.status_code}\n"
+            )
+            error_message += f"Headers: {response.headers}\n"
+            error_message += response.text
+            return classify_error(error, error_message)
+        if isinstance(error, httpx.TimeoutException):
+            return classify_error(error, f"Azure request timed out: {error}")
+        return classify_error(error, f"Azure request failed: {error}")
@@ -1,7 +1,7 @@
 """Cerebras provider for the aisuite."""
 
 import cerebras.cloud.sdk as cerebras
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 
@@ -31,14 +31,6 @@ class CerebrasProvider(Provider):
             )
             return self.transformer.convert_response(response.model_dump())
 
-        # Re-raise Cerebras API-specific exceptions.
-        except cerebras.PermissionDeniedError:
-            raise
-        except cerebras.AuthenticationError:
-            raise
-        except cerebras.RateLimitError:
-            raise
-
-        # Wrap all other exceptions in LLMError.
+        # Map Cerebras API exceptions into the LLMError taxonomy.
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}") from e
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -3,7 +3,7 @@ import cohere
 import json
 from aisuite.framework import ChatCompletionResponse
 from aisuite.framework.message import Message, ChatCompletionMessageToolCall, Function
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 
 
 class CohereMessageConverter:
@@ -62,9 +62,10 @@ class CohereMessageConverter:
                         }
                         for tc in tool_calls
                     ],
-                    "tool_plan": tool_plan,
+                    # convert_response returns the tool plan as the content
+                    "tool_plan": tool_plan or content,
                 }
-                if content:
+                if content and tool_plan:
                     converted_message["content"] = content
             else:
                 # Handle regular messages
@@ -104,18 +105,22 @@ class CohereMessageConverter:
             + response_data.usage.tokens.output_tokens,
         }
 
-        # Handle tool calls
+        # Handle tool calls, of which Cohere may request several at once
         if response_data.finish_reason == "TOOL_CALL":
-            tool_call = response_data.message.tool_calls[0]
-            function = Function(
-                name=tool_call.function.name, arguments=tool_call.function.arguments
-            )
-            tool_call_obj = ChatCompletionMessageToolCall(
-                id=tool_call.id, function=function, type="function"
-            )
+            tool_calls = [
+                ChatCompletionMessageToolCall(
+                    id=tool_call.id,
+                    function=Function(
+                        name=tool_call.function.name,
+                        arguments=tool_call.function.arguments,
+                    ),
+                    type="function",
+                )
+                for tool_call in response_data.message.tool_calls
+            ]
             normalized_response.choices[0].message = Message(
                 content=response_data.message.tool_plan,  # Use tool_plan as content
-                tool_calls=[tool_call_obj],
+                tool_calls=tool_calls,
                 role="assistant",
                 refusal=None,
             )
@@ -160,4 +165,4 @@ class CohereProvider(Provider):
 
             return self.transformer.convert_response(response)
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -2,7 +2,7 @@
 
 import os
 import openai
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 
@@ -36,8 +36,7 @@ class DeepseekProvider(Provider):
         self.transformer = OpenAICompliantMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
-        # Any exception raised by OpenAI will be returned to the caller.
-        # Maybe we should catch them and raise a custom LLMError.
+        # Exceptions raised by OpenAI are mapped into the LLMError taxonomy.
         try:
             response = self.client.chat.completions.create(
                 model=model,
@@ -46,4 +45,4 @@ class DeepseekProvider(Provider):
             )
             return self.transformer.convert_response(response.model_dump())
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}") from e
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -1,8 +1,11 @@
 import os
 import httpx
 import json
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
+from aisuite.utils.http_client import PooledHttpClient
+from aisuite.utils.streaming import aiter_sse_json, iter_sse_json
 from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
 from aisuite.framework.message import Message, ChatCompletionMessageToolCall
 
 
@@ -48,6 +51,11 @@ class FireworksMessageConverter:
 
         return completion_response
 
+    @staticmethod
+    def convert_stream_chunk(chunk_data) -> ChatCompletionChunk:
+        """Normalize a streamed chunk from the Fireworks API to match OpenAI's chunk format."""
+        return ChatCompletionChunk.model_validate(chunk_data)
+
 
 # Models that support tool calls:
 # [As of 01/20/2025 from https://docs.fireworks.ai/guides/function-calling]
@@ -75,14 +83,88 @@ class FireworksProvider(Provider):
                 "Fireworks API key is missing. Please provide it in the config or set the FIREWORKS_API_KEY environment variable."
             )
 
-        # Optionally set a custom timeout (default to 30s)
-        self.timeout = config.get("timeout", 30)
+        self.http = PooledHttpClient.from_config(config)
         self.transformer = FireworksMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
         """
         Makes a request to the Fireworks AI chat completions endpoint using httpx.
         """
+        data, headers = self._prepare_request(model, messages, kwargs)
+
+        try:
+            # Make the request to Fireworks AI endpoint.
+            response = self.http.client.post(self.BASE_URL, json=data, headers=headers)
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPStatusError as error:
+            raise classify_error(error, self._format_status_error(error)) from error
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Makes an async request to the Fireworks AI chat completions endpoint using httpx.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+
+        try:
+            response = await self.http.async_client.post(
+                self.BASE_URL, json=data, headers=headers
+            )
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPStatusError as error:
+            raise classify_error(error, self._format_status_error(error)) from error
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Fireworks AI chat completions endpoint.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+
+        try:
+            with self.http.client.stream(
+                "POST", self.BASE_URL, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+                for chunk_data in iter_sse_json(response.iter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPStatusError as error:
+            raise classify_error(error, self._format_status_error(error)) from error
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Fireworks AI chat completions endpoint.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+
+        try:
+            async with self.http.async_client.stream(
+                "POST", self.BASE_URL, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for chunk_data in aiter_sse_json(response.aiter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPStatusError as error:
+            raise classify_error(error, self._format_status_error(error)) from error
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def _prepare_request(self, model, messages, kwargs):
+        """
+        Build the request payload and headers.
+        """
         # Remove 'stream' from kwargs if present
         kwargs.pop("stream", None)
 
@@ -112,23 +194,17 @@ class FireworksProvider(Provider):
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        return data, headers
 
-        try:
-            # Make the request to Fireworks AI endpoint.
-            response = httpx.post(
-                self.BASE_URL, json=data, headers=headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-            return self.transformer.convert_response(response.json())
-        except httpx.HTTPStatusError as error:
-            error_message = (
-                f"The request failed with status code: {error.status_code}\n"
-            )
-            error_message += f"Headers: {error.headers}\n"
-            error_message += error.response.text
-            raise LLMError(error_message)
-        except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+    @staticmethod
+    def _format_status_error(error: httpx.HTTPStatusError) -> str:
+        """Describe a failed response, including its headers and body."""
+        error_message = (
+            f"The request failed with status code: {error.response.status_code}\n"
+        )
+        error_message += f"Headers: {error.response.headers}\n"
+        error_message += error.response.text
+        return error_message
 
     def _normalize_response(self, response_data):
         """
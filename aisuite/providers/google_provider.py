@@ -16,6 +16,7 @@ from vertexai.generative_models import (
 import pprint
 
 from aisuite.framework import ProviderInterface, ChatCompletionResponse, Message
+from aisuite.utils.cache import ConversionCache, stable_hash
 
 
 DEFAULT_TEMPERATURE = 0.7
@@ -37,24 +38,22 @@ class GoogleMessageConverter:
     def convert_assistant_role_message(message: Dict[str, Any]) -> Content:
         """Convert assistant messages to Google Vertex AI format."""
         if "tool_calls" in message and message["tool_calls"]:
-            # Handle function calls
-            tool_call = message["tool_calls"][
-                0
-            ]  # Assuming single function call for now
-            function_call = tool_call["function"]
-
-            # Create a Part from the function call
-            parts = [
-                Part.from_dict(
-                    {
-                        "function_call": {
-                            "name": function_call["name"],
-                            # "arguments": json.loads(function_call["arguments"])
+            # Handle function calls, one part per call
+            parts = (
+                [Part.from_text(message["content"])] if message.get("content") else []
+            )
+            for tool_call in message["tool_calls"]:
+                function_call = tool_call["function"]
+                parts.append(
+                    Part.from_dict(
+                        {
+                            "function_call": {
+                                "name": function_call["name"],
+                                "args": json.loads(function_call["arguments"] or "{}"),
+                            }
                         }
-                    }
+                    )
                 )
-            ]
-            # return Content(role="function", parts=parts)
         else:
             # Handle regular text messages
             parts = [Part.from_text(message["content"])]
@@ -73,7 +72,8 @@ class GoogleMessageConverter:
             part = Part.from_function_response(
                 name=message["name"], response=content_json
             )
-            # TODO: Return Content instead of Part. But returning Content is not working.
+            # convert_request groups the parts of consecutive tool messages into
+            # one Content.
             return part
         except json.JSONDecodeError:
             raise ValueError("Tool result message must be valid JSON")
@@ -88,14 +88,24 @@ class GoogleMessageConverter:
         ]
 
         formatted_messages = []
+        # Function responses of consecutive tool messages, sent back as one turn
+        function_responses = []
         for message in messages:
             if message["role"] == "tool":
                 vertex_message = GoogleMessageConverter.convert_tool_role_message(
                     message
                 )
                 if vertex_message:
-                    formatted_messages.append(vertex_message)
-            elif message["role"] == "assistant":
+                    function_responses.append(vertex_message)
+                continue
+
+            if function_responses:
+                formatted_messages.append(
+                    Content(role="function", parts=function_responses)
+                )
+                function_responses = []
+
+            if message["role"] == "assistant":
                 formatted_messages.append(
                     GoogleMessageConverter.convert_assistant_role_message(message)
                 )
@@ -104,8 +114,21 @@ class GoogleMessageConverter:
                     GoogleMessageConverter.convert_user_role_message(message)
                 )
 
+        if function_responses:
+            formatted_messages.append(
+                Content(role="function", parts=function_responses)
+            )
+
         return formatted_messages
 
+    @staticmethod
+    def tool_call_id(index: int, name: str, arguments: str) -> str:
+        """
+        Return a deterministic ID for a function call, since Vertex AI does not
+        assign one. The position in the response keeps repeated calls distinct.
+        """
+        return f"call_{stable_hash([index, name, arguments])[:24]}"
+
     @staticmethod
     def convert_response(response) -> ChatCompletionResponse:
         """Normalize the response from Vertex AI to match OpenAI's response format."""
@@ -115,75 +138,46 @@ class GoogleMessageConverter:
             print("Dumping the response")
             pprint.pprint(response)
 
-        # TODO: We need to go through each part, because function call may not be the first part.
-        #       Currently, we are only handling the first part, but this is not enough.
-        #
-        # This is a valid response:
-        # candidates {
-        #   content {
-        #     role: "model"
-        #     parts {
-        #       text: "The current temperature in San Francisco is 72 degrees Celsius. \n\n"
-        #     }
-        #     parts {
-        #       function_call {
-        #         name: "is_it_raining"
-        #         args {
-        #           fields {
-        #             key: "location"
-        #             value {
-        #               string_value: "San Francisco"
-        #             }
-        #           }
-        #         }
-        #       }
-        #     }
-        #   }
-        #   finish_reason: STOP
-
-        # Check if the response contains function calls
+        # A candidate may hold several parts, e.g. text followed by one or more
+        # function calls when Gemini calls functions in parallel.
         # Note: Just checking if the function_call attribute exists is not enough,
         #       it is important to check if the function_call is not None.
-        if (
-            hasattr(response.candidates[0].content.parts[0], "function_call")
-            and response.candidates[0].content.parts[0].function_call
-        ):
-            function_call = response.candidates[0].content.parts[0].function_call
-
-            # args is a MapComposite.
-            # Convert the MapComposite to a dictionary
-            args_dict = {}
-            # Another way to try is: args_dict = dict(function_call.args)
-            for key, value in function_call.args.items():
-                args_dict[key] = value
+        text_parts = []
+        tool_calls = []
+        for part in response.candidates[0].content.parts:
+            function_call = getattr(part, "function_call", None)
+            if not function_call:
+                text_parts.append(part.text)
+                continue
+
+            # args is a MapComposite. Convert the MapComposite to a dictionary.
+            args_dict = {key: value for key, value in function_call.args.items()}
             if ENABLE_DEBUG_MESSAGES:
                 print("Dumping the args_dict")
                 pprint.pprint(args_dict)
 
-            openai_response.choices[0].message = {
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "type": "function",
-                        "id": f"call_{hash(function_call.name)}",  # Generate a unique ID
-                        "function": {
-                            "name": function_call.name,
-                            "arguments": json.dumps(args_dict),
-                        },
-                    }
-                ],
-                "refusal": None,
-            }
+            arguments = json.dumps(args_dict)
+            tool_calls.append(
+                {
+                    "type": "function",
+                    "id": GoogleMessageConverter.tool_call_id(
+                        len(tool_calls), function_call.name, arguments
+                    ),
+                    "function": {"name": function_call.name, "arguments": arguments},
+                }
+            )
+
+        if tool_calls:
             openai_response.choices[0].message = Message(
-                **openai_response.choices[0].message
+                role="assistant",
+                content="".join(text_parts) or None,
+                tool_calls=tool_calls,
+                refusal=None,
             )
             openai_response.choices[0].finish_reason = "tool_calls"
         else:
             # Handle regular text response
-            openai_response.choices[0].message.content = (
-                response.candidates[0].content.parts[0].text
-            )
+            openai_response.choices[0].message.content = "".join(text_parts)
             openai_response.choices[0].finish_reason = "stop"
 
         return openai_response
@@ -210,6 +204,7 @@ class GoogleProvider(ProviderInterface):
         vertexai.init(project=self.project_id, location=self.location)
 
         self.transformer = GoogleMessageConverter()
+        self.tool_spec_cache = ConversionCache()
 
     def chat_completions_create(self, model, messages, **kwargs):
         """Request chat completions from the Google AI API.
@@ -235,39 +230,9 @@ class GoogleProvider(ProviderInterface):
         # Handle tools if provided
         tools = None
         if "tools" in kwargs:
-            tools = [
-                Tool(
-                    function_declarations=[
-                        FunctionDeclaration(
-                            name=tool["function"]["name"],
-                            description=tool["function"].get("description", ""),
-                            parameters={
-                                "type": "object",
-                                "properties": {
-                                    param_name: {
-                                        "type": param_info.get("type", "string"),
-                                        "description": param_info.get(
-                                            "description", ""
-                                        ),
-                                        **(
-                                            {"enum": param_info["enum"]}
-                                            if "enum" in param_info
-                                            else {}
-                                        ),
-                                    }
-                                    for param_name, param_info in tool["function"][
-                                        "parameters"
-                                    ]["properties"].items()
-                                },
-                                "required": tool["function"]["parameters"].get(
-                                    "required", []
-                                ),
-                            },
-                        )
-                        for tool in kwargs["tools"]
-                    ]
-                )
-            ]
+            tools = self.tool_spec_cache.get_or_convert(
+                kwargs["tools"], self._convert_tool_spec
+            )
 
         # Create the GenerativeModel
         model = GenerativeModel(
@@ -284,11 +249,11 @@ class GoogleProvider(ProviderInterface):
         chat = model.start_chat(history=message_history[:-1])
         last_message = message_history[-1]
 
-        # If the last message is a function response, send the Part object directly
+        # If the last message holds function responses, send the Content directly
         # Otherwise, send just the text content
         message_to_send = (
-            Content(role="function", parts=[last_message])
-            if isinstance(last_message, Part)
+            last_message
+            if last_message.role == "function"
             else last_message.parts[0].text
         )
         # response = chat.send_message(message_to_send)
@@ -296,3 +261,38 @@ class GoogleProvider(ProviderInterface):
 
         # Convert and return the response
         return self.transformer.convert_response(response)
+
+    @staticmethod
+    def _convert_tool_spec(openai_tools):
+        """Convert OpenAI tool specifications to a list of Vertex AI Tools."""
+        return [
+            Tool(
+                function_declarations=[
+                    FunctionDeclaration(
+                        name=tool["function"]["name"],
+                        description=tool["function"].get("description", ""),
+                        parameters={
+                            "type": "object",
+                            "properties": {
+                                param_name: {
+                                    "type": param_info.get("type", "string"),
+                                    "description": param_info.get("description", ""),
+                                    **(
+                                        {"enum": param_info["enum"]}
+                                        if "enum" in param_info
+                                        else {}
+                                    ),
+                                }
+                                for param_name, param_info in tool["function"][
+                                    "parameters"
+                                ]["properties"].items()
+                            },
+                            "required": tool["function"]["parameters"].get(
+                                "required", []
+                            ),
+                        },
+                    )
+                    for tool in openai_tools
+                ]
+            )
+        ]
@@ -2,7 +2,7 @@ import os
 from google import generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.framework import ChatCompletionResponse
 
 # From upstream eliasjudin:add-gemini PR #181
@@ -56,7 +56,9 @@ class GoogleGenaiProvider(Provider):
             )
             return self.normalize_response(response)
         except Exception as e:
-            raise LLMError(f"Error in chat_completions_create: {str(e)}")
+            raise classify_error(
+                e, f"Error in chat_completions_create: {str(e)}"
+            ) from e
 
     def generate_content(self, model, contents, **kwargs):
         try:
@@ -67,14 +69,14 @@ class GoogleGenaiProvider(Provider):
             )
             return self.normalize_response(response)
         except Exception as e:
-            raise LLMError(f"Error in generate_content: {str(e)}")
+            raise classify_error(e, f"Error in generate_content: {str(e)}") from e
 
     def list_models(self):
         try:
             response = genai.list_models()
             return [model.name for model in response]
         except Exception as e:
-            raise LLMError(f"Error in list_models: {str(e)}")
+            raise classify_error(e, f"Error in list_models: {str(e)}") from e
 
     def normalize_response(self, response):
         normalized_response = ChatCompletionResponse()
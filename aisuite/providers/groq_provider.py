@@ -1,6 +1,6 @@
 import os
 import groq
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 # Implementation of Groq provider.
@@ -25,7 +25,13 @@ class GroqMessageConverter(OpenAICompliantMessageConverter):
     Groq-specific message converter if needed
     """
 
-    pass
+    def convert_stream_chunk(self, chunk_data):
+        """Normalize a streamed chunk; Groq reports usage under x_groq."""
+        chunk = super().convert_stream_chunk(chunk_data)
+        x_groq = chunk_data.get("x_groq") or {}
+        if chunk.usage is None and x_groq.get("usage"):
+            chunk.usage = self.get_completion_usage(x_groq["usage"])
+        return chunk
 
 
 class GroqProvider(Provider):
@@ -42,6 +48,7 @@ class GroqProvider(Provider):
             )
         config["api_key"] = self.api_key
         self.client = groq.Groq(**config)
+        self.async_client = groq.AsyncGroq(**config)
         self.transformer = GroqMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
@@ -59,4 +66,56 @@ class GroqProvider(Provider):
             )
             return self.transformer.convert_response(response.model_dump())
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Groq chat completions endpoint.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                stream=True,
+                **kwargs,  # Pass any additional arguments to the Groq API
+            )
+            for chunk in stream:
+                yield self.transformer.convert_stream_chunk(chunk.model_dump())
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Groq chat completions endpoint.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            stream = await self.async_client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                stream=True,
+                **kwargs,  # Pass any additional arguments to the Groq API
+            )
+            async for chunk in stream:
+                yield self.transformer.convert_stream_chunk(chunk.model_dump())
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Makes an async request to the Groq chat completions endpoint.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            response = await self.async_client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                **kwargs,  # Pass any additional arguments to the Groq API
+            )
+            return self.transformer.convert_response(response.model_dump())
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -1,7 +1,7 @@
 import os
 import json
 from huggingface_hub import InferenceClient
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.framework import ChatCompletionResponse
 from aisuite.framework.message import Message
 
@@ -70,7 +70,7 @@ class HuggingfaceProvider(Provider):
             return self._normalize_response(response)
 
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
 
     def transform_from_message(self, message: Message):
         """Transform framework Message to a format that HuggingFace understands."""
@@ -1,6 +1,6 @@
 import openai
 import os
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 
 
 class InceptionProvider(Provider):
@@ -21,8 +21,7 @@ class InceptionProvider(Provider):
         self.client = openai.OpenAI(**config)
 
     def chat_completions_create(self, model, messages, **kwargs):
-        # Any exception raised by Inception will be returned to the caller.
-        # Maybe we should catch them and raise a custom LLMError.
+        # Exceptions raised by Inception are mapped into the LLMError taxonomy.
         try:
             response = self.client.chat.completions.create(
                 model=model,
@@ -31,4 +30,4 @@ class InceptionProvider(Provider):
             )
             return response
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
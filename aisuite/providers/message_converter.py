@@ -1,6 +1,7 @@
 """Base message converter for OpenAI-compliant providers."""
 
 from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
 from aisuite.framework.message import (
     Message,
     ChatCompletionMessageToolCall,
@@ -69,6 +70,10 @@ class OpenAICompliantMessageConverter:
 
         return completion_response
 
+    def convert_stream_chunk(self, chunk_data) -> ChatCompletionChunk:
+        """Normalize a streamed chunk to match OpenAI's chunk format."""
+        return ChatCompletionChunk.model_validate(chunk_data)
+
     def get_completion_usage(self, usage_data: dict):
         """Get the usage statistics from a usage data dictionary."""
         return CompletionUsage(
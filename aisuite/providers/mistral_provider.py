@@ -3,7 +3,7 @@
 import os
 from mistralai import Mistral
 from aisuite.framework import ChatCompletionResponse
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 
@@ -25,6 +25,10 @@ class MistralMessageConverter(OpenAICompliantMessageConverter):
         response_dict = response_data.model_dump()
         return super().convert_response(response_dict)
 
+    def convert_stream_chunk(self, chunk_data):
+        """Convert a Mistral stream event to our standard chunk format."""
+        return super().convert_stream_chunk(chunk_data.data.model_dump())
+
 
 # Function calling is available for the following models:
 # [As of 01/19/2025 from https://docs.mistral.ai/capabilities/function_calling/]
@@ -72,4 +76,49 @@ class MistralProvider(Provider):
 
             return self.transformer.convert_response(response)
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}") from e
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from Mistral using the official client.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            stream = self.client.chat.stream(
+                model=model, messages=transformed_messages, **kwargs
+            )
+            for event in stream:
+                yield self.transformer.convert_stream_chunk(event)
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from Mistral using the official async client.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            stream = await self.client.chat.stream_async(
+                model=model, messages=transformed_messages, **kwargs
+            )
+            async for event in stream:
+                yield self.transformer.convert_stream_chunk(event)
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Makes an async request to Mistral using the official client.
+        """
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+
+            response = await self.client.chat.complete_async(
+                model=model, messages=transformed_messages, **kwargs
+            )
+
+            return self.transformer.convert_response(response)
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -1,7 +1,20 @@
 import os
+import json
 import httpx
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, LLMError, ProviderConnectionError, classify_error
 from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChunkChoice,
+)
+from aisuite.framework.message import CompletionUsage, ResponseMetrics
+from aisuite.utils.http_client import PooledHttpClient
+from aisuite.utils.streaming import generate_chunk_id
+
+# Ollama reports durations in nanoseconds.
+_NS_PER_MS = 1_000_000
+_NS_PER_S = 1_000_000_000
 
 
 class OllamaProvider(Provider):
@@ -13,6 +26,8 @@ class OllamaProvider(Provider):
     """
 
     _CHAT_COMPLETION_ENDPOINT = "/api/chat"
+    _GENERATE_ENDPOINT = "/api/generate"
+    _LOADED_MODELS_ENDPOINT = "/api/ps"
     _CONNECT_ERROR_MESSAGE = "Ollama is likely not running. Start Ollama by running `ollama serve` on your host."
 
     def __init__(self, **config):
@@ -25,37 +40,195 @@ class OllamaProvider(Provider):
         )
         print(f"{self.url=}")
 
-        # Optionally set a custom timeout (default to 30s)
-        self.timeout = config.get("timeout", 30)
+        self.http = PooledHttpClient.from_config(config)
+        # How long Ollama keeps a model loaded after a request, e.g. "30m", or -1
+        # to keep it loaded indefinitely. None leaves the server default (5m).
+        self.keep_alive = config.get("keep_alive")
 
     def chat_completions_create(self, model, messages, **kwargs):
         """
         Makes a request to the chat completions endpoint using httpx.
         """
-        kwargs["stream"] = False
-        data = {
-            "model": model,
-            "messages": messages,
-            **kwargs,  # Pass any additional arguments to the API
-        }
+        data = self._prepare_request(model, messages, kwargs)
 
         try:
-            response = httpx.post(
+            response = self.http.client.post(
                 self.url.rstrip("/") + self._CHAT_COMPLETION_ENDPOINT,
                 json=data,
-                timeout=self.timeout,
             )
             response.raise_for_status()
         except httpx.ConnectError:  # Handle connection errors
-            raise LLMError(f"Connection failed: {self._CONNECT_ERROR_MESSAGE}")
+            raise ProviderConnectionError(
+                f"Connection failed: {self._CONNECT_ERROR_MESSAGE}"
+            )
         except httpx.HTTPStatusError as http_err:
-            raise LLMError(f"Ollama request failed: {http_err}")
+            raise classify_error(
+                http_err, f"Ollama request failed: {http_err}"
+            ) from http_err
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
 
         # Return the normalized response
         return self._normalize_response(response.json())
 
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Makes an async request to the chat completions endpoint using httpx.
+        """
+        data = self._prepare_request(model, messages, kwargs)
+
+        try:
+            response = await self.http.async_client.post(
+                self.url.rstrip("/") + self._CHAT_COMPLETION_ENDPOINT,
+                json=data,
+            )
+            response.raise_for_status()
+        except httpx.ConnectError:  # Handle connection errors
+            raise ProviderConnectionError(
+                f"Connection failed: {self._CONNECT_ERROR_MESSAGE}"
+            )
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Ollama request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+        return self._normalize_response(response.json())
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the chat endpoint, which answers with
+        newline-delimited JSON objects.
+        """
+        data = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+        chunk_id = generate_chunk_id()
+
+        try:
+            with self.http.client.stream(
+                "POST", self.url.rstrip("/") + self._CHAT_COMPLETION_ENDPOINT, json=data
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line.strip():
+                        yield from self._convert_stream_data(json.loads(line), chunk_id)
+        except httpx.ConnectError:  # Handle connection errors
+            raise ProviderConnectionError(
+                f"Connection failed: {self._CONNECT_ERROR_MESSAGE}"
+            )
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Ollama request failed: {http_err}"
+            ) from http_err
+        except LLMError:
+            raise
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Async version of chat_completions_create_stream.
+        """
+        data = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+        chunk_id = generate_chunk_id()
+
+        try:
+            async with self.http.async_client.stream(
+                "POST", self.url.rstrip("/") + self._CHAT_COMPLETION_ENDPOINT, json=data
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line.strip():
+                        for chunk in self._convert_stream_data(
+                            json.loads(line), chunk_id
+                        ):
+                            yield chunk
+        except httpx.ConnectError:  # Handle connection errors
+            raise ProviderConnectionError(
+                f"Connection failed: {self._CONNECT_ERROR_MESSAGE}"
+            )
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Ollama request failed: {http_err}"
+            ) from http_err
+        except LLMError:
+            raise
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def warmup(self, model, keep_alive=None):
+        """
+        Load model into memory ahead of traffic, e.g. during a rollout.
+
+        Args:
+            model: Name of the model to load.
+            keep_alive: How long to keep the model loaded, e.g. "1h" or -1 for
+                indefinitely. Defaults to the provider's keep_alive.
+
+        Returns:
+            ResponseMetrics with the time spent loading the model.
+        """
+        data = {"model": model}
+        keep_alive = keep_alive if keep_alive is not None else self.keep_alive
+        if keep_alive is not None:
+            data["keep_alive"] = keep_alive
+        response_data = self._request("POST", self._GENERATE_ENDPOINT, json=data)
+        return self._get_metrics(response_data)
+
+    def unload(self, model):
+        """Unload model from memory immediately."""
+        self._request(
+            "POST", self._GENERATE_ENDPOINT, json={"model": model, "keep_alive": 0}
+        )
+
+    def list_loaded(self):
+        """
+        List the models currently loaded in memory.
+
+        Returns:
+            A list of dicts as reported by Ollama, with keys such as "name",
+            "size_vram" and "expires_at".
+        """
+        return self._request("GET", self._LOADED_MODELS_ENDPOINT).get("models", [])
+
+    def _request(self, method, endpoint, json=None):
+        """Make a non-streaming request to an Ollama endpoint and return its JSON."""
+        try:
+            response = self.http.client.request(
+                method, self.url.rstrip("/") + endpoint, json=json
+            )
+            response.raise_for_status()
+        except httpx.ConnectError:  # Handle connection errors
+            raise ProviderConnectionError(
+                f"Connection failed: {self._CONNECT_ERROR_MESSAGE}"
+            )
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Ollama request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+        return response.json()
+
+    def _prepare_request(self, model, messages, kwargs):
+        """
+        Build the /api/chat request payload.
+        """
+        kwargs["stream"] = False
+        if self.keep_alive is not None:
+            kwargs.setdefault("keep_alive", self.keep_alive)
+        return {
+            "model": model,
+            "messages": messages,
+            **kwargs,  # Pass any additional arguments to the API
+        }
+
     def _normalize_response(self, response_data):
         """
         Normalize the API response to a common format (ChatCompletionResponse).
@@ -64,4 +237,87 @@ class OllamaProvider(Provider):
         normalized_response.choices[0].message.content = response_data["message"][
             "content"
         ]
+        normalized_response.choices[0].finish_reason = response_data.get("done_reason")
+        normalized_response.usage = self._get_usage(response_data)
+        normalized_response.metrics = self._get_metrics(response_data)
         return normalized_response
+
+    def _convert_stream_data(self, data, chunk_id):
+        """
+        Convert one object of a streamed response to chunks. The final object
+        (done=true) also yields a chunk with usage and metrics.
+        """
+        if "error" in data:
+            raise LLMError(f"Ollama stream failed: {data['error']}")
+
+        message = data.get("message") or {}
+        done = data.get("done", False)
+        model = data.get("model")
+        yield ChatCompletionChunk(
+            id=chunk_id,
+            model=model,
+            choices=[
+                ChunkChoice(
+                    delta=ChoiceDelta(
+                        role=message.get("role"), content=message.get("content") or None
+                    ),
+                    finish_reason=(data.get("done_reason") or "stop") if done else None,
+                )
+            ],
+        )
+        if done:
+            yield ChatCompletionChunk(
+                id=chunk_id,
+                model=model,
+                usage=self._get_usage(data),
+                metrics=self._get_metrics(data),
+            )
+
+    @staticmethod
+    def _get_usage(response_data):
+        """Get the token usage from the counters of a final response object."""
+        prompt_tokens = response_data.get("prompt_eval_count")
+        completion_tokens = response_data.get("eval_count")
+        if prompt_tokens is None and completion_tokens is None:
+            return None
+        return CompletionUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=(prompt_tokens or 0) + (completion_tokens or 0),
+        )
+
+    @staticmethod
+    def _get_metrics(response_data):
+        """Get timings and throughput from the durations of a final response object."""
+        if (
+            "total_duration" not in response_data
+            and "eval_duration" not in response_data
+        ):
+            return None
+
+        def to_ms(key):
+            value = response_data.get(key)
+            return value / _NS_PER_MS if value is not None else None
+
+        def per_second(count_key, duration_key):
+            count = response_data.get(count_key)
+            duration = response_data.get(duration_key)
+            if not count or not duration:
+                return None
+            return count / (duration / _NS_PER_S)
+
+        total_duration = response_data.get("total_duration")
+        return ResponseMetrics(
+            latency_ms=(
+                round(total_duration / _NS_PER_MS)
+                if total_duration is not None
+                else None
+            ),
+            load_duration_ms=to_ms("load_duration"),
+            prompt_eval_duration_ms=to_ms("prompt_eval_duration"),
+            eval_duration_ms=to_ms("eval_duration"),
+            prompt_tokens_per_second=per_second(
+                "prompt_eval_count", "prompt_eval_duration"
+            ),
+            completion_tokens_per_second=per_second("eval_count", "eval_duration"),
+        )
@@ -1,6 +1,6 @@
 import openai
 import os
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 
@@ -23,11 +23,11 @@ class OpenaiProvider(Provider):
 
         # Pass the entire config to the OpenAI client constructor
         self.client = openai.OpenAI(**config)
+        self.async_client = openai.AsyncOpenAI(**config)
         self.transformer = OpenAICompliantMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
-        # Any exception raised by OpenAI will be returned to the caller.
-        # Maybe we should catch them and raise a custom LLMError.
+        # Exceptions raised by OpenAI are mapped into the LLMError taxonomy.
         try:
             transformed_messages = self.transformer.convert_request(messages)
             response = self.client.chat.completions.create(
@@ -37,4 +37,47 @@ class OpenaiProvider(Provider):
             )
             return response
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        # Ask for a final chunk carrying token usage.
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                stream=True,
+                **kwargs,  # Pass any additional arguments to the OpenAI API
+            )
+            for chunk in stream:
+                yield self.transformer.convert_stream_chunk(chunk.model_dump())
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+            stream = await self.async_client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                stream=True,
+                **kwargs,  # Pass any additional arguments to the OpenAI API
+            )
+            async for chunk in stream:
+                yield self.transformer.convert_stream_chunk(chunk.model_dump())
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        try:
+            transformed_messages = self.transformer.convert_request(messages)
+            response = await self.async_client.chat.completions.create(
+                model=model,
+                messages=transformed_messages,
+                **kwargs,  # Pass any additional arguments to the OpenAI API
+            )
+            return response
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -1,5 +1,5 @@
 import os
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
 from openai import OpenAI
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
@@ -50,4 +50,4 @@ class SambanovaProvider(Provider):
             )
             return self.transformer.convert_response(response.model_dump())
         except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+            raise classify_error(e, f"An error occurred: {e}") from e
@@ -1,6 +1,8 @@
 import os
 import httpx
-from aisuite.provider import Provider, LLMError
+from aisuite.provider import Provider, classify_error
+from aisuite.utils.http_client import PooledHttpClient
+from aisuite.utils.streaming import aiter_sse_json, iter_sse_json
 from aisuite.providers.message_converter import OpenAICompliantMessageConverter
 
 
@@ -30,14 +32,96 @@ class TogetherProvider(Provider):
                 "Together API key is missing. Please provide it in the config or set the TOGETHER_API_KEY environment variable."
             )
 
-        # Optionally set a custom timeout (default to 30s)
-        self.timeout = config.get("timeout", 30)
+        self.http = PooledHttpClient.from_config(config)
         self.transformer = TogetherMessageConverter()
 
     def chat_completions_create(self, model, messages, **kwargs):
         """
         Makes a request to the Together AI chat completions endpoint using httpx.
         """
+        data, headers = self._prepare_request(model, messages, kwargs)
+
+        try:
+            # Make the request to Together AI endpoint.
+            response = self.http.client.post(self.BASE_URL, json=data, headers=headers)
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Together AI request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create(self, model, messages, **kwargs):
+        """
+        Makes an async request to the Together AI chat completions endpoint using httpx.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+
+        try:
+            response = await self.http.async_client.post(
+                self.BASE_URL, json=data, headers=headers
+            )
+            response.raise_for_status()
+            return self.transformer.convert_response(response.json())
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Together AI request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def chat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Together AI chat completions endpoint.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+
+        try:
+            with self.http.client.stream(
+                "POST", self.BASE_URL, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+                for chunk_data in iter_sse_json(response.iter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Together AI request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    async def achat_completions_create_stream(self, model, messages, **kwargs):
+        """
+        Streams a chat completion from the Together AI chat completions endpoint.
+        """
+        data, headers = self._prepare_request(model, messages, kwargs)
+        data["stream"] = True
+
+        try:
+            async with self.http.async_client.stream(
+                "POST", self.BASE_URL, json=data, headers=headers
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                async for chunk_data in aiter_sse_json(response.aiter_lines()):
+                    yield self.transformer.convert_stream_chunk(chunk_data)
+        except httpx.HTTPStatusError as http_err:
+            raise classify_error(
+                http_err, f"Together AI request failed: {http_err}"
+            ) from http_err
+        except Exception as e:
+            raise classify_error(e, f"An error occurred: {e}") from e
+
+    def _prepare_request(self, model, messages, kwargs):
+        """
+        Build the request payload and headers.
+        """
         # Transform messages using converter
         transformed_messages = self.transformer.convert_request(messages)
 
@@ -51,15 +135,4 @@ class TogetherProvider(Provider):
             "messages": transformed_messages,
             **kwargs,  # Pass any additional arguments to the API
         }
-
-        try:
-            # Make the request to Together AI endpoint.
-            response = httpx.post(
-                self.BASE_URL, json=data, headers=headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-            return self.transformer.convert_response(response.json())
-        except httpx.HTTPStatusError as http_err:
-            raise LLMError(f"Together AI request failed: {http_err}")
-        except Exception as e:
-            raise LLMError(f"An error occurred: {e}")
+        return data, headers
@@ -0,0 +1,228 @@
+"""Hashing helpers, conversion caching and response caches."""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+
+def stable_hash(obj: Any) -> str:
+    """
+    Return a hash of obj that is stable across calls and processes.
+
+    obj is serialized to canonical JSON (sorted keys, no whitespace). Pydantic
+    models are dumped first; any other non-JSON value is represented by str().
+    """
+
+    def default(value):
+        if hasattr(value, "model_dump"):
+            return value.model_dump()
+        return str(value)
+
+    canonical = json.dumps(
+        obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=default
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ConversionCache:
+    """
+    Bounded, thread-safe LRU cache for provider-side conversions of request data.
+
+    Used to convert a tool list to a provider's native format once per distinct tool
+    list, rather than on every request of a tool-calling loop. Cached values are
+    shared between requests and must not be mutated by callers.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_convert(self, value: Any, convert: Callable[[Any], Any]) -> Any:
+        """Return convert(value), reusing the result for equal values."""
+        key = stable_hash(value)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        converted = convert(value)
+        with self._lock:
+            self._entries[key] = converted
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return converted
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ResponseCache(ABC):
+    """
+    Base class for exact-match caches of chat completion responses.
+
+    Responses are stored pickled, so every hit returns a fresh copy that callers are
+    free to modify. Subclasses implement _load, _store and clear on pickled bytes;
+    hit and miss counters are kept here.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        data = self._load(key)
+        with self._stats_lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if data is None else pickle.loads(data)
+
+    def set(self, key: str, value: Any):
+        """Store value under key. Values that cannot be pickled are not cached."""
+        try:
+            data = pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._store(key, data)
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters and the hit rate."""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[bytes]:
+        """Return the pickled value for key, or None if absent or expired."""
+
+    @abstractmethod
+    def _store(self, key: str, data: bytes):
+        """Store the pickled value for key."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry."""
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU response cache.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used is evicted.
+        ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def _store(self, key, data):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache stored in an SQLite database file.
+
+    The database can be shared by several processes, e.g. the workers of an eval
+    run. Write-ahead logging lets readers proceed while another process writes.
+
+    Entries are pickled, and unpickling can execute arbitrary code: anyone able to
+    write the database file can run code in every process that reads it. Only use
+    a file in a location writable by trusted users.
+
+    Args:
+        path: Path of the database file; it is created if missing.
+        ttl: Seconds an entry stays valid, or None to keep entries forever.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        super().__init__()
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created REAL NOT NULL)"
+            )
+
+    def _load(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            data, created = row
+            if self.ttl is not None and created + self.ttl <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return data
+
+    def _store(self, key, data):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
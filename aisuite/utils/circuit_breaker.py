@@ -0,0 +1,208 @@
+"""Circuit breaking for providers that are failing or degraded."""
+
+import collections
+import contextlib
+import threading
+import time
+from typing import Optional
+
+from aisuite.provider import CircuitOpenError, classify_error
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a provider that is failing or too slow.
+
+    The outcomes of the last window_size calls are kept. Once at least
+    minimum_calls are recorded, the circuit opens when the share of failures
+    reaches failure_rate_threshold, or the share of calls slower than
+    slow_call_duration reaches slow_call_rate_threshold. Only transient failures
+    (rate limits, overload, timeouts, connection errors) count; a bad request says
+    nothing about the provider's health.
+
+    While open, requests fail at once with CircuitOpenError. After open_duration
+    seconds the circuit is half-open: up to half_open_max_calls probe requests are
+    let through at a time. As many successful probes close the circuit; a failed
+    or slow probe opens it again.
+
+    Args:
+        failure_rate_threshold: Share of failed calls that opens the circuit.
+        slow_call_duration: Seconds above which a call counts as slow, or None to
+            ignore latency.
+        slow_call_rate_threshold: Share of slow calls that opens the circuit.
+        window_size: Number of recent calls the rates are computed over.
+        minimum_calls: Calls needed in the window before the circuit can open.
+        open_duration: Seconds the circuit stays open before probing.
+        half_open_max_calls: Probe requests allowed at once while half-open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._outcomes = collections.deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = None
+        self._probes = 0
+        self._probe_successes = 0
+        # Identifies the current half-open period, so that probes admitted in an
+        # earlier one do not count towards it.
+        self._probe_period = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The current state: closed, open or half_open."""
+        with self._lock:
+            return self._current_state()
+
+    def stats(self) -> dict:
+        """Return the state and the failure and slow call rates of the window."""
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                "state": self._current_state(),
+                "calls": calls,
+                "failure_rate": self._rate(0),
+                "slow_call_rate": self._rate(1),
+            }
+
+    def check(self):
+        """
+        Raise CircuitOpenError if a request would be refused now.
+
+        Unlike guard, this does not take a half-open probe.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN or (
+                state == self.HALF_OPEN and self._probes >= self.half_open_max_calls
+            ):
+                raise self._open_error()
+
+    @contextlib.contextmanager
+    def guard(self):
+        """
+        Run the block as a call through the breaker and record its outcome.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe
+                in flight.
+        """
+        probe = self._admit()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._record(probe, failed=classify_error(e).retryable, latency=None)
+            raise
+        except BaseException:
+            # Cancelled or interrupted: no verdict on the provider.
+            self._release_probe(probe)
+            raise
+        self._record(probe, failed=False, latency=time.monotonic() - start)
+
+    def _admit(self) -> Optional[int]:
+        """Let a call through, returning its probe period if it is a probe."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return None
+            if state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return self._probe_period
+            raise self._open_error()
+
+    def _is_current_probe(self, probe: Optional[int]) -> bool:
+        return (
+            probe is not None
+            and self._state == self.HALF_OPEN
+            and probe == self._probe_period
+        )
+
+    def _record(self, probe: Optional[int], failed: bool, latency: Optional[float]):
+        slow = (
+            latency is not None
+            and self.slow_call_duration is not None
+            and latency > self.slow_call_duration
+        )
+        with self._lock:
+            if probe is not None:
+                if not self._is_current_probe(probe):
+                    return
+                self._probes -= 1
+                if failed or slow:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_max_calls:
+                        self._close()
+                return
+            if self._state != self.CLOSED:
+                # A call admitted before the circuit opened.
+                return
+            self._outcomes.append((failed, slow))
+            if len(self._outcomes) >= self.minimum_calls and (
+                self._rate(0) >= self.failure_rate_threshold
+                or (
+                    self.slow_call_duration is not None
+                    and self._rate(1) >= self.slow_call_rate_threshold
+                )
+            ):
+                self._open()
+
+    def _release_probe(self, probe: Optional[int]):
+        with self._lock:
+            if self._is_current_probe(probe):
+                self._probes -= 1
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.open_duration
+        ):
+            self._state = self.HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+            self._probe_period += 1
+        return self._state
+
+    def _rate(self, field: int) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(outcome[field] for outcome in self._outcomes) / len(self._outcomes)
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._outcomes.clear()
+
+    def _open_error(self) -> CircuitOpenError:
+        retry_after = 0.0
+        if self._state == self.OPEN:
+            retry_after = max(
+                0.0, self.open_duration - (time.monotonic() - self._opened_at)
+            )
+        return CircuitOpenError(
+            "Circuit breaker is open; the provider is failing or degraded",
+            retry_after=retry_after,
+        )
@@ -0,0 +1,336 @@
+"""Concurrency helpers shared by the client."""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+def call_with_timeout(func: Callable[[], Any], timeout: Optional[float]) -> Any:
+    """
+    Call func and return its result, giving up after timeout seconds.
+
+    Blocking provider calls cannot be interrupted, so on timeout the call is left to
+    finish in a daemon thread and its result is discarded. With timeout=None func is
+    simply called in the current thread.
+
+    Raises:
+        TimeoutError: If func did not return within timeout seconds.
+    """
+    if timeout is None:
+        return func()
+
+    future = run_in_thread(func)
+    done, _ = concurrent.futures.wait([future], timeout=timeout)
+    if not done:
+        raise TimeoutError(f"Call did not complete within {timeout} seconds")
+    return future.result()
+
+
+def run_in_thread(func: Callable[[], Any]) -> concurrent.futures.Future:
+    """
+    Start func in a daemon thread and return a future for its result.
+
+    Unlike an executor, nothing waits for the thread at exit, so a call that is
+    abandoned does not hold up the interpreter.
+    """
+    future = concurrent.futures.Future()
+
+    def target():
+        try:
+            future.set_result(func())
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+# HTTP statuses that signal a provider is rate limiting or overloaded.
+OVERLOAD_STATUS_CODES = frozenset({429, 503, 529})
+
+
+def get_status_code(error: BaseException) -> Optional[int]:
+    """
+    Return the HTTP status behind an error, if any.
+
+    Looks at the error and the errors it was raised from, since providers wrap SDK
+    and httpx errors in LLMError. Both a status_code attribute and an httpx-style
+    response.status_code are recognized.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether an error is a rate limit or overload response."""
+    return get_status_code(error) in OVERLOAD_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the requests in flight to one provider, adapting the limit with AIMD.
+
+    Every successful request whose latency stays within latency_tolerance times the
+    baseline latency grows the limit additively, by about one per limit's worth of
+    requests. A rate limit or overload error (429, 503, 529), or a latency above that
+    bound, cuts the limit by decrease_factor. Cuts are spaced by at least one
+    baseline latency so that a burst of failures from the same window counts once.
+
+    Requests beyond the limit wait in FIFO order instead of failing. Waiters are
+    plain futures, so threads and event loops can share one limiter.
+
+    Args:
+        initial_limit: Concurrency limit to start with.
+        min_limit: Lowest limit AIMD may reach.
+        max_limit: Highest limit AIMD may reach.
+        decrease_factor: Factor applied to the limit on overload.
+        latency_tolerance: Latency inflation, relative to the baseline, treated as
+            an overload signal.
+    """
+
+    # Weight of a new sample in the baseline latency average.
+    _BASELINE_WEIGHT = 0.05
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Expected 1 <= min_limit <= initial_limit <= max_limit, got "
+                f"{min_limit}, {initial_limit}, {max_limit}"
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters = collections.deque()
+        self._baseline_latency = None
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    def stats(self) -> dict:
+        """Return the current limit, requests in flight and queue depth."""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+            }
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Wait for a free slot.
+
+        Raises:
+            TimeoutError: If no slot was free within timeout seconds.
+        """
+        waiter = self._enqueue()
+        if waiter is None:
+            return
+        done, _ = concurrent.futures.wait([waiter], timeout=timeout)
+        if not done and self._dequeue(waiter):
+            raise TimeoutError(f"No request slot became free within {timeout} seconds")
+
+    async def aacquire(self):
+        """Async version of acquire."""
+        waiter = self._enqueue()
+        if waiter is None:
+            return
+        try:
+            await asyncio.shield(asyncio.wrap_future(waiter))
+        except asyncio.CancelledError:
+            if not self._dequeue(waiter):
+                # The slot was granted as the wait was cancelled.
+                self.release(None)
+            raise
+
+    def release(self, latency: Optional[float], overloaded: bool = False):
+        """
+        Free a slot and adapt the limit.
+
+        Args:
+            latency: Seconds the request took, or None if it failed for a reason
+                unrelated to load.
+            overloaded: The request failed with a rate limit or overload error.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if overloaded:
+                self._decrease()
+            elif latency is not None:
+                self._record_latency(latency)
+            self._grant_waiters()
+
+    @contextlib.contextmanager
+    def slot(self, timeout: Optional[float] = None):
+        """Hold a slot for the duration of the block, reporting its outcome."""
+        self.acquire(timeout)
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(None, overloaded=is_overload_error(e))
+            raise
+        self.release(time.monotonic() - start)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self):
+        """Async version of slot."""
+        await self.aacquire()
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(None, overloaded=is_overload_error(e))
+            raise
+        self.release(time.monotonic() - start)
+
+    def _enqueue(self) -> Optional[concurrent.futures.Future]:
+        """Take a slot if one is free, otherwise return a future for the queue."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return None
+            waiter = concurrent.futures.Future()
+            self._waiters.append(waiter)
+            return waiter
+
+    def _dequeue(self, waiter) -> bool:
+        """Remove a waiter that gave up. Returns False if it was already granted."""
+        with self._lock:
+            if waiter.done():
+                return False
+            self._waiters.remove(waiter)
+            return True
+
+    def _grant_waiters(self):
+        while self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            self._waiters.popleft().set_result(None)
+
+    def _record_latency(self, latency: float):
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+            return
+        inflated = latency > self.latency_tolerance * self._baseline_latency
+        # The baseline follows slowly even when inflated, so that a permanently
+        # slower provider is eventually accepted as the new normal.
+        self._baseline_latency += self._BASELINE_WEIGHT * (
+            latency - self._baseline_latency
+        )
+        if inflated:
+            self._decrease()
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < (self._baseline_latency or 0):
+            return
+        self._last_decrease = now
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one call.
+
+    The first caller for a key (the leader) makes the call; callers arriving while
+    it is in flight wait for it and receive a deep copy of its result, or its
+    error. Waiters are plain futures, so threads and event loops can share one
+    instance.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        """Return the calls in flight and the number of calls coalesced so far."""
+        with self._lock:
+            return {"in_flight": len(self._calls), "coalesced": self.coalesced}
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """Return func(), sharing the call with concurrent callers of the same key."""
+        future, leader = self._join(key)
+        if not leader:
+            return _copy_result(future.result())
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    async def ado(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of do."""
+        future, leader = self._join(key)
+        if not leader:
+            # Shielded so that a cancelled waiter does not cancel the shared call.
+            return _copy_result(await asyncio.shield(asyncio.wrap_future(future)))
+        # The call runs as its own task, so that a cancelled leader leaves it
+        # running for the waiters instead of handing them its cancellation.
+        task = asyncio.ensure_future(func())
+        task.add_done_callback(lambda task: self._settle(key, future, task))
+        return await asyncio.shield(task)
+
+    def _join(self, key):
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+            return future, True
+
+    def _settle(self, key, future, task):
+        if task.cancelled():
+            self._finish(key, future, error=asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(key, future, error=task.exception())
+        else:
+            self._finish(key, future, result=task.result())
+
+    def _finish(self, key, future, result=None, error=None):
+        with self._lock:
+            del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+def _copy_result(result):
+    """Give each waiter its own copy, so that callers may modify their response."""
+    try:
+        return copy.deepcopy(result)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return result
@@ -0,0 +1,203 @@
+"""Hedged requests: racing a duplicate request against a slow one."""
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Iterator, Optional, Tuple
+
+from aisuite.utils.concurrency import run_in_thread
+
+_END = object()
+
+
+class HedgePolicy:
+    """
+    Decides when a request is hedged and keeps hedging statistics.
+
+    A hedge is a duplicate request sent when the original has not answered (or,
+    when streaming, has not produced its first chunk) within the hedge delay. The
+    delay is either fixed or the observed percentile latency of the model, which
+    needs min_samples latencies before any hedge is sent. At most about budget
+    hedges are sent per request, so duplicates stay bounded during an outage.
+
+    Args:
+        delay: Fixed hedge delay in seconds, or None to use the observed latency.
+        percentile: Latency percentile used as the delay when delay is None.
+        min_samples: Latencies needed before the observed delay is used.
+        window_size: Number of recent latencies kept per model.
+        budget: Most hedges per hedgeable request, e.g. 0.1 for one in ten.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 200,
+        budget: float = 0.1,
+    ):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.budget = budget
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Return the hedge delay for model, or None if it cannot be hedged yet."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = sorted(self._latencies.get(model, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        index = min(len(latencies) - 1, int(self.percentile * len(latencies)))
+        return latencies[index]
+
+    def record_latency(self, model: str, seconds: float):
+        """Record how long model took to answer or to start streaming."""
+        with self._lock:
+            if model not in self._latencies:
+                self._latencies[model] = collections.deque(maxlen=self.window_size)
+            self._latencies[model].append(seconds)
+
+    def record_request(self):
+        """Count a request that could be hedged."""
+        with self._lock:
+            self.requests += 1
+
+    def acquire_hedge(self) -> bool:
+        """Take a hedge from the budget, returning False if it is spent."""
+        with self._lock:
+            if self.hedged >= self.budget * self.requests + 1:
+                return False
+            self.hedged += 1
+            return True
+
+    def record_hedge_win(self):
+        """Count a hedge that answered before the original request."""
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> dict:
+        """Return request, hedge and hedge win counts and the current delays."""
+        with self._lock:
+            models = list(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+        stats["delays"] = {model: self.hedge_delay(model) for model in models}
+        return stats
+
+
+def race(
+    primary: Callable[[], Any],
+    backup: Callable[[], Any],
+    delay: float,
+    allow_hedge: Callable[[], bool],
+    discard: Optional[Callable[[Any], None]] = None,
+) -> Tuple[Any, int]:
+    """
+    Call primary, and backup too if primary has not returned after delay seconds
+    and allow_hedge() agrees.
+
+    Returns the first successful result and the index of the call that produced
+    it (0 for primary, 1 for backup). A blocking call cannot be cancelled, so the
+    loser runs to completion in its thread and its result is passed to discard.
+    If every call fails, the error of primary is raised.
+    """
+    futures = [run_in_thread(primary)]
+    done, _ = concurrent.futures.wait(futures, timeout=delay)
+    if not done and allow_hedge():
+        futures.append(run_in_thread(backup))
+
+    pending = set(futures)
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            if future.exception() is None:
+                if discard is not None:
+                    for loser in pending:
+                        loser.add_done_callback(lambda f: _discard(f, discard))
+                return future.result(), futures.index(future)
+    return futures[0].result()
+
+
+def _discard(future, discard):
+    if future.exception() is None:
+        discard(future.result())
+
+
+async def arace(
+    primary: Callable[[], Awaitable[Any]],
+    backup: Callable[[], Awaitable[Any]],
+    delay: float,
+    allow_hedge: Callable[[], bool],
+    discard: Optional[Callable[[Any], Awaitable[None]]] = None,
+) -> Tuple[Any, int]:
+    """
+    Async version of race. The loser is cancelled.
+    """
+    tasks = [asyncio.ensure_future(primary())]
+    pending = set(tasks)
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done and allow_hedge():
+            tasks.append(asyncio.ensure_future(backup()))
+            pending = set(tasks)
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = next((task for task in done if task.exception() is None), None)
+            if winner is not None:
+                if discard is not None:
+                    for loser in done - {winner}:
+                        if loser.exception() is None:
+                            await discard(loser.result())
+                return winner.result(), tasks.index(winner)
+        return tasks[0].result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def open_stream(create_stream: Callable[[], Any]) -> Tuple[Any, Iterator]:
+    """Start a stream and wait for its first chunk, returning both."""
+    stream = iter(create_stream())
+    return next(stream, _END), stream
+
+
+def continue_stream(first_chunk, stream):
+    """Yield the first chunk taken by open_stream, then the rest of the stream."""
+    if first_chunk is not _END:
+        yield first_chunk
+        yield from stream
+
+
+async def aopen_stream(create_stream: Callable[[], Awaitable[Any]]):
+    """Async version of open_stream. A cancelled stream is closed."""
+    stream = await create_stream()
+    try:
+        return await anext(stream, _END), stream
+    except asyncio.CancelledError:
+        await stream.aclose()
+        raise
+
+
+async def acontinue_stream(first_chunk, stream):
+    """Async version of continue_stream."""
+    if first_chunk is not _END:
+        yield first_chunk
+        async for chunk in stream:
+            yield chunk
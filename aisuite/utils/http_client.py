@@ -0,0 +1,93 @@
+"""Pooled HTTP transport for providers that talk to their API through httpx."""
+
+import threading
+from typing import Optional
+
+import httpx
+
+DEFAULT_TIMEOUT = 30
+
+
+class PooledHttpClient:
+    """
+    Long-lived httpx.Client and httpx.AsyncClient owned by one provider instance.
+
+    Reusing the clients keeps connections alive between requests, so only the first
+    request to a host pays for the TCP and TLS handshakes. Both clients are created
+    lazily on first use and are safe to share between threads; the async client
+    should be used from a single event loop.
+
+    The following keys are read from the provider config dict:
+        timeout: Request timeout in seconds, or an httpx.Timeout (default 30).
+        max_connections: Maximum number of concurrent connections (default 100).
+        max_keepalive_connections: Idle connections kept in the pool (default 20).
+        keepalive_expiry: Seconds an idle connection is kept open (default 5.0).
+        http2: Enable HTTP/2. Requires the `h2` package (default False).
+    """
+
+    CONFIG_KEYS = (
+        "timeout",
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+        "http2",
+    )
+
+    def __init__(
+        self,
+        timeout=DEFAULT_TIMEOUT,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "PooledHttpClient":
+        """Create a pooled client from the transport keys of a provider config."""
+        return cls(**{key: config[key] for key in cls.CONFIG_KEYS if key in config})
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared synchronous client."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout, limits=self.limits, http2=self.http2
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared asynchronous client."""
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = httpx.AsyncClient(
+                        timeout=self.timeout, limits=self.limits, http2=self.http2
+                    )
+        return self._async_client
+
+    def close(self):
+        """Close the synchronous client and release its connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Close both clients and release their connections."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -0,0 +1,156 @@
+"""Token-bucket rate limiting of requests and tokens per minute."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Optional
+
+# Rough number of characters per token, used to estimate prompt size.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: list, kwargs: dict) -> int:
+    """
+    Estimate the tokens a request will consume before it is sent.
+
+    The prompt is estimated from the serialized messages and tools, and the
+    completion from max_tokens (or max_completion_tokens) when given. The estimate is
+    only used for admission; it is corrected from the reported usage afterwards.
+    """
+
+    def default(value):
+        if hasattr(value, "model_dump"):
+            return value.model_dump(exclude_none=True)
+        return str(value)
+
+    prompt = json.dumps([messages, kwargs.get("tools")], default=default)
+    completion = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 0
+    return len(prompt) // CHARS_PER_TOKEN + completion
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at rate_per_minute.
+
+    reserve() takes tokens immediately and lets the balance go negative, returning
+    how long the caller must wait for the debt to be refilled. Callers are thereby
+    admitted in the order they reserved, and a request larger than the capacity is
+    still admitted once its share of the rate has accrued.
+
+    Args:
+        rate_per_minute: Tokens added per minute.
+        capacity: Most tokens the bucket holds, i.e. the largest burst. Defaults to
+            rate_per_minute.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take amount tokens and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    def adjust(self, amount: float):
+        """Return amount tokens to the bucket, or take them if negative."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    @property
+    def available(self) -> float:
+        """Tokens available now; negative while reservations are waiting."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Admits requests within a requests-per-minute and a tokens-per-minute budget.
+
+    Each request reserves one request and its estimated tokens, then waits until
+    both buckets have covered them. Once the response arrives, reconcile() replaces
+    the estimate with the tokens actually used.
+
+        reservation = limiter.acquire(estimated_tokens)
+        response = provider.chat_completions_create(...)
+        limiter.reconcile(reservation, response.usage)
+
+    Args:
+        requests_per_minute: Request budget, or None for no request limit.
+        tokens_per_minute: Token budget, or None for no token limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        self.requests = (
+            TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    def acquire(self, estimated_tokens: int = 0) -> int:
+        """
+        Block until the request is admitted.
+
+        Returns the tokens reserved, to be passed to reconcile() or release().
+        """
+        time.sleep(self._reserve(estimated_tokens))
+        return estimated_tokens
+
+    async def aacquire(self, estimated_tokens: int = 0) -> int:
+        """Async version of acquire. A cancelled wait returns its tokens."""
+        try:
+            await asyncio.sleep(self._reserve(estimated_tokens))
+        except asyncio.CancelledError:
+            # The request was never sent, so neither budget was used.
+            if self.requests is not None:
+                self.requests.adjust(1)
+            self.release(estimated_tokens)
+            raise
+        return estimated_tokens
+
+    def reconcile(self, reserved_tokens: int, usage):
+        """Correct the reservation to the usage reported by the provider, if any."""
+        total_tokens = getattr(usage, "total_tokens", None)
+        if self.tokens is not None and total_tokens is not None:
+            self.tokens.adjust(reserved_tokens - total_tokens)
+
+    def release(self, reserved_tokens: int):
+        """Return the tokens of a request that failed before consuming them."""
+        if self.tokens is not None:
+            self.tokens.adjust(reserved_tokens)
+
+    def stats(self) -> dict:
+        """Return the requests and tokens currently available."""
+        return {
+            "requests_available": self.requests.available if self.requests else None,
+            "tokens_available": self.tokens.available if self.tokens else None,
+        }
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        wait = 0.0
+        if self.requests is not None:
+            wait = self.requests.reserve(1)
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.reserve(estimated_tokens))
+        return wait
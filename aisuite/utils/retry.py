@@ -0,0 +1,103 @@
+"""Retrying of provider calls that fail with transient errors."""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from aisuite.provider import classify_error
+
+
+class RetryPolicy:
+    """
+    Retries a call while it fails with a retryable error and its budget lasts.
+
+    Errors are classified with classify_error: rate limits, overload, timeouts and
+    connection failures are retried, anything else is raised at once. Delays grow
+    exponentially from initial_delay up to max_delay with full jitter, and are never
+    shorter than the Retry-After the provider asked for. Each request gets its own
+    budget of max_attempts calls and max_elapsed seconds; a retry that would
+    overrun the budget is not attempted and the last error is raised.
+
+    Args:
+        max_attempts: Calls per request, including the first one.
+        initial_delay: Upper bound of the first delay, in seconds.
+        max_delay: Cap on the exponential delay, in seconds.
+        multiplier: Growth factor of the delay per attempt.
+        jitter: Draw each delay uniformly between 0 and its bound, so that clients
+            throttled together do not retry in lockstep.
+        max_elapsed: Seconds a request may spend on attempts and delays, or None
+            for no time budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        max_elapsed: Optional[float] = 120.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+
+    def next_delay(
+        self, attempt: int, error: BaseException, elapsed: float = 0.0
+    ) -> Optional[float]:
+        """
+        Return the seconds to wait before retrying after a failed attempt, or None
+        if the error should be raised.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1.
+            error: The error it failed with.
+            elapsed: Seconds spent on the request so far.
+        """
+        error = classify_error(error)
+        if not error.retryable or attempt >= self.max_attempts:
+            return None
+        delay = min(
+            self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1)
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def call(self, func: Callable[[], Any]) -> Any:
+        """Call func, retrying it according to the policy."""
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self.next_delay(attempt, e, time.monotonic() - start)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of call."""
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                delay = self.next_delay(attempt, e, time.monotonic() - start)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
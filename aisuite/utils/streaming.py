@@ -0,0 +1,355 @@
+"""Helpers for producing and consuming streams of ChatCompletionChunk."""
+
+import json
+import time
+import uuid
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple
+
+from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChoiceDeltaFunctionCall,
+    ChoiceDeltaToolCall,
+    ChunkChoice,
+)
+from aisuite.framework.message import (
+    ChatCompletionMessageToolCall,
+    CompletionUsage,
+    Function,
+    ResponseMetrics,
+)
+
+_SSE_DATA_PREFIX = "data:"
+_SSE_DONE = "[DONE]"
+
+
+def generate_chunk_id() -> str:
+    """Generate an id for streams whose provider does not supply one."""
+    return f"chatcmpl-{uuid.uuid4().hex}"
+
+
+def iter_sse_json(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse the JSON payloads of a server-sent event stream, stopping at [DONE]."""
+    for line in lines:
+        data = _parse_sse_line(line)
+        if data is _SSE_DONE:
+            return
+        if data is not None:
+            yield data
+
+
+async def aiter_sse_json(lines: AsyncIterable[str]) -> AsyncIterator[dict]:
+    """Async version of iter_sse_json."""
+    async for line in lines:
+        data = _parse_sse_line(line)
+        if data is _SSE_DONE:
+            return
+        if data is not None:
+            yield data
+
+
+def _parse_sse_line(line: str):
+    """Return the JSON payload of an SSE data line, _SSE_DONE, or None to skip it."""
+    line = line.strip()
+    if not line.startswith(_SSE_DATA_PREFIX):
+        return None
+    data = line[len(_SSE_DATA_PREFIX) :].strip()
+    if data == _SSE_DONE:
+        return _SSE_DONE
+    return json.loads(data) if data else None
+
+
+def to_completion_usage(usage) -> Optional[CompletionUsage]:
+    """Convert a usage object or dict from any provider to CompletionUsage."""
+    if usage is None or isinstance(usage, CompletionUsage):
+        return usage
+    if hasattr(usage, "model_dump"):
+        usage = usage.model_dump()
+    return CompletionUsage.model_validate(usage)
+
+
+def response_to_chunks(response) -> Iterator[ChatCompletionChunk]:
+    """
+    Replay a complete chat completion response as a stream of chunks.
+
+    Used for providers without native streaming, so that stream=True works with
+    every provider. The whole message arrives in one chunk, followed by a chunk
+    with usage and metrics when the response reports them.
+    """
+    chunk_id = getattr(response, "id", None) or generate_chunk_id()
+    created = getattr(response, "created", None) or int(time.time())
+    model = getattr(response, "model", None)
+
+    choice = response.choices[0]
+    message = choice.message
+    tool_calls = getattr(message, "tool_calls", None)
+
+    delta = ChoiceDelta(
+        role="assistant",
+        content=message.content,
+        reasoning_content=getattr(message, "reasoning_content", None),
+    )
+    if tool_calls:
+        delta.tool_calls = [
+            ChoiceDeltaToolCall(
+                index=index,
+                id=tool_call.id,
+                type="function",
+                function=ChoiceDeltaFunctionCall(
+                    name=tool_call.function.name,
+                    arguments=tool_call.function.arguments,
+                ),
+            )
+            for index, tool_call in enumerate(tool_calls)
+        ]
+
+    finish_reason = choice.finish_reason or ("tool_calls" if tool_calls else "stop")
+    yield ChatCompletionChunk(
+        id=chunk_id,
+        created=created,
+        model=model,
+        choices=[ChunkChoice(delta=delta, finish_reason=finish_reason)],
+    )
+
+    usage = to_completion_usage(getattr(response, "usage", None))
+    metrics = getattr(response, "metrics", None)
+    if usage is not None or metrics is not None:
+        yield ChatCompletionChunk(
+            id=chunk_id, created=created, model=model, usage=usage, metrics=metrics
+        )
+
+
+class StreamAccumulator:
+    """
+    Folds a stream of chunks back into a complete ChatCompletionResponse.
+
+    Content and reasoning deltas are concatenated, and tool-call fragments are
+    assembled by index into complete tool calls.
+
+        accumulator = StreamAccumulator()
+        for chunk in stream:
+            accumulator.add(chunk)
+        response = accumulator.response()
+    """
+
+    def __init__(self):
+        self.id = None
+        self.model = None
+        self.usage: Optional[CompletionUsage] = None
+        self.metrics: Optional[ResponseMetrics] = None
+        self.finish_reason = None
+        self._content = []
+        self._reasoning = []
+        self._tool_calls = {}
+
+    def add(self, chunk: ChatCompletionChunk) -> ChatCompletionChunk:
+        """Record a chunk and return it unchanged."""
+        self.id = self.id or chunk.id
+        self.model = self.model or chunk.model
+        if chunk.usage is not None:
+            self.usage = chunk.usage
+        if chunk.metrics is not None:
+            self.metrics = chunk.metrics
+
+        for choice in chunk.choices:
+            if choice.index != 0:
+                continue
+            delta = choice.delta
+            if delta.content:
+                self._content.append(delta.content)
+            if delta.reasoning_content:
+                self._reasoning.append(delta.reasoning_content)
+            for tool_call in delta.tool_calls or []:
+                self._add_tool_call_delta(tool_call)
+            if choice.finish_reason:
+                self.finish_reason = choice.finish_reason
+        return chunk
+
+    def _add_tool_call_delta(self, delta: ChoiceDeltaToolCall):
+        tool_call = self._tool_calls.setdefault(
+            delta.index, {"id": None, "name": "", "arguments": []}
+        )
+        if delta.id:
+            tool_call["id"] = delta.id
+        if delta.function:
+            if delta.function.name:
+                tool_call["name"] += delta.function.name
+            if delta.function.arguments:
+                tool_call["arguments"].append(delta.function.arguments)
+
+    def response(self) -> ChatCompletionResponse:
+        """Build the response for the chunks seen so far."""
+        response = ChatCompletionResponse()
+        response.usage = self.usage
+        response.metrics = self.metrics
+        choice = response.choices[0]
+        choice.finish_reason = self.finish_reason
+        choice.message.content = "".join(self._content) or None
+        choice.message.reasoning_content = "".join(self._reasoning) or None
+        if self._tool_calls:
+            choice.message.tool_calls = [
+                ChatCompletionMessageToolCall(
+                    id=tool_call["id"] or f"call_{index}",
+                    type="function",
+                    function=Function(
+                        name=tool_call["name"],
+                        arguments="".join(tool_call["arguments"]) or "{}",
+                    ),
+                )
+                for index, tool_call in sorted(self._tool_calls.items())
+            ]
+        return response
+
+
+class ThinkingStreamSplitter:
+    """
+    Incrementally separates <think>...</think> reasoning from answer text.
+
+    Streaming counterpart of Completions._extract_thinking_content. Text is fed in
+    as it arrives and comes back as (reasoning, content) pieces, so the answer can
+    be shown as soon as the think block closes. Tags split across chunks are
+    handled by holding back the few characters that could start a tag.
+
+    As in the non-streaming extraction, a think block is only recognized at the
+    start of the content, and whitespace around the reasoning and at the start of
+    the answer is dropped. A think block that never closes is reported as
+    reasoning.
+    """
+
+    OPEN_TAG = "<think>"
+    CLOSE_TAG = "</think>"
+
+    _START, _THINKING, _AFTER_THINKING, _ANSWER = range(4)
+
+    def __init__(self):
+        self._state = self._START
+        self._buffer = ""
+        self._reasoning_started = False
+
+    def feed(self, text: str) -> Tuple[str, str]:
+        """Consume the next piece of content and return (reasoning, content)."""
+        if self._state == self._ANSWER:
+            return "", text
+
+        self._buffer += text
+        if self._state == self._START:
+            stripped = self._buffer.lstrip()
+            if not stripped or self.OPEN_TAG.startswith(stripped):
+                # Not enough text yet to tell whether a think block starts.
+                return "", ""
+            if not stripped.startswith(self.OPEN_TAG):
+                self._state = self._ANSWER
+                return "", self._take_buffer()
+            self._state = self._THINKING
+            self._buffer = stripped[len(self.OPEN_TAG) :]
+
+        if self._state == self._THINKING:
+            if not self._reasoning_started:
+                self._buffer = self._buffer.lstrip()
+            end = self._buffer.find(self.CLOSE_TAG)
+            if end == -1:
+                # Hold back a possible partial closing tag and trailing whitespace,
+                # which is dropped if the block closes right after it.
+                keep = _partial_suffix_length(self._buffer, self.CLOSE_TAG)
+                reasoning = self._buffer[: len(self._buffer) - keep].rstrip()
+                self._buffer = self._buffer[len(reasoning) :]
+                self._reasoning_started = self._reasoning_started or bool(reasoning)
+                return reasoning, ""
+            reasoning = self._buffer[:end].rstrip()
+            self._buffer = self._buffer[end + len(self.CLOSE_TAG) :]
+            self._state = self._AFTER_THINKING
+            return reasoning, self._feed_answer_start()
+
+        return "", self._feed_answer_start()
+
+    def flush(self) -> Tuple[str, str]:
+        """Return whatever is still held back once the stream has ended."""
+        text = self._take_buffer()
+        if self._state == self._THINKING:
+            return text.strip(), ""
+        if self._state == self._START:
+            self._state = self._ANSWER
+        return "", text
+
+    def _feed_answer_start(self) -> str:
+        """Drop whitespace between the think block and the answer."""
+        self._buffer = self._buffer.lstrip()
+        if not self._buffer:
+            return ""
+        self._state = self._ANSWER
+        return self._take_buffer()
+
+    def _take_buffer(self) -> str:
+        text, self._buffer = self._buffer, ""
+        return text
+
+    def apply(self, chunk: ChatCompletionChunk) -> ChatCompletionChunk:
+        """
+        Rewrite the content delta of chunk into reasoning and content deltas.
+
+        Held-back text is released on the chunk that carries the finish reason.
+        """
+        for choice in chunk.choices:
+            if choice.index != 0:
+                continue
+            delta = choice.delta
+            reasoning, content = self.feed(delta.content) if delta.content else ("", "")
+            if choice.finish_reason:
+                flushed_reasoning, flushed_content = self.flush()
+                reasoning += flushed_reasoning
+                content += flushed_content
+            delta.reasoning_content = (
+                delta.reasoning_content or ""
+            ) + reasoning or None
+            delta.content = content or None
+        return chunk
+
+    def flush_chunk(self, last_chunk: ChatCompletionChunk):
+        """Return a chunk carrying held-back text, or None if nothing is left."""
+        reasoning, content = self.flush()
+        if not reasoning and not content:
+            return None
+        delta = ChoiceDelta(
+            content=content or None, reasoning_content=reasoning or None
+        )
+        return ChatCompletionChunk(
+            id=last_chunk.id if last_chunk else None,
+            created=last_chunk.created if last_chunk else None,
+            model=last_chunk.model if last_chunk else None,
+            choices=[ChunkChoice(delta=delta)],
+        )
+
+
+def _partial_suffix_length(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for length in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:length]):
+            return length
+    return 0
+
+
+def split_thinking(
+    chunks: Iterable[ChatCompletionChunk],
+) -> Iterator[ChatCompletionChunk]:
+    """Apply a ThinkingStreamSplitter to a stream of chunks."""
+    splitter = ThinkingStreamSplitter()
+    chunk = None
+    for chunk in chunks:
+        yield splitter.apply(chunk)
+    leftover = splitter.flush_chunk(chunk)
+    if leftover is not None:
+        yield leftover
+
+
+async def asplit_thinking(
+    chunks: AsyncIterable[ChatCompletionChunk],
+) -> AsyncIterator[ChatCompletionChunk]:
+    """Async version of split_thinking."""
+    splitter = ThinkingStreamSplitter()
+    chunk = None
+    async for chunk in chunks:
+        yield splitter.apply(chunk)
+    leftover = splitter.flush_chunk(chunk)
+    if leftover is not None:
+        yield leftover
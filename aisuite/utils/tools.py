@@ -1,13 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Any, Type, Optional
 from pydantic import BaseModel, create_model, Field, ValidationError
+import asyncio
+import copy
 import inspect
 import json
+import threading
+import weakref
 from docstring_parser import parse
 
+from .concurrency import call_with_timeout
+
+# Process-wide cache of (tool_spec, param_model) inferred from function signatures,
+# keyed on the function object. Weak keys let dynamically created functions be
+# garbage collected together with their cache entry.
+_inferred_specs = weakref.WeakKeyDictionary()
+_inferred_specs_lock = threading.Lock()
+
 
 class Tools:
-    def __init__(self, tools: list[Callable] = None):
+    def __init__(
+        self,
+        tools: list[Callable] = None,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            tools: Functions to register as tools.
+            max_workers: Size of the thread pool used when tool calls are executed
+                in parallel. Defaults to one thread per tool call.
+            timeout: Seconds each tool call may run before a TimeoutError is raised.
+                Defaults to no limit.
+        """
         self._tools = {}
+        self.max_workers = max_workers
+        self.timeout = timeout
         if tools:
             for tool in tools:
                 self._add_tool(tool)
@@ -18,12 +46,13 @@ class Tools:
         if param_model:
             tool_spec = self._convert_to_tool_spec(func, param_model)
         else:
-            tool_spec, param_model = self.__infer_from_signature(func)
+            tool_spec, param_model = self._infer_from_signature_cached(func)
 
         self._tools[func.__name__] = {
             "function": func,
             "param_model": param_model,
             "spec": tool_spec,
+            "is_async": inspect.iscoroutinefunction(func),
         }
 
     # Return tools in the specified format (default OpenAI).
@@ -85,6 +114,25 @@ class Tools:
             },
         }
 
+    def _infer_from_signature_cached(
+        self, func: Callable
+    ) -> tuple[Dict[str, Any], Type[BaseModel]]:
+        """Infer the tool spec and param model of func, reusing earlier inferences."""
+        try:
+            with _inferred_specs_lock:
+                cached = _inferred_specs.get(func)
+        except TypeError:  # func cannot be weakly referenced
+            return self.__infer_from_signature(func)
+
+        if cached is None:
+            cached = self.__infer_from_signature(func)
+            with _inferred_specs_lock:
+                _inferred_specs[func] = cached
+
+        tool_spec, param_model = cached
+        # Callers own their spec, so hand out a copy of the cached one.
+        return copy.deepcopy(tool_spec), param_model
+
     def __extract_param_descriptions(self, func: Callable) -> dict[str, str]:
         """Extract parameter descriptions from function docstring.
 
@@ -214,72 +262,147 @@ class Tools:
             if tool_name not in self._tools:
                 raise ValueError(f"Tool '{tool_name}' not registered.")
 
-            tool = self._tools[tool_name]
-            tool_func = tool["function"]
-            param_model = tool["param_model"]
-
-            # Validate and parse the arguments with Pydantic if a model exists
-            try:
-                validated_args = param_model(**arguments)
-                result = tool_func(**validated_args.model_dump())
-                results.append(result)
-            except ValidationError as e:
-                raise ValueError(f"Error in tool '{tool_name}' parameters: {e}")
+            results.append(self._run_tool(tool_name, arguments))
 
         return results
 
-    def execute_tool(self, tool_calls) -> tuple[list, list]:
+    def execute_tool(
+        self, tool_calls, parallel: bool = False, timeout: Optional[float] = None
+    ) -> tuple[list, list]:
         """Executes registered tools based on the tool calls from the model.
 
         Args:
             tool_calls: List of tool calls from the model
+            parallel: Run the tool calls concurrently on a thread pool of
+                max_workers threads instead of one after another
+            timeout: Seconds each tool call may run; overrides the instance timeout
 
         Returns:
             List of tuples containing (result, result_message) for each tool call
         """
-        results = []
-        messages = []
-
         # Handle single tool call or list of tool calls
         if not isinstance(tool_calls, list):
             tool_calls = [tool_calls]
 
-        for tool_call in tool_calls:
-            # Handle both dictionary and object-style tool calls
-            if isinstance(tool_call, dict):
-                tool_name = tool_call["function"]["name"]
-                arguments = tool_call["function"]["arguments"]
-                tool_call_id = tool_call["id"]
-            else:
-                tool_name = tool_call.function.name
-                arguments = tool_call.function.arguments
-                tool_call_id = tool_call.id
+        calls = [self._parse_tool_call(tool_call) for tool_call in tool_calls]
+        timeout = self.timeout if timeout is None else timeout
+
+        def run(call):
+            tool_name, arguments, _ = call
+            return call_with_timeout(
+                lambda: self._run_tool(tool_name, arguments), timeout
+            )
+
+        if parallel and len(calls) > 1:
+            # map() keeps the results in the order of the tool calls.
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers or len(calls)
+            ) as executor:
+                results = list(executor.map(run, calls))
+        else:
+            results = [run(call) for call in calls]
 
-            # Ensure arguments is a dict
-            if isinstance(arguments, str):
-                arguments = json.loads(arguments)
+        return results, self._to_tool_messages(calls, results)
 
-            if tool_name not in self._tools:
-                raise ValueError(f"Tool '{tool_name}' not registered.")
+    async def aexecute_tool(
+        self, tool_calls, timeout: Optional[float] = None
+    ) -> tuple[list, list]:
+        """Async version of execute_tool.
 
-            tool = self._tools[tool_name]
-            tool_func = tool["function"]
-            param_model = tool["param_model"]
+        All tool calls of the turn run together with asyncio.gather: async tools are
+        awaited on the running loop and plain functions run in worker threads.
 
-            # Validate and parse the arguments with Pydantic if a model exists
+        Args:
+            tool_calls: List of tool calls from the model
+            timeout: Seconds each tool call may run; overrides the instance timeout
+
+        Returns:
+            List of tuples containing (result, result_message) for each tool call
+        """
+        if not isinstance(tool_calls, list):
+            tool_calls = [tool_calls]
+
+        calls = [self._parse_tool_call(tool_call) for tool_call in tool_calls]
+        timeout = self.timeout if timeout is None else timeout
+
+        async def run(call):
+            tool_name, arguments, _ = call
             try:
-                validated_args = param_model(**arguments)
-                result = tool_func(**validated_args.model_dump())
-                results.append(result)
-                messages.append(
-                    {
-                        "role": "tool",
-                        "name": tool_name,
-                        "content": json.dumps(result),
-                        "tool_call_id": tool_call_id,
-                    }
+                return await asyncio.wait_for(
+                    self._arun_tool(tool_name, arguments), timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Tool '{tool_name}' did not complete within {timeout} seconds"
                 )
-            except ValidationError as e:
-                raise ValueError(f"Error in tool '{tool_name}' parameters: {e}")
 
-        return results, messages
+        results = list(await asyncio.gather(*(run(call) for call in calls)))
+        return results, self._to_tool_messages(calls, results)
+
+    def _to_tool_messages(self, calls: list, results: list) -> list:
+        """Build the tool result messages for parsed tool calls and their results."""
+        return [
+            {
+                "role": "tool",
+                "name": tool_name,
+                "content": json.dumps(result),
+                "tool_call_id": tool_call_id,
+            }
+            for (tool_name, _, tool_call_id), result in zip(calls, results)
+        ]
+
+    def _parse_tool_call(self, tool_call) -> tuple[str, dict, Optional[str]]:
+        """Return the (name, arguments, id) of a tool call, checking it is registered."""
+        # Handle both dictionary and object-style tool calls
+        if isinstance(tool_call, dict):
+            tool_name = tool_call["function"]["name"]
+            arguments = tool_call["function"]["arguments"]
+            tool_call_id = tool_call["id"]
+        else:
+            tool_name = tool_call.function.name
+            arguments = tool_call.function.arguments
+            tool_call_id = tool_call.id
+
+        # Ensure arguments is a dict
+        if isinstance(arguments, str):
+            arguments = json.loads(arguments)
+
+        if tool_name not in self._tools:
+            raise ValueError(f"Tool '{tool_name}' not registered.")
+
+        return tool_name, arguments, tool_call_id
+
+    def _validate_arguments(self, tool_name: str, arguments: dict) -> dict:
+        """Validate and parse the arguments of a registered tool with its Pydantic model."""
+        try:
+            validated_args = self._tools[tool_name]["param_model"](**arguments)
+        except ValidationError as e:
+            raise ValueError(f"Error in tool '{tool_name}' parameters: {e}")
+        return validated_args.model_dump()
+
+    def _run_tool(self, tool_name: str, arguments: dict):
+        """Validate the arguments of a registered tool and call it."""
+        tool = self._tools[tool_name]
+        kwargs = self._validate_arguments(tool_name, arguments)
+        if tool["is_async"]:
+            return self._run_coroutine(tool["function"](**kwargs))
+        return tool["function"](**kwargs)
+
+    @staticmethod
+    def _run_coroutine(coroutine):
+        """Run an async tool to completion from synchronous code."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # asyncio.run() cannot be nested in a running loop, so use a worker thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def _arun_tool(self, tool_name: str, arguments: dict):
+        """Validate the arguments of a registered tool and await it."""
+        tool = self._tools[tool_name]
+        kwargs = self._validate_arguments(tool_name, arguments)
+        if tool["is_async"]:
+            return await tool["function"](**kwargs)
+        return await asyncio.to_thread(tool["function"], **kwargs)
@@ -0,0 +1,362 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aisuite import AsyncClient
+from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.message import ChatCompletionMessageToolCall, Function
+
+
+@pytest.fixture
+def messages():
+    return [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Who won the world series in 2020?"},
+    ]
+
+
+def _text_response(content):
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = content
+    return response
+
+
+def test_async_client_uses_native_async_provider(messages):
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        new_callable=AsyncMock,
+    ) as mock_acreate:
+        mock_acreate.return_value = _text_response("Dodgers")
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        response = asyncio.run(
+            client.chat.completions.create(
+                "openai:gpt-4o", messages=messages, temperature=0.2
+            )
+        )
+
+        mock_acreate.assert_awaited_once_with("gpt-4o", messages, temperature=0.2)
+        assert response.choices[0].message.content == "Dodgers"
+
+
+def test_async_client_falls_back_to_thread_for_sync_provider(messages):
+    with patch(
+        "aisuite.providers.aws_provider.AwsProvider.chat_completions_create"
+    ) as mock_create:
+        mock_create.return_value = _text_response("Dodgers")
+        client = AsyncClient({"aws": {}})
+
+        response = asyncio.run(
+            client.chat.completions.create("aws:claude-v3", messages=messages)
+        )
+
+        mock_create.assert_called_once_with("claude-v3", messages)
+        assert response.choices[0].message.content == "Dodgers"
+
+
+def test_async_client_runs_many_completions_concurrently(messages):
+    in_flight = 0
+    peak = 0
+
+    async def fake_acreate(model, messages, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _text_response(model)
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        side_effect=fake_acreate,
+    ):
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    client.chat.completions.create("openai:gpt-4o", messages=messages)
+                    for _ in range(50)
+                ]
+            )
+
+        responses = asyncio.run(run())
+
+    assert len(responses) == 50
+    assert peak == 50
+
+
+@pytest.mark.parametrize("use_async_tool", [False, True])
+def test_async_client_tool_runner(messages, use_async_tool):
+    def get_score(team: str) -> dict:
+        """Get the series score for a team."""
+        return {"team": team, "wins": 4}
+
+    async def aget_score(team: str) -> dict:
+        """Get the series score for a team."""
+        await asyncio.sleep(0)
+        return {"team": team, "wins": 4}
+
+    if use_async_tool:
+        aget_score.__name__ = "get_score"
+        get_score = aget_score
+
+    tool_response = ChatCompletionResponse()
+    tool_response.choices[0].message.tool_calls = [
+        ChatCompletionMessageToolCall(
+            id="call_1",
+            type="function",
+            function=Function(name="get_score", arguments='{"team": "Dodgers"}'),
+        )
+    ]
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        new_callable=AsyncMock,
+    ) as mock_acreate:
+        mock_acreate.side_effect = [tool_response, _text_response("Dodgers won 4-2")]
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        response = asyncio.run(
+            client.chat.completions.create(
+                "openai:gpt-4o", messages=messages, tools=[get_score], max_turns=2
+            )
+        )
+
+    assert mock_acreate.await_count == 2
+    assert response.choices[0].message.content == "Dodgers won 4-2"
+    tool_message = response.choices[0].intermediate_messages[1]
+    assert tool_message["tool_call_id"] == "call_1"
+    assert tool_message["content"] == '{"team": "Dodgers", "wins": 4}'
+    assert len(response.intermediate_responses) == 1
+
+
+def test_async_create_many(messages):
+    async def fake_acreate(model, messages, **kwargs):
+        if model == "broken":
+            raise ValueError("model failed")
+        await asyncio.sleep(1 if model == "slow" else 0.01)
+        return _text_response(model)
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        side_effect=fake_acreate,
+    ):
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        results = asyncio.run(
+            client.chat.completions.create_many(
+                ["openai:gpt-4o", "openai:broken", "openai:slow"],
+                messages=messages,
+                timeout=0.2,
+                max_concurrency=2,
+            )
+        )
+
+    assert results[0].choices[0].message.content == "gpt-4o"
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], TimeoutError)
+
+
+def test_async_client_stream(messages):
+    from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
+
+    async def fake_astream(model, messages, **kwargs):
+        for text in ["Dod", "gers"]:
+            yield ChatCompletionChunk.model_validate(
+                {"choices": [{"delta": {"content": text}}]}
+            )
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create_stream",
+        side_effect=fake_astream,
+    ):
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        async def run():
+            stream = await client.chat.completions.create(
+                "openai:gpt-4o", messages=messages, stream=True
+            )
+            return [chunk.choices[0].delta.content async for chunk in stream]
+
+        assert asyncio.run(run()) == ["Dod", "gers"]
+
+
+def test_async_stream_opening_is_retried(messages):
+    from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
+    from aisuite.provider import RateLimitError
+    from aisuite.utils.retry import RetryPolicy
+
+    calls = []
+
+    async def fake_astream(model, messages, **kwargs):
+        calls.append(model)
+        if len(calls) == 1:
+            raise RateLimitError("Rate limited", retry_after=0)
+        yield ChatCompletionChunk.model_validate(
+            {"choices": [{"delta": {"content": "Dodgers"}}]}
+        )
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create_stream",
+        side_effect=fake_astream,
+    ):
+        client = AsyncClient(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            retry=RetryPolicy(initial_delay=0),
+        )
+
+        async def run():
+            stream = await client.chat.completions.create(
+                "openai:gpt-4o", messages=messages, stream=True
+            )
+            return [chunk.choices[0].delta.content async for chunk in stream]
+
+        assert asyncio.run(run()) == ["Dodgers"]
+    assert len(calls) == 2
+
+
+def test_async_client_response_cache(messages):
+    from aisuite.utils.cache import MemoryCache
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        new_callable=AsyncMock,
+    ) as mock_acreate:
+        mock_acreate.return_value = _text_response("Dodgers")
+        client = AsyncClient(
+            {"openai": {"api_key": "test_openai_api_key"}}, cache=MemoryCache()
+        )
+
+        async def run():
+            return [
+                await client.chat.completions.create("openai:gpt-4o", messages=messages)
+                for _ in range(3)
+            ]
+
+        responses = asyncio.run(run())
+
+    assert mock_acreate.await_count == 1
+    assert [r.choices[0].message.content for r in responses] == ["Dodgers"] * 3
+
+
+def test_async_fallback_chain(messages):
+    from aisuite.provider import RateLimitError
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        new_callable=AsyncMock,
+    ) as mock_acreate:
+        mock_acreate.side_effect = [
+            RateLimitError("Rate limited", status_code=429),
+            _text_response("Dodgers"),
+        ]
+        client = AsyncClient({"openai": {"api_key": "test_openai_api_key"}})
+
+        response = asyncio.run(
+            client.chat.completions.create(
+                ["openai:gpt-4o", "openai:gpt-4o-mini"], messages=messages
+            )
+        )
+
+    assert response.served_by == "openai:gpt-4o-mini"
+    assert [call.args[0] for call in mock_acreate.await_args_list] == [
+        "gpt-4o",
+        "gpt-4o-mini",
+    ]
+    first, second = (call.args[1] for call in mock_acreate.await_args_list)
+    assert first is not second
+
+    with pytest.raises(ValueError, match="max_turns"):
+        asyncio.run(
+            client.chat.completions.create(
+                ["openai:gpt-4o", "openai:gpt-4o-mini"],
+                messages=messages,
+                tools=[],
+                max_turns=2,
+            )
+        )
+
+
+def test_async_hedged_stream(messages):
+    from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
+
+    async def fake_astream(model, messages, **kwargs):
+        if model == "gpt-4o":
+            await asyncio.sleep(1)
+        yield ChatCompletionChunk.model_validate(
+            {"choices": [{"delta": {"content": model}}]}
+        )
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create_stream",
+        side_effect=fake_astream,
+    ):
+        client = AsyncClient(
+            {"openai": {"api_key": "test_openai_api_key"}}, hedging={"delay": 0.05}
+        )
+
+        async def run():
+            stream = await client.chat.completions.create(
+                "openai:gpt-4o",
+                messages=messages,
+                stream=True,
+                hedge="openai:gpt-4o-mini",
+            )
+            return [chunk.choices[0].delta.content async for chunk in stream]
+
+        assert asyncio.run(run()) == ["gpt-4o-mini"]
+    assert client.hedging.stats()["hedge_wins"] == 1
+
+
+def test_async_hedge_records_the_latency_of_a_cancelled_original(messages):
+    async def acreate(model, messages, **kwargs):
+        await asyncio.sleep(1 if model == "gpt-4o" else 0)
+        return _text_response(model)
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        side_effect=acreate,
+    ):
+        client = AsyncClient(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            hedging={"delay": 0.05},
+        )
+        response = asyncio.run(
+            client.chat.completions.create(
+                "openai:gpt-4o", messages=messages, hedge="openai:gpt-4o-mini"
+            )
+        )
+
+    assert response.served_by == "openai:gpt-4o-mini"
+    # The original was cancelled, but how long it had taken still counts.
+    (latency,) = client.hedging._latencies["openai:gpt-4o"]
+    assert latency >= 0.05
+
+
+def test_async_client_coalesces_identical_requests(messages):
+    async def slow_acreate(model, messages, **kwargs):
+        await asyncio.sleep(0.05)
+        return _text_response("Dodgers")
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.achat_completions_create",
+        side_effect=slow_acreate,
+    ) as mock_acreate:
+        client = AsyncClient(
+            {"openai": {"api_key": "test_openai_api_key"}}, coalesce=True
+        )
+
+        async def run():
+            return await asyncio.gather(
+                *[
+                    client.chat.completions.create("openai:gpt-4o", messages=messages)
+                    for _ in range(10)
+                ]
+            )
+
+        responses = asyncio.run(run())
+
+    assert mock_acreate.call_count == 1
+    assert [r.choices[0].message.content for r in responses] == ["Dodgers"] * 10
@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -160,3 +162,557 @@ def test_invalid_model_format_in_create(monkeypatch):
         ValueError, match=r"Invalid model format. Expected 'provider:model'"
     ):
         client.chat.completions.create(invalid_model, messages=messages)
+
+
+def test_concurrent_requests_create_a_provider_once():
+    def slow_create_provider(provider_key, config):
+        time.sleep(0.05)
+        return Mock()
+
+    client = Client({})
+    with patch(
+        "aisuite.client.ProviderFactory.create_provider",
+        side_effect=slow_create_provider,
+    ) as mock_create_provider:
+        threads = [
+            threading.Thread(
+                target=client.chat.completions._get_provider, args=("openai",)
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    mock_create_provider.assert_called_once()
+
+
+def test_create_many_returns_results_in_order_with_errors():
+    def fake_create(model, messages, **kwargs):
+        if model == "broken":
+            raise ValueError("model failed")
+        time.sleep(0.2)
+        return f"response from {model}"
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=fake_create,
+    ):
+        client = Client({"openai": {"api_key": "test_openai_api_key"}})
+        messages = [{"role": "user", "content": "Tell me a joke."}]
+
+        start = time.monotonic()
+        results = client.chat.completions.create_many(
+            ["openai:gpt-4o", "openai:broken", "openai:gpt-4o-mini", "bad-model"],
+            messages=messages,
+        )
+        elapsed = time.monotonic() - start
+
+    assert results[0] == "response from gpt-4o"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "response from gpt-4o-mini"
+    assert isinstance(results[3], ValueError)
+    # Both successful calls sleep 0.2s; run concurrently they finish in ~0.2s.
+    assert elapsed < 0.35
+
+
+def test_create_many_timeout_and_concurrency_limit():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_create(model, messages, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.5 if model.startswith("slow") else 0.05)
+        with lock:
+            in_flight -= 1
+        return model
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=fake_create,
+    ):
+        client = Client({"openai": {"api_key": "test_openai_api_key"}})
+        models = ["openai:slow-0", "openai:slow-1"] + [
+            f"openai:fast-{i}" for i in range(4)
+        ]
+
+        results = client.chat.completions.create_many(
+            models,
+            messages=[{"role": "user", "content": "Hi"}],
+            timeout=0.2,
+            max_concurrency=2,
+        )
+
+    assert isinstance(results[0], TimeoutError)
+    assert isinstance(results[1], TimeoutError)
+    assert results[2:] == [f"fast-{i}" for i in range(4)]
+    # Timed-out calls keep their slots until they return.
+    assert peak == 2
+
+
+def test_tool_runner_executes_tool_calls_in_parallel():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.framework.message import ChatCompletionMessageToolCall, Function
+
+    def slow_lookup(key: str) -> dict:
+        """Looks up a key."""
+        time.sleep(0.2)
+        return {"key": key}
+
+    tool_response = ChatCompletionResponse()
+    tool_response.choices[0].message.tool_calls = [
+        ChatCompletionMessageToolCall(
+            id=f"call_{key}",
+            type="function",
+            function=Function(name="slow_lookup", arguments=f'{{"key": "{key}"}}'),
+        )
+        for key in "abc"
+    ]
+    final_response = ChatCompletionResponse()
+    final_response.choices[0].message.content = "done"
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=[tool_response, final_response],
+    ):
+        client = Client({"openai": {"api_key": "test_openai_api_key"}})
+
+        start = time.monotonic()
+        response = client.chat.completions.create(
+            "openai:gpt-4o",
+            messages=[{"role": "user", "content": "Look up a, b and c."}],
+            tools=[slow_lookup],
+            max_turns=2,
+            parallel_tools=True,
+            tool_timeout=5,
+        )
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 0.4
+    tool_messages = response.choices[0].intermediate_messages[1:4]
+    assert [message["tool_call_id"] for message in tool_messages] == [
+        "call_a",
+        "call_b",
+        "call_c",
+    ]
+
+
+def test_stream_replays_response_for_providers_without_native_streaming():
+    from aisuite.framework import ChatCompletionResponse
+
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = "Dodgers"
+
+    with patch(
+        "aisuite.providers.deepseek_provider.DeepseekProvider.chat_completions_create",
+        return_value=response,
+    ) as mock_create:
+        client = Client({"deepseek": {"api_key": "deepseek-api-key"}})
+        chunks = list(
+            client.chat.completions.create(
+                "deepseek:deepseek-chat",
+                messages=[{"role": "user", "content": "Who won?"}],
+                stream=True,
+                temperature=0.1,
+            )
+        )
+
+    mock_create.assert_called_once_with(
+        "deepseek-chat", [{"role": "user", "content": "Who won?"}], temperature=0.1
+    )
+    assert chunks[0].choices[0].delta.content == "Dodgers"
+    assert chunks[0].choices[0].finish_reason == "stop"
+
+
+def test_stream_rejects_automatic_tool_execution():
+    def lookup(key: str) -> str:
+        """Looks up a key."""
+        return key
+
+    client = Client({"openai": {"api_key": "test_openai_api_key"}})
+    with pytest.raises(ValueError, match="stream=True"):
+        client.chat.completions.create(
+            "openai:gpt-4o",
+            messages=[{"role": "user", "content": "Hi"}],
+            tools=[lookup],
+            max_turns=2,
+            stream=True,
+        )
+
+
+def test_stream_opening_is_retried_and_guarded_by_the_circuit_breaker():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.provider import CircuitOpenError, OverloadedError, RateLimitError
+    from aisuite.utils.retry import RetryPolicy
+
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = "Dodgers"
+    messages = [{"role": "user", "content": "Who won?"}]
+
+    with patch(
+        "aisuite.providers.deepseek_provider.DeepseekProvider.chat_completions_create",
+        side_effect=[RateLimitError("Rate limited", retry_after=0), response],
+    ) as mock_create:
+        client = Client(
+            {"deepseek": {"api_key": "deepseek-api-key"}},
+            retry=RetryPolicy(initial_delay=0),
+        )
+        stream = client.chat.completions.create(
+            "deepseek:deepseek-chat", messages=messages, stream=True
+        )
+        assert mock_create.call_count == 2
+        assert next(stream).choices[0].delta.content == "Dodgers"
+
+    with patch(
+        "aisuite.providers.deepseek_provider.DeepseekProvider.chat_completions_create",
+        side_effect=OverloadedError("Overloaded", status_code=529),
+    ) as mock_create:
+        client = Client(
+            {"deepseek": {"api_key": "deepseek-api-key"}},
+            circuit_breaker={"minimum_calls": 2},
+        )
+        for _ in range(2):
+            with pytest.raises(OverloadedError):
+                client.chat.completions.create(
+                    "deepseek:deepseek-chat", messages=messages, stream=True
+                )
+        with pytest.raises(CircuitOpenError):
+            client.chat.completions.create(
+                "deepseek:deepseek-chat", messages=messages, stream=True
+            )
+
+    assert mock_create.call_count == 2
+
+
+def test_response_cache_answers_repeated_requests():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.utils.cache import MemoryCache
+
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = "Dodgers"
+    messages = [{"role": "user", "content": "Who won?"}]
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        return_value=response,
+    ) as mock_create:
+        cache = MemoryCache()
+        client = Client({"openai": {"api_key": "test_openai_api_key"}}, cache=cache)
+
+        first = client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, temperature=0
+        )
+        second = client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, temperature=0
+        )
+        client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, temperature=0.5
+        )
+        client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, temperature=0, use_cache=False
+        )
+
+    assert mock_create.call_count == 3
+    assert second.choices[0].message.content == "Dodgers"
+    assert second is not first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_adaptive_concurrency_limits_requests_per_provider():
+    from aisuite.framework import ChatCompletionResponse
+
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_create(model, messages, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return ChatCompletionResponse()
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=fake_create,
+    ):
+        client = Client(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            adaptive_concurrency={"initial_limit": 2, "max_limit": 2},
+        )
+        client.chat.completions.create_many(
+            ["openai:gpt-4o"] * 8, messages=[{"role": "user", "content": "Hi"}]
+        )
+
+    assert peak == 2
+    assert client.concurrency_stats() == {
+        "openai": {"limit": 2, "in_flight": 0, "queued": 0}
+    }
+
+
+def test_rate_limits_apply_per_model_and_reconcile_usage():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.framework.message import CompletionUsage
+
+    response = ChatCompletionResponse()
+    response.usage = CompletionUsage(
+        prompt_tokens=10, completion_tokens=20, total_tokens=30
+    )
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        return_value=response,
+    ):
+        client = Client(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            rate_limits={
+                "openai": {"requests_per_minute": 60, "tokens_per_minute": 10000}
+            },
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+        client.chat.completions.create(
+            "openai:gpt-4o", messages=messages, max_tokens=1000
+        )
+
+    assert client.get_rate_limiter("deepseek", "deepseek-chat") is None
+    assert client.get_rate_limiter(
+        "openai", "gpt-4o-mini"
+    ) is not client.get_rate_limiter("openai", "gpt-4o")
+    stats = client.get_rate_limiter("openai", "gpt-4o").stats()
+    assert stats["requests_available"] == pytest.approx(59, abs=0.1)
+    assert stats["tokens_available"] == pytest.approx(9970, abs=1)
+
+
+def test_retry_policy_retries_transient_provider_errors():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.provider import RateLimitError
+    from aisuite.utils.retry import RetryPolicy
+
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = "Dodgers"
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=[RateLimitError("Rate limited", retry_after=0), response],
+    ) as mock_create:
+        client = Client(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            retry=RetryPolicy(initial_delay=0),
+        )
+        result = client.chat.completions.create(
+            "openai:gpt-4o", messages=[{"role": "user", "content": "Who won?"}]
+        )
+
+    assert mock_create.call_count == 2
+    assert result.choices[0].message.content == "Dodgers"
+
+
+def test_circuit_breaker_fails_fast_per_model():
+    from aisuite.provider import CircuitOpenError, OverloadedError
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=OverloadedError("Overloaded", status_code=529),
+    ) as mock_create:
+        client = Client(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            circuit_breaker={"minimum_calls": 2, "per_model": True},
+        )
+        messages = [{"role": "user", "content": "Hi"}]
+        for _ in range(2):
+            with pytest.raises(OverloadedError):
+                client.chat.completions.create("openai:gpt-4o", messages=messages)
+        with pytest.raises(CircuitOpenError):
+            client.chat.completions.create("openai:gpt-4o", messages=messages)
+        with pytest.raises(OverloadedError):
+            client.chat.completions.create("openai:gpt-4o-mini", messages=messages)
+
+    assert mock_create.call_count == 3
+    stats = client.circuit_stats()
+    assert stats["openai:gpt-4o"]["state"] == "open"
+    assert stats["openai:gpt-4o-mini"]["state"] == "closed"
+
+
+def test_resilience_options_accept_true_for_defaults():
+    client = Client(adaptive_concurrency=True, circuit_breaker=True)
+    assert client.get_limiter("openai") is not None
+    assert client.get_circuit_breaker("openai", "gpt-4o") is client.get_circuit_breaker(
+        "openai", "gpt-4o-mini"
+    )
+    assert Client().get_circuit_breaker("openai", "gpt-4o") is None
+
+
+def test_fallback_chain_moves_on_after_transient_errors_and_deadlines():
+    from aisuite.framework import ChatCompletionResponse
+    from aisuite.provider import NonRetryableError, OverloadedError
+
+    def answer(content):
+        response = ChatCompletionResponse()
+        response.choices[0].message.content = content
+        return response
+
+    def slow_create(model, messages, **kwargs):
+        time.sleep(1)
+        return answer("too late")
+
+    messages = [{"role": "user", "content": "Who won?"}]
+    with (
+        patch(
+            "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+            side_effect=OverloadedError("Overloaded", status_code=529),
+        ) as mock_openai,
+        patch(
+            "aisuite.providers.deepseek_provider.DeepseekProvider.chat_completions_create",
+            return_value=answer("Dodgers"),
+        ) as mock_deepseek,
+    ):
+        client = Client(
+            {
+                "openai": {"api_key": "test_openai_api_key"},
+                "deepseek": {"api_key": "test_deepseek_api_key"},
+            },
+            fallbacks={"best": ["openai:gpt-4o", "deepseek:deepseek-chat"]},
+        )
+
+        response = client.chat.completions.create(
+            "best", messages=messages, temperature=0
+        )
+        assert response.served_by == "deepseek:deepseek-chat"
+        assert response.choices[0].message.content == "Dodgers"
+        mock_openai.assert_called_once_with("gpt-4o", messages, temperature=0)
+        mock_deepseek.assert_called_once_with("deepseek-chat", messages, temperature=0)
+        # Each target gets its own copy of the messages.
+        assert mock_openai.call_args.args[1] is not mock_deepseek.call_args.args[1]
+
+        mock_openai.side_effect = NonRetryableError("Bad request", status_code=400)
+        with pytest.raises(NonRetryableError):
+            client.chat.completions.create(
+                ["openai:gpt-4o", "deepseek:deepseek-chat"], messages=messages
+            )
+
+        mock_openai.side_effect = slow_create
+        response = client.chat.completions.create(
+            ["openai:gpt-4o", "deepseek:deepseek-chat"],
+            messages=messages,
+            fallback_timeout=0.1,
+        )
+        assert response.served_by == "deepseek:deepseek-chat"
+
+    with pytest.raises(ValueError, match="max_turns"):
+        client.chat.completions.create("best", messages=messages, tools=[], max_turns=2)
+
+
+def test_hedged_request_uses_the_faster_model():
+    from aisuite.framework import ChatCompletionResponse
+
+    seen = []
+
+    def answer(content, seconds):
+        def create(model, messages, **kwargs):
+            # Providers may consume the message list, as Anthropic once did.
+            seen.append(messages.pop(0)["content"] if messages else None)
+            time.sleep(seconds)
+            response = ChatCompletionResponse()
+            response.choices[0].message.content = content
+            return response
+
+        return create
+
+    with (
+        patch(
+            "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+            side_effect=answer("slow", 0.5),
+        ),
+        patch(
+            "aisuite.providers.deepseek_provider.DeepseekProvider.chat_completions_create",
+            side_effect=answer("fast", 0),
+        ),
+    ):
+        client = Client(
+            {
+                "openai": {"api_key": "test_openai_api_key"},
+                "deepseek": {"api_key": "test_deepseek_api_key"},
+            },
+            hedging={"delay": 0.05},
+        )
+        response = client.chat.completions.create(
+            "openai:gpt-4o",
+            messages=[{"role": "user", "content": "Hi"}],
+            hedge="deepseek:deepseek-chat",
+        )
+
+    assert response.choices[0].message.content == "fast"
+    assert response.served_by == "deepseek:deepseek-chat"
+    assert seen == ["Hi", "Hi"]
+    stats = client.hedging.stats()
+    assert (stats["requests"], stats["hedged"], stats["hedge_wins"]) == (1, 1, 1)
+
+    with pytest.raises(ValueError, match="max_turns"):
+        client.chat.completions.create(
+            "openai:gpt-4o", messages=[], hedge=True, max_turns=2, tools=[]
+        )
+
+
+def test_coalesce_shares_identical_concurrent_requests():
+    from aisuite.framework import ChatCompletionResponse
+
+    def slow_create(model, messages, **kwargs):
+        time.sleep(0.2)
+        response = ChatCompletionResponse()
+        response.choices[0].message.content = "positive"
+        return response
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=slow_create,
+    ) as mock_create:
+        client = Client({"openai": {"api_key": "test_openai_api_key"}}, coalesce=True)
+        results = client.chat.completions.create_many(
+            ["openai:gpt-4o"] * 5,
+            messages=[{"role": "user", "content": "Classify: great product"}],
+        )
+
+    assert mock_create.call_count == 1
+    assert [r.choices[0].message.content for r in results] == ["positive"] * 5
+    assert len({id(r) for r in results}) == 5
+    assert client.single_flight.stats() == {"in_flight": 0, "coalesced": 4}
+
+
+def test_hedge_to_the_same_model_is_not_coalesced_with_the_original():
+    from aisuite.framework import ChatCompletionResponse
+
+    delays = iter([0.5, 0])
+
+    def create(model, messages, **kwargs):
+        seconds = next(delays)
+        time.sleep(seconds)
+        response = ChatCompletionResponse()
+        response.choices[0].message.content = f"after {seconds}s"
+        return response
+
+    with patch(
+        "aisuite.providers.openai_provider.OpenaiProvider.chat_completions_create",
+        side_effect=create,
+    ) as mock_create:
+        client = Client(
+            {"openai": {"api_key": "test_openai_api_key"}},
+            hedging={"delay": 0.05},
+            coalesce=True,
+        )
+        response = client.chat.completions.create(
+            "openai:gpt-4o", messages=[{"role": "user", "content": "Hi"}], hedge=True
+        )
+        assert mock_create.call_count == 2
+
+    assert response.choices[0].message.content == "after 0s"
+    assert client.hedging.stats()["hedge_wins"] == 1
+    assert client.single_flight.stats()["coalesced"] == 0
@@ -1,9 +1,85 @@
 """Tests for the AnthropicMessageConverter."""
 
+import asyncio
 import unittest
-from unittest.mock import MagicMock
-from aisuite.providers.anthropic_provider import AnthropicMessageConverter
+from unittest.mock import AsyncMock, MagicMock, patch
+from aisuite.provider import OverloadedError
+from aisuite.providers.anthropic_provider import (
+    AnthropicMessageConverter,
+    AnthropicProvider,
+)
 from aisuite.framework import ChatCompletionResponse
+from aisuite.utils.streaming import StreamAccumulator
+
+# SSE payloads recorded from a streamed response that answers and calls a tool.
+STREAM_EVENTS = [
+    {
+        "type": "message_start",
+        "message": {
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-3-5-sonnet-20240620",
+            "content": [],
+            "stop_reason": None,
+            "usage": {
+                "input_tokens": 12,
+                "output_tokens": 1,
+                "cache_read_input_tokens": 1800,
+                "cache_creation_input_tokens": 200,
+            },
+        },
+    },
+    {
+        "type": "content_block_start",
+        "index": 0,
+        "content_block": {"type": "text", "text": ""},
+    },
+    {"type": "ping"},
+    {
+        "type": "content_block_delta",
+        "index": 0,
+        "delta": {"type": "text_delta", "text": "Checking the "},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 0,
+        "delta": {"type": "text_delta", "text": "weather."},
+    },
+    {"type": "content_block_stop", "index": 0},
+    {
+        "type": "content_block_start",
+        "index": 1,
+        "content_block": {
+            "type": "tool_use",
+            "id": "toolu_1",
+            "name": "get_weather",
+            "input": {},
+        },
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": ""},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": '{"location": "San'},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": ' Francisco"}'},
+    },
+    {"type": "content_block_stop", "index": 1},
+    {
+        "type": "message_delta",
+        "delta": {"stop_reason": "tool_use", "stop_sequence": None},
+        "usage": {"output_tokens": 40},
+    },
+    {"type": "message_stop"},
+]
 
 
 class TestAnthropicMessageConverter(unittest.TestCase):
@@ -35,6 +111,11 @@ class TestAnthropicMessageConverter(unittest.TestCase):
         self.assertEqual(
             converted_messages, [{"role": "user", "content": "What is the weather?"}]
         )
+        # The request can be converted again, e.g. when it is retried.
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(
+            self.converter.convert_request(messages)[0], "You are a helpful assistant."
+        )
 
     def test_convert_request_with_tool_use_message(self):
         """Test converting a request with a tool use message."""
@@ -210,6 +291,190 @@ class TestAnthropicMessageConverter(unittest.TestCase):
             ],
         )
 
+    def test_convert_response_with_parallel_tool_use(self):
+        """Test that every tool_use block becomes a tool call."""
+        response = MagicMock()
+        response.stop_reason = "tool_use"
+        response.usage.input_tokens = 20
+        response.usage.output_tokens = 10
+        text_mock = MagicMock()
+        text_mock.type = "text"
+        text_mock.text = "Checking both cities."
+        tool_uses = []
+        for tool_id, city in [("tool1", "Paris"), ("tool2", "Tokyo")]:
+            tool_use_mock = MagicMock()
+            tool_use_mock.type = "tool_use"
+            tool_use_mock.id = tool_id
+            tool_use_mock.name = "get_weather"
+            tool_use_mock.input = {"location": city}
+            tool_uses.append(tool_use_mock)
+        response.content = [text_mock, *tool_uses]
+
+        message = self.converter.convert_response(response).choices[0].message
+
+        self.assertEqual(message.content, "Checking both cities.")
+        self.assertEqual([call.id for call in message.tool_calls], ["tool1", "tool2"])
+        self.assertEqual(
+            message.tool_calls[1].function.arguments, '{"location": "Tokyo"}'
+        )
+
+    def test_convert_request_merges_consecutive_tool_results(self):
+        """Test that the results of parallel tool calls share one user turn."""
+        messages = [
+            {"role": "user", "content": "Weather in Paris and Tokyo?"},
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": tool_id,
+                        "type": "function",
+                        "function": {
+                            "name": "get_weather",
+                            "arguments": f'{{"location": "{city}"}}',
+                        },
+                    }
+                    for tool_id, city in [("tool1", "Paris"), ("tool2", "Tokyo")]
+                ],
+            },
+            {"role": "tool", "tool_call_id": "tool1", "content": "Sunny"},
+            {"role": "tool", "tool_call_id": "tool2", "content": "Rainy"},
+            {"role": "user", "content": "Thanks!"},
+        ]
+
+        _, converted_messages = self.converter.convert_request(messages)
+
+        self.assertEqual(
+            [message["role"] for message in converted_messages],
+            ["user", "assistant", "user", "user"],
+        )
+        self.assertEqual(
+            [block["tool_use_id"] for block in converted_messages[2]["content"]],
+            ["tool1", "tool2"],
+        )
+        self.assertEqual(converted_messages[3]["content"], "Thanks!")
+
+
+class TestAnthropicStreamConversion(unittest.TestCase):
+    """Tests for converting recorded stream events to chunks."""
+
+    def setUp(self):
+        self.converter = AnthropicMessageConverter()
+
+    def test_convert_stream(self):
+        chunks = list(self.converter.convert_stream(STREAM_EVENTS))
+
+        self.assertEqual(chunks[0].choices[0].delta.role, "assistant")
+        self.assertEqual(chunks[0].id, "msg_1")
+        self.assertEqual(chunks[1].choices[0].delta.content, "Checking the ")
+        tool_start = chunks[3].choices[0].delta.tool_calls[0]
+        self.assertEqual((tool_start.index, tool_start.id), (0, "toolu_1"))
+        self.assertEqual(tool_start.function.name, "get_weather")
+        self.assertEqual(chunks[-2].choices[0].finish_reason, "tool_calls")
+
+        usage = chunks[-1].usage
+        self.assertEqual(usage.prompt_tokens, 12)
+        self.assertEqual(usage.completion_tokens, 40)
+        self.assertEqual(usage.total_tokens, 52)
+        self.assertEqual(usage.prompt_tokens_details.cached_tokens, 1800)
+        self.assertEqual(usage.prompt_tokens_details.cache_creation_tokens, 200)
+
+    def test_convert_stream_assembles_tool_arguments(self):
+        accumulator = StreamAccumulator()
+        for chunk in self.converter.convert_stream(STREAM_EVENTS):
+            accumulator.add(chunk)
+        message = accumulator.response().choices[0].message
+
+        self.assertEqual(message.content, "Checking the weather.")
+        self.assertEqual(message.tool_calls[0].id, "toolu_1")
+        self.assertEqual(
+            message.tool_calls[0].function.arguments, '{"location": "San Francisco"}'
+        )
+
+    def test_convert_stream_raises_on_error_event(self):
+        events = [
+            STREAM_EVENTS[0],
+            {
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            },
+        ]
+
+        with self.assertRaises(OverloadedError) as context:
+            list(self.converter.convert_stream(events))
+
+        self.assertIn("overloaded_error", str(context.exception))
+
+    def test_provider_streams_sync_and_async(self):
+        provider = AnthropicProvider(api_key="test-api-key")
+        messages = [{"role": "user", "content": "Weather in SF?"}]
+
+        with patch.object(
+            provider.client.messages, "create", return_value=iter(STREAM_EVENTS)
+        ) as mock_create:
+            chunks = list(provider.chat_completions_create_stream("claude-3", messages))
+        self.assertTrue(mock_create.call_args.kwargs["stream"])
+
+        async def events():
+            for event in STREAM_EVENTS:
+                yield event
+
+        async def collect():
+            return [
+                chunk
+                async for chunk in provider.achat_completions_create_stream(
+                    "claude-3", list(messages)
+                )
+            ]
+
+        with patch.object(
+            provider.async_client.messages,
+            "create",
+            new_callable=AsyncMock,
+            return_value=events(),
+        ):
+            async_chunks = asyncio.run(collect())
+
+        self.assertEqual(
+            [chunk.model_dump() for chunk in async_chunks],
+            [chunk.model_dump() for chunk in chunks],
+        )
+
+
+class TestAnthropicProviderToolSpecCache(unittest.TestCase):
+    """Tests for reusing converted tool specs across requests."""
+
+    def test_tool_spec_converted_once_per_tool_set(self):
+        """Equal tool lists are converted once; a different list is converted again."""
+        provider = AnthropicProvider(api_key="test-api-key")
+        tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_weather",
+                    "description": "Get the weather.",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {"location": {"type": "string"}},
+                        "required": ["location"],
+                    },
+                },
+            }
+        ]
+
+        with patch.object(
+            provider.converter,
+            "convert_tool_spec",
+            wraps=provider.converter.convert_tool_spec,
+        ) as mock_convert:
+            first = provider._prepare_kwargs({"tools": tools})
+            second = provider._prepare_kwargs({"tools": [dict(tools[0])]})
+            provider._prepare_kwargs({"tools": tools[:0]})
+
+        self.assertEqual(mock_convert.call_count, 2)
+        self.assertIs(first["tools"], second["tools"])
+        self.assertEqual(first["tools"][0]["name"], "get_weather")
+
 
 if __name__ == "__main__":
     unittest.main()
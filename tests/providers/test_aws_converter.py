@@ -1,10 +1,47 @@
 import unittest
-from unittest.mock import MagicMock
-from aisuite.providers.aws_provider import BedrockMessageConverter
+from unittest.mock import MagicMock, patch
+from aisuite.provider import NonRetryableError, RateLimitError
+from aisuite.providers.aws_provider import AwsProvider, BedrockMessageConverter
+from aisuite.utils.streaming import StreamAccumulator
 from aisuite.framework.message import Message, ChatCompletionMessageToolCall
 from aisuite.framework import ChatCompletionResponse
 
 
+# Events as recorded from a converse_stream call that answers and then calls a tool.
+CONVERSE_STREAM_EVENTS = [
+    {"messageStart": {"role": "assistant"}},
+    {"contentBlockDelta": {"delta": {"text": "Let me "}, "contentBlockIndex": 0}},
+    {"contentBlockDelta": {"delta": {"text": "check."}, "contentBlockIndex": 0}},
+    {"contentBlockStop": {"contentBlockIndex": 0}},
+    {
+        "contentBlockStart": {
+            "start": {"toolUse": {"toolUseId": "tooluse_1", "name": "top_song"}},
+            "contentBlockIndex": 1,
+        }
+    },
+    {
+        "contentBlockDelta": {
+            "delta": {"toolUse": {"input": '{"sign": '}},
+            "contentBlockIndex": 1,
+        }
+    },
+    {
+        "contentBlockDelta": {
+            "delta": {"toolUse": {"input": '"WZPZ"}'}},
+            "contentBlockIndex": 1,
+        }
+    },
+    {"contentBlockStop": {"contentBlockIndex": 1}},
+    {"messageStop": {"stopReason": "tool_use"}},
+    {
+        "metadata": {
+            "usage": {"inputTokens": 30, "outputTokens": 12, "totalTokens": 42},
+            "metrics": {"latencyMs": 812},
+        }
+    },
+]
+
+
 class TestBedrockMessageConverter(unittest.TestCase):
 
     def setUp(self):
@@ -107,6 +144,117 @@ class TestBedrockMessageConverter(unittest.TestCase):
             "The most popular song on WZPZ is Elemental Hotel by 8 Storey Hike.",
         )
 
+    def test_convert_response_metrics(self):
+        response = {
+            "output": {"message": {"role": "assistant", "content": [{"text": "Hi"}]}},
+            "stopReason": "end_turn",
+            "metrics": {"latencyMs": 250},
+        }
+
+        normalized_response = self.converter.convert_response(response)
+
+        self.assertEqual(normalized_response.metrics.latency_ms, 250)
+
+    def test_convert_stream(self):
+        chunks = list(
+            self.converter.convert_stream(CONVERSE_STREAM_EVENTS, model="claude")
+        )
+
+        self.assertEqual(chunks[0].choices[0].delta.role, "assistant")
+        self.assertEqual(chunks[1].choices[0].delta.content, "Let me ")
+        tool_start = chunks[3].choices[0].delta.tool_calls[0]
+        self.assertEqual(tool_start.index, 0)
+        self.assertEqual(tool_start.id, "tooluse_1")
+        self.assertEqual(tool_start.function.name, "top_song")
+        self.assertEqual(chunks[-2].choices[0].finish_reason, "tool_calls")
+        self.assertEqual(chunks[-1].choices, [])
+        self.assertEqual(chunks[-1].usage.total_tokens, 42)
+        self.assertEqual(chunks[-1].metrics.latency_ms, 812)
+        self.assertEqual({chunk.id for chunk in chunks}, {chunks[0].id})
+
+    def test_convert_stream_accumulates_tool_use_input(self):
+        accumulator = StreamAccumulator()
+        for chunk in self.converter.convert_stream(CONVERSE_STREAM_EVENTS):
+            accumulator.add(chunk)
+        response = accumulator.response()
+
+        message = response.choices[0].message
+        self.assertEqual(message.content, "Let me check.")
+        self.assertEqual(message.tool_calls[0].function.arguments, '{"sign": "WZPZ"}')
+        self.assertEqual(response.usage.prompt_tokens, 30)
+        self.assertEqual(response.metrics.latency_ms, 812)
+
+    def test_convert_stream_raises_on_error_event(self):
+        events = [
+            {"messageStart": {"role": "assistant"}},
+            {"throttlingException": {"message": "Too many requests"}},
+        ]
+
+        with self.assertRaises(RateLimitError) as context:
+            list(self.converter.convert_stream(events))
+
+        self.assertIn("Too many requests", str(context.exception))
+
+
+class TestAwsProviderStream(unittest.TestCase):
+    @patch("aisuite.providers.aws_provider.BedrockConfig.create_client")
+    def test_chat_completions_create_stream(self, mock_create_client):
+        mock_client = MagicMock()
+        mock_client.converse_stream.return_value = {
+            "stream": iter(CONVERSE_STREAM_EVENTS)
+        }
+        mock_create_client.return_value = mock_client
+        provider = AwsProvider()
+
+        chunks = list(
+            provider.chat_completions_create_stream(
+                "anthropic.claude-3",
+                [
+                    {"role": "system", "content": "Be brief."},
+                    {"role": "user", "content": "Top song?"},
+                ],
+                temperature=0,
+            )
+        )
+
+        mock_client.converse_stream.assert_called_once_with(
+            modelId="anthropic.claude-3",
+            messages=[{"role": "user", "content": [{"text": "Top song?"}]}],
+            system=[{"text": "Be brief."}],
+            inferenceConfig={"temperature": 0},
+            additionalModelRequestFields={},
+        )
+        self.assertEqual(len(chunks), len(CONVERSE_STREAM_EVENTS) - 2)
+        self.assertEqual(chunks[0].model, "anthropic.claude-3")
+
+    @patch("aisuite.providers.aws_provider.BedrockConfig.create_client")
+    def test_client_errors_are_classified(self, mock_create_client):
+        import botocore.exceptions
+
+        def client_error(code, status_code):
+            return botocore.exceptions.ClientError(
+                {
+                    "Error": {"Code": code, "Message": "Request failed"},
+                    "ResponseMetadata": {"HTTPStatusCode": status_code},
+                },
+                "Converse",
+            )
+
+        mock_client = MagicMock()
+        mock_create_client.return_value = mock_client
+        provider = AwsProvider()
+        messages = [{"role": "user", "content": "Top song?"}]
+
+        mock_client.converse.side_effect = client_error("ThrottlingException", 429)
+        with self.assertRaises(RateLimitError) as context:
+            provider.chat_completions_create("anthropic.claude-3", messages)
+        self.assertEqual(context.exception.status_code, 429)
+
+        mock_client.converse.side_effect = client_error("ValidationException", 400)
+        with self.assertRaises(NonRetryableError) as context:
+            provider.chat_completions_create("anthropic.claude-3", messages)
+        self.assertIn("Request failed", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
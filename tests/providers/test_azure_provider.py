@@ -1,5 +1,11 @@
+import json
 import unittest
-from aisuite.providers.azure_provider import AzureMessageConverter
+
+import httpx
+import respx
+
+from aisuite.provider import LLMError
+from aisuite.providers.azure_provider import AzureMessageConverter, AzureProvider
 from aisuite.framework.message import Message, ChatCompletionMessageToolCall
 from aisuite.framework import ChatCompletionResponse
 
@@ -88,5 +94,128 @@ class TestAzureMessageConverter(unittest.TestCase):
         self.assertEqual(tool_call.function.arguments, '{"location": "London"}')
 
 
+class TestAzureProvider(unittest.TestCase):
+    URL = "https://model.ai.azure.com/chat/completions"
+
+    def setUp(self):
+        self.provider = AzureProvider(
+            api_key="azure-api-key",
+            base_url="https://model.ai.azure.com",
+            api_version="2024-05-01-preview",
+            timeout=10,
+        )
+        self.messages = [{"role": "user", "content": "Hello"}]
+
+    @respx.mock
+    def test_chat_completions_create(self):
+        route = respx.post(self.URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "Hi"}}]},
+            )
+        )
+
+        response = self.provider.chat_completions_create(
+            "azure-model", self.messages, temperature=0.1, stream=True
+        )
+
+        self.assertEqual(response.choices[0].message.content, "Hi")
+        request = route.calls.last.request
+        self.assertEqual(request.url.params["api-version"], "2024-05-01-preview")
+        self.assertEqual(request.headers["Authorization"], "azure-api-key")
+        self.assertEqual(
+            json.loads(request.read()),
+            {"messages": [{"role": "user", "content": "Hello"}], "temperature": 0.1},
+        )
+
+    @respx.mock
+    def test_connections_are_reused(self):
+        respx.post(self.URL).mock(
+            return_value=httpx.Response(
+                200, json={"choices": [{"message": {"content": "Hi"}}]}
+            )
+        )
+
+        self.provider.chat_completions_create("azure-model", self.messages)
+        client = self.provider.http.client
+        self.provider.chat_completions_create("azure-model", self.messages)
+
+        self.assertIs(self.provider.http.client, client)
+        self.assertEqual(client.timeout.read, 10)
+
+    @respx.mock
+    def test_http_error_keeps_status_code(self):
+        respx.post(self.URL).mock(
+            return_value=httpx.Response(429, text="Too many requests")
+        )
+
+        with self.assertRaises(LLMError) as context:
+            self.provider.chat_completions_create("azure-model", self.messages)
+
+        self.assertEqual(context.exception.status_code, 429)
+        self.assertIn("Too many requests", str(context.exception))
+
+    @respx.mock
+    def test_timeout_raises_llm_error(self):
+        respx.post(self.URL).mock(side_effect=httpx.ReadTimeout("timed out"))
+
+        with self.assertRaises(LLMError) as context:
+            self.provider.chat_completions_create("azure-model", self.messages)
+
+        self.assertIsNone(context.exception.status_code)
+        self.assertIn("timed out", str(context.exception))
+
+    @respx.mock
+    def test_invalid_response_raises_llm_error(self):
+        respx.post(self.URL).mock(return_value=httpx.Response(200, text="<html>"))
+
+        with self.assertRaises(LLMError) as context:
+            self.provider.chat_completions_create("azure-model", self.messages)
+
+        self.assertFalse(context.exception.retryable)
+        self.assertIn("invalid response", str(context.exception))
+
+    @respx.mock
+    def test_chat_completions_create_stream(self):
+        body = (
+            'data: {"id": "1", "choices": [{"index": 0, "delta": {"role": "assistant", "content": "Hi"}}]}\n\n'
+            'data: {"id": "1", "choices": [{"index": 0, "delta": {"content": " there"}, "finish_reason": "stop"}]}\n\n'
+            'data: {"id": "1", "choices": [], "usage": {"prompt_tokens": 2, "completion_tokens": 2, "total_tokens": 4}}\n\n'
+            "data: [DONE]\n\n"
+        )
+        route = respx.post(self.URL).mock(
+            return_value=httpx.Response(
+                200, text=body, headers={"Content-Type": "text/event-stream"}
+            )
+        )
+
+        chunks = list(
+            self.provider.chat_completions_create_stream("azure-model", self.messages)
+        )
+
+        self.assertEqual(
+            [c.choices[0].delta.content for c in chunks[:2]], ["Hi", " there"]
+        )
+        self.assertEqual(chunks[1].choices[0].finish_reason, "stop")
+        self.assertEqual(chunks[2].usage.total_tokens, 4)
+        self.assertTrue(json.loads(route.calls.last.request.read())["stream"])
+
+    @respx.mock
+    def test_stream_http_error_keeps_status_code(self):
+        respx.post(self.URL).mock(
+            return_value=httpx.Response(503, text="Service unavailable")
+        )
+
+        with self.assertRaises(LLMError) as context:
+            list(
+                self.provider.chat_completions_create_stream(
+                    "azure-model", self.messages
+                )
+            )
+
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertIn("Service unavailable", str(context.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
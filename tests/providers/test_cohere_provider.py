@@ -3,13 +3,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
-
-
 @pytest.fixture(autouse=True)
 def set_api_key_env_var(monkeypatch):
     """Fixture to set environment variables for tests."""
     monkeypatch.setenv("CO_API_KEY", "test-api-key")
 
+
 @pytest.mark.skip(reason="no way of currently testing this")
 def test_cohere_provider():
     """High-level test that the provider is initialized and chat completions are requested successfully."""
@@ -46,3 +45,64 @@ def test_cohere_provider():
         )
 
         assert response.choices[0].message.content == response_text_content
+
+
+def _tool_call_response():
+    response = MagicMock()
+    response.finish_reason = "TOOL_CALL"
+    response.usage.tokens.input_tokens = 30
+    response.usage.tokens.output_tokens = 20
+    response.message.tool_plan = "I will look up both cities."
+    response.message.tool_calls = []
+    for call_id, city in [("call_1", "Paris"), ("call_2", "Tokyo")]:
+        tool_call = MagicMock()
+        tool_call.id = call_id
+        tool_call.function.name = "get_weather"
+        tool_call.function.arguments = f'{{"location": "{city}"}}'
+        response.message.tool_calls.append(tool_call)
+    return response
+
+
+def test_convert_response_keeps_all_tool_calls():
+    """Test that every requested tool call is converted, with the tool plan."""
+    from aisuite.providers.cohere_provider import CohereMessageConverter
+
+    response = CohereMessageConverter.convert_response(_tool_call_response())
+
+    message = response.choices[0].message
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert message.content == "I will look up both cities."
+    assert [call.id for call in message.tool_calls] == ["call_1", "call_2"]
+    assert message.tool_calls[1].function.arguments == '{"location": "Tokyo"}'
+
+
+def test_convert_request_sends_back_several_tool_results():
+    """Test that a tool call turn and all of its results round-trip to Cohere."""
+    from aisuite.providers.cohere_provider import CohereMessageConverter
+
+    converter = CohereMessageConverter()
+    assistant_message = (
+        converter.convert_response(_tool_call_response()).choices[0].message
+    )
+    messages = [
+        {"role": "user", "content": "Weather in Paris and Tokyo?"},
+        assistant_message,
+        {"role": "tool", "tool_call_id": "call_1", "content": '{"sky": "sunny"}'},
+        {"role": "tool", "tool_call_id": "call_2", "content": '{"sky": "rainy"}'},
+    ]
+
+    converted = converter.convert_request(messages)
+
+    assert converted[1]["tool_plan"] == "I will look up both cities."
+    assert "content" not in converted[1]
+    assert [call["id"] for call in converted[1]["tool_calls"]] == [
+        "call_1",
+        "call_2",
+    ]
+    assert [message["tool_call_id"] for message in converted[2:]] == [
+        "call_1",
+        "call_2",
+    ]
+    assert converted[3]["content"] == [
+        {"type": "document", "document": {"data": '{"sky": "rainy"}'}}
+    ]
@@ -31,12 +31,55 @@ class TestGoogleMessageConverter(unittest.TestCase):
         converted_messages = self.converter.convert_request(messages)
 
         self.assertEqual(len(converted_messages), 1)
-        self.assertEqual(converted_messages[0].function_response.name, "get_weather")
+        self.assertEqual(converted_messages[0].role, "function")
+        function_response = converted_messages[0].parts[0].function_response
+        self.assertEqual(function_response.name, "get_weather")
         self.assertEqual(
-            converted_messages[0].function_response.response,
+            function_response.response,
             {"temperature": "15", "unit": "Celsius"},
         )
 
+    def test_convert_request_parallel_function_calls(self):
+        messages = [
+            {"role": "user", "content": "Weather in Paris and Tokyo?"},
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{city}",
+                        "type": "function",
+                        "function": {
+                            "name": "get_weather",
+                            "arguments": f'{{"location": "{city}"}}',
+                        },
+                    }
+                    for city in ["Paris", "Tokyo"]
+                ],
+            },
+            {"role": "tool", "name": "get_weather", "content": '{"sky": "sunny"}'},
+            {"role": "tool", "name": "get_weather", "content": '{"sky": "rainy"}'},
+        ]
+
+        converted_messages = self.converter.convert_request(messages)
+
+        self.assertEqual(
+            [message.role for message in converted_messages],
+            ["user", "model", "function"],
+        )
+        function_calls = [part.function_call for part in converted_messages[1].parts]
+        self.assertEqual(
+            [dict(call.args) for call in function_calls],
+            [{"location": "Paris"}, {"location": "Tokyo"}],
+        )
+        function_responses = [
+            part.function_response for part in converted_messages[2].parts
+        ]
+        self.assertEqual(
+            [dict(response.response) for response in function_responses],
+            [{"sky": "sunny"}, {"sky": "rainy"}],
+        )
+
     def test_convert_request_assistant_message(self):
         messages = [
             {
@@ -83,6 +126,34 @@ class TestGoogleMessageConverter(unittest.TestCase):
             '{"currency_from": "AUD", "currency_to": "SEK", "currency_date": "latest"}',
         )
 
+    def test_convert_response_with_parallel_function_calls(self):
+        text_part = MagicMock(function_call=None, text="Checking both. ")
+        parts = [text_part]
+        for city in ["Paris", "Tokyo", "Paris"]:
+            function_call_mock = MagicMock()
+            function_call_mock.name = "get_weather"
+            function_call_mock.args = {"location": city}
+            parts.append(MagicMock(function_call=function_call_mock))
+
+        response = MagicMock()
+        response.candidates = [MagicMock(content=MagicMock(parts=parts))]
+
+        message = self.converter.convert_response(response).choices[0].message
+        again = self.converter.convert_response(response).choices[0].message
+
+        self.assertEqual(message.content, "Checking both. ")
+        self.assertEqual(
+            [call.function.arguments for call in message.tool_calls],
+            [
+                '{"location": "Paris"}',
+                '{"location": "Tokyo"}',
+                '{"location": "Paris"}',
+            ],
+        )
+        ids = [call.id for call in message.tool_calls]
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(ids, [call.id for call in again.tool_calls])
+
     def test_convert_response_with_text(self):
         response = MagicMock()
         text_content = "The current exchange rate is 7.50 SEK per AUD."
@@ -85,3 +85,38 @@ def test_groq_provider_with_usage():
         assert response.usage.prompt_tokens == 10
         assert response.usage.completion_tokens == 20
         assert response.usage.total_tokens == 30
+
+
+def test_groq_provider_stream_maps_x_groq_usage():
+    """Tests that streamed chunks are normalized and x_groq usage is surfaced."""
+
+    provider = GroqProvider()
+    content_chunk = MagicMock()
+    content_chunk.model_dump.return_value = {
+        "id": "chunk-1",
+        "choices": [{"index": 0, "delta": {"content": "Hi"}, "finish_reason": None}],
+    }
+    final_chunk = MagicMock()
+    final_chunk.model_dump.return_value = {
+        "id": "chunk-1",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        "x_groq": {
+            "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}
+        },
+    }
+
+    with patch.object(
+        provider.client.chat.completions,
+        "create",
+        return_value=iter([content_chunk, final_chunk]),
+    ) as mock_create:
+        chunks = list(
+            provider.chat_completions_create_stream(
+                "our-favorite-model", [{"role": "user", "content": "Hello!"}]
+            )
+        )
+
+    assert mock_create.call_args.kwargs["stream"] is True
+    assert chunks[0].choices[0].delta.content == "Hi"
+    assert chunks[1].choices[0].finish_reason == "stop"
+    assert chunks[1].usage.total_tokens == 6
@@ -1,5 +1,11 @@
+import asyncio
+import json
+
+import httpx
 import pytest
+import respx
 from unittest.mock import patch, MagicMock
+from aisuite.provider import LLMError
 from aisuite.providers.ollama_provider import OllamaProvider
 
 
@@ -21,8 +27,9 @@ def test_completion():
     ollama = OllamaProvider()
     mock_response = {"message": {"content": response_text_content}}
 
-    with patch(
-        "httpx.post",
+    with patch.object(
+        ollama.http.client,
+        "post",
         return_value=MagicMock(status_code=200, json=lambda: mock_response),
     ) as mock_post:
         response = ollama.chat_completions_create(
@@ -39,7 +46,206 @@ def test_completion():
                 "stream": False,
                 "temperature": chosen_temperature,
             },
-            timeout=30,
         )
 
         assert response.choices[0].message.content == response_text_content
+
+
+def test_async_completion():
+    """Test that async completions request successfully."""
+
+    message_history = [{"role": "user", "content": "Howdy!"}]
+    response_text_content = "mocked-text-response-from-ollama-model"
+
+    ollama = OllamaProvider()
+
+    with respx.mock:
+        route = respx.post("http://localhost:11434/api/chat").mock(
+            return_value=httpx.Response(
+                200, json={"message": {"content": response_text_content}}
+            )
+        )
+        response = asyncio.run(
+            ollama.achat_completions_create(
+                model="best-model-ever", messages=message_history
+            )
+        )
+
+        assert route.called
+        assert response.choices[0].message.content == response_text_content
+
+
+def test_http_client_is_reused_across_requests():
+    """Test that the provider keeps one pooled client configured from its config."""
+    ollama = OllamaProvider(timeout=5, max_connections=8, keepalive_expiry=60)
+
+    assert ollama.http.client is ollama.http.client
+    assert ollama.http.client.timeout.read == 5
+    assert ollama.http.limits.max_connections == 8
+    assert ollama.http.limits.keepalive_expiry == 60
+
+
+FINAL_STATS = {
+    "done": True,
+    "done_reason": "stop",
+    "total_duration": 2_500_000_000,
+    "load_duration": 1_200_000_000,
+    "prompt_eval_count": 26,
+    "prompt_eval_duration": 130_000_000,
+    "eval_count": 50,
+    "eval_duration": 1_000_000_000,
+}
+
+
+def test_completion_reports_usage_and_metrics():
+    """Test that Ollama's counters and durations are kept on the response."""
+    ollama = OllamaProvider()
+
+    with respx.mock:
+        respx.post("http://localhost:11434/api/chat").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "model": "llama3",
+                    "message": {"role": "assistant", "content": "Hi"},
+                    **FINAL_STATS,
+                },
+            )
+        )
+        response = ollama.chat_completions_create(
+            model="llama3", messages=[{"role": "user", "content": "Howdy!"}]
+        )
+
+    assert response.choices[0].finish_reason == "stop"
+    assert response.usage.prompt_tokens == 26
+    assert response.usage.completion_tokens == 50
+    assert response.usage.total_tokens == 76
+    assert response.metrics.latency_ms == 2500
+    assert response.metrics.load_duration_ms == 1200
+    assert response.metrics.eval_duration_ms == 1000
+    assert response.metrics.prompt_tokens_per_second == pytest.approx(200)
+    assert response.metrics.completion_tokens_per_second == pytest.approx(50)
+
+
+NDJSON_BODY = "\n".join(
+    json.dumps(line)
+    for line in [
+        {"model": "llama3", "message": {"role": "assistant", "content": "Hel"}},
+        {"model": "llama3", "message": {"role": "assistant", "content": "lo"}},
+        {"model": "llama3", "message": {"role": "assistant", "content": ""}}
+        | FINAL_STATS,
+    ]
+)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_stream(use_async):
+    """Test that NDJSON lines become chunks ending with usage and metrics."""
+    ollama = OllamaProvider()
+    messages = [{"role": "user", "content": "Howdy!"}]
+
+    async def collect():
+        return [
+            chunk
+            async for chunk in ollama.achat_completions_create_stream(
+                "llama3", messages
+            )
+        ]
+
+    with respx.mock:
+        route = respx.post("http://localhost:11434/api/chat").mock(
+            return_value=httpx.Response(200, text=NDJSON_BODY)
+        )
+        if use_async:
+            chunks = asyncio.run(collect())
+        else:
+            chunks = list(ollama.chat_completions_create_stream("llama3", messages))
+
+    assert json.loads(route.calls.last.request.read())["stream"] is True
+    assert [chunk.choices[0].delta.content for chunk in chunks[:3]] == [
+        "Hel",
+        "lo",
+        None,
+    ]
+    assert chunks[2].choices[0].finish_reason == "stop"
+    assert chunks[3].usage.total_tokens == 76
+    assert chunks[3].metrics.load_duration_ms == 1200
+    assert chunks[3].metrics.completion_tokens_per_second == pytest.approx(50)
+
+
+def test_stream_error_line_raises_llm_error():
+    """Test that an error reported mid-stream raises LLMError."""
+    ollama = OllamaProvider()
+
+    with respx.mock:
+        respx.post("http://localhost:11434/api/chat").mock(
+            return_value=httpx.Response(200, text='{"error": "model not found"}\n')
+        )
+        with pytest.raises(LLMError, match="model not found"):
+            list(ollama.chat_completions_create_stream("missing", []))
+
+
+def test_keep_alive_from_config_is_sent_unless_overridden():
+    """Test that the configured keep_alive is applied to chat requests."""
+    ollama = OllamaProvider(keep_alive="1h")
+    messages = [{"role": "user", "content": "Howdy!"}]
+
+    with respx.mock:
+        route = respx.post("http://localhost:11434/api/chat").mock(
+            return_value=httpx.Response(200, json={"message": {"content": "Hi"}})
+        )
+        ollama.chat_completions_create(model="llama3", messages=messages)
+        ollama.chat_completions_create(model="llama3", messages=messages, keep_alive=-1)
+
+    sent = [json.loads(call.request.read())["keep_alive"] for call in route.calls]
+    assert sent == ["1h", -1]
+
+
+def test_warmup_unload_and_list_loaded():
+    """Test the model residency endpoints."""
+    ollama = OllamaProvider(keep_alive="30m")
+
+    with respx.mock:
+        generate = respx.post("http://localhost:11434/api/generate").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "model": "llama3",
+                    "response": "",
+                    "done": True,
+                    "total_duration": 1_500_000_000,
+                    "load_duration": 1_400_000_000,
+                },
+            )
+        )
+        respx.get("http://localhost:11434/api/ps").mock(
+            return_value=httpx.Response(
+                200,
+                json={"models": [{"name": "llama3:latest", "size_vram": 5137025024}]},
+            )
+        )
+
+        metrics = ollama.warmup("llama3")
+        ollama.warmup("llama3", keep_alive=-1)
+        ollama.unload("llama3")
+        loaded = ollama.list_loaded()
+
+    assert metrics.load_duration_ms == 1400
+    assert [json.loads(call.request.read()) for call in generate.calls] == [
+        {"model": "llama3", "keep_alive": "30m"},
+        {"model": "llama3", "keep_alive": -1},
+        {"model": "llama3", "keep_alive": 0},
+    ]
+    assert [model["name"] for model in loaded] == ["llama3:latest"]
+
+
+def test_residency_calls_raise_llm_error_when_ollama_is_down():
+    """Test that connection failures are reported like chat requests."""
+    ollama = OllamaProvider()
+
+    with respx.mock:
+        respx.get("http://localhost:11434/api/ps").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        with pytest.raises(LLMError, match="Ollama is likely not running"):
+            ollama.list_loaded()
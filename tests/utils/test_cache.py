@@ -0,0 +1,140 @@
+import multiprocessing
+from unittest.mock import Mock, patch
+
+import pytest
+
+from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.message import Message
+from aisuite.utils.cache import (
+    ConversionCache,
+    MemoryCache,
+    SQLiteCache,
+    stable_hash,
+)
+
+
+def test_stable_hash_ignores_key_order():
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})
+
+
+def test_stable_hash_supports_pydantic_models():
+    message = Message(role="user", content="Hi")
+    assert stable_hash([message]) == stable_hash([message.model_dump()])
+
+
+def test_conversion_cache_converts_equal_values_once():
+    cache = ConversionCache()
+    convert = Mock(side_effect=lambda tools: [tool["name"] for tool in tools])
+
+    first = cache.get_or_convert([{"name": "a"}], convert)
+    second = cache.get_or_convert([{"name": "a"}], convert)
+    third = cache.get_or_convert([{"name": "b"}], convert)
+
+    assert first is second
+    assert third == ["b"]
+    assert convert.call_count == 2
+
+
+def test_conversion_cache_evicts_least_recently_used():
+    cache = ConversionCache(maxsize=2)
+    convert = Mock(side_effect=lambda value: value)
+
+    cache.get_or_convert("a", convert)
+    cache.get_or_convert("b", convert)
+    cache.get_or_convert("a", convert)
+    cache.get_or_convert("c", convert)  # evicts "b"
+    cache.get_or_convert("a", convert)
+    cache.get_or_convert("b", convert)
+
+    assert len(cache) == 2
+    assert [call.args[0] for call in convert.call_args_list] == ["a", "b", "c", "b"]
+
+
+def _response(content):
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = content
+    return response
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def response_cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCache()
+    else:
+        cache = SQLiteCache(str(tmp_path / "responses.db"))
+        yield cache
+        cache.close()
+
+
+def test_response_cache_returns_copies_and_counts_hits(response_cache):
+    assert response_cache.get("key") is None
+    response_cache.set("key", _response("Dodgers"))
+
+    first = response_cache.get("key")
+    first.choices[0].message.content = "changed"
+    second = response_cache.get("key")
+
+    assert isinstance(second, ChatCompletionResponse)
+    assert second.choices[0].message.content == "Dodgers"
+    assert response_cache.stats() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+    assert len(response_cache) == 1
+
+    response_cache.clear()
+    assert response_cache.get("key") is None
+
+
+def test_response_cache_skips_unpicklable_values(response_cache):
+    response_cache.set("key", lambda: None)
+    assert response_cache.get("key") is None
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "sqlite"])
+def test_response_cache_ttl(cache_type, tmp_path):
+    if cache_type == "memory":
+        cache = MemoryCache(ttl=60)
+        clock = "aisuite.utils.cache.time.monotonic"
+    else:
+        cache = SQLiteCache(str(tmp_path / "responses.db"), ttl=60)
+        clock = "aisuite.utils.cache.time.time"
+
+    with patch(clock, return_value=1000.0):
+        cache.set("key", _response("Dodgers"))
+    with patch(clock, return_value=1059.0):
+        assert cache.get("key") is not None
+    with patch(clock, return_value=1061.0):
+        assert cache.get("key") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def _write_entry(path):
+    cache = SQLiteCache(path)
+    cache.set("shared", _response("from another process"))
+    cache.close()
+
+
+def test_sqlite_cache_is_shared_across_processes(tmp_path):
+    path = str(tmp_path / "responses.db")
+    cache = SQLiteCache(path)
+
+    process = multiprocessing.get_context("spawn").Process(
+        target=_write_entry, args=(path,)
+    )
+    process.start()
+    process.join(timeout=30)
+
+    assert process.exitcode == 0
+    response = cache.get("shared")
+    assert response.choices[0].message.content == "from another process"
+    cache.close()
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from aisuite.provider import CircuitOpenError, NonRetryableError, OverloadedError
+from aisuite.utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def clock():
+    with patch("aisuite.utils.circuit_breaker.time") as mock_time:
+        mock_time.monotonic.return_value = 0.0
+        yield mock_time
+
+
+def _call(breaker, error=None):
+    try:
+        with breaker.guard():
+            if error is not None:
+                raise error
+    except type(error) if error is not None else ():
+        pass
+
+
+def test_opens_on_failure_rate_and_fails_fast(clock):
+    breaker = CircuitBreaker(minimum_calls=4, window_size=4, open_duration=10)
+    for _ in range(2):
+        _call(breaker)
+    _call(breaker, OverloadedError("Overloaded"))
+    assert breaker.state == "closed"
+    _call(breaker, OverloadedError("Overloaded"))
+    assert breaker.stats() == {
+        "state": "open",
+        "calls": 4,
+        "failure_rate": 0.5,
+        "slow_call_rate": 0.0,
+    }
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        _call(breaker)
+    assert exc_info.value.retry_after == 10
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_non_retryable_errors_do_not_count(clock):
+    breaker = CircuitBreaker(minimum_calls=2)
+    for _ in range(5):
+        _call(breaker, NonRetryableError("Bad request"))
+    assert breaker.state == "closed"
+    assert breaker.stats()["failure_rate"] == 0
+
+
+def test_opens_on_slow_calls(clock):
+    breaker = CircuitBreaker(slow_call_duration=5, minimum_calls=2)
+    for _ in range(2):
+        with breaker.guard():
+            clock.monotonic.return_value += 6
+    assert breaker.state == "open"
+
+
+def test_half_open_probes_close_or_reopen(clock):
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=10, half_open_max_calls=1)
+    _call(breaker, OverloadedError("Overloaded"))
+    assert breaker.state == "open"
+
+    clock.monotonic.return_value = 10.0
+    assert breaker.state == "half_open"
+    with breaker.guard():
+        # Only one probe at a time.
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+    assert breaker.state == "closed"
+
+    _call(breaker, OverloadedError("Overloaded"))
+    clock.monotonic.return_value = 20.0
+    _call(breaker, OverloadedError("Still overloaded"))
+    assert breaker.state == "open"
+    assert breaker.stats()["state"] == "open"
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from aisuite.provider import LLMError
+from aisuite.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    SingleFlight,
+    is_overload_error,
+)
+
+
+def test_is_overload_error_follows_wrapped_errors():
+    request = httpx.Request("POST", "https://example.com")
+    response = httpx.Response(429, request=request)
+    try:
+        try:
+            raise httpx.HTTPStatusError(
+                "rate limited", request=request, response=response
+            )
+        except httpx.HTTPStatusError as e:
+            raise LLMError("Provider error") from e
+    except LLMError as e:
+        assert is_overload_error(e)
+
+    assert is_overload_error(LLMError("Overloaded", status_code=529))
+    assert not is_overload_error(LLMError("Bad request", status_code=400))
+    assert not is_overload_error(ValueError("boom"))
+
+
+def test_limiter_queues_requests_over_the_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+    assert limiter.stats() == {"limit": 2, "in_flight": 2, "queued": 1}
+
+    limiter.release(0.1)
+    thread.join(timeout=1)
+    assert acquired.is_set()
+    assert limiter.stats()["queued"] == 0
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.01)
+    assert limiter.stats()["queued"] == 0
+
+
+def test_limiter_grows_additively_and_halves_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(0.0)
+    assert limiter.limit == 7
+
+    limiter.acquire()
+    limiter.release(None, overloaded=True)
+    assert limiter.limit == 3
+
+
+def test_limiter_shrinks_on_latency_inflation():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    limiter.acquire()
+    limiter.release(0.001)
+    limiter.acquire()
+    limiter.release(0.01)
+    assert limiter.limit == 4
+
+
+def test_limiter_slot_reports_overload_errors():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    with pytest.raises(LLMError):
+        with limiter.slot():
+            raise LLMError("Rate limited", status_code=429)
+    assert limiter.stats() == {"limit": 4, "in_flight": 0, "queued": 0}
+
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("boom")
+    assert limiter.limit == 4
+
+
+def test_limiter_async_slots():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    in_flight = 0
+    peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        async with limiter.aslot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    async def run():
+        await asyncio.gather(*[request() for _ in range(10)])
+
+        # A cancelled waiter leaves the queue.
+        await limiter.aacquire()
+        await limiter.aacquire()
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+    assert peak == 2
+    assert limiter.stats() == {"limit": 2, "in_flight": 2, "queued": 0}
+
+
+def test_single_flight_shares_one_call_between_threads_and_tasks():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = 0
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=1)
+        return {"answer": 42}
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(single_flight.do("key", fetch))
+    )
+    leader.start()
+    time.sleep(0.05)
+    follower = threading.Thread(
+        target=lambda: results.append(single_flight.do("key", fetch))
+    )
+    follower.start()
+
+    async def await_follower():
+        async def never_called():
+            raise AssertionError("follower must not call")
+
+        return await single_flight.ado("key", never_called)
+
+    async def run():
+        task = asyncio.ensure_future(await_follower())
+        await asyncio.sleep(0.05)
+        assert single_flight.stats() == {"in_flight": 1, "coalesced": 2}
+        release.set()
+        return await task
+
+    results.append(asyncio.run(run()))
+    leader.join()
+    follower.join()
+
+    assert calls == 1
+    assert results == [{"answer": 42}] * 3
+    assert results[0] is not results[1]
+    assert single_flight.stats() == {"in_flight": 0, "coalesced": 2}
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        raise LLMError("Provider error")
+
+    async def run():
+        return await asyncio.gather(
+            single_flight.ado("key", fetch),
+            single_flight.ado("key", fetch),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert [type(result) for result in results] == [LLMError, LLMError]
+    assert single_flight.stats() == {"in_flight": 0, "coalesced": 1}
+
+
+def test_single_flight_keeps_the_call_for_waiters_when_the_leader_is_cancelled():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.1)
+        return "Dodgers"
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.ado("key", fetch))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(single_flight.ado("key", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+    leader_result, waiter_result = asyncio.run(run())
+    assert isinstance(leader_result, asyncio.CancelledError)
+    assert waiter_result == "Dodgers"
+    assert single_flight.stats() == {"in_flight": 0, "coalesced": 1}
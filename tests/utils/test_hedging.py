@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import pytest
+
+from aisuite.utils.hedging import (
+    HedgePolicy,
+    acontinue_stream,
+    aopen_stream,
+    arace,
+    continue_stream,
+    open_stream,
+    race,
+)
+
+
+def test_hedge_delay_uses_observed_percentile():
+    policy = HedgePolicy(percentile=0.9, min_samples=10)
+    for seconds in range(1, 10):
+        policy.record_latency("openai:gpt-4o", seconds)
+    assert policy.hedge_delay("openai:gpt-4o") is None
+
+    policy.record_latency("openai:gpt-4o", 10)
+    assert policy.hedge_delay("openai:gpt-4o") == 10
+    assert HedgePolicy(delay=0.5).hedge_delay("openai:gpt-4o") == 0.5
+
+
+def test_hedge_budget_caps_duplicates():
+    policy = HedgePolicy(budget=0.1)
+    hedges = 0
+    for _ in range(50):
+        policy.record_request()
+        hedges += policy.acquire_hedge()
+    assert hedges == 6
+    assert policy.stats() == {
+        "requests": 50,
+        "hedged": 6,
+        "hedge_wins": 0,
+        "delays": {},
+    }
+
+
+def test_race_hedges_slow_primary():
+    def slow():
+        time.sleep(0.5)
+        return "primary"
+
+    assert race(slow, lambda: "backup", 0.01, lambda: True) == ("backup", 1)
+    assert race(lambda: "primary", lambda: "backup", 0.5, lambda: True) == (
+        "primary",
+        0,
+    )
+    assert race(slow, lambda: "backup", 0.01, lambda: False) == ("primary", 0)
+
+
+def test_race_falls_back_to_the_other_call_on_error():
+    def failing():
+        time.sleep(0.05)
+        raise ValueError("primary failed")
+
+    def slow_backup():
+        time.sleep(0.1)
+        return "backup"
+
+    assert race(failing, slow_backup, 0.01, lambda: True) == ("backup", 1)
+    with pytest.raises(ValueError, match="primary failed"):
+        race(failing, failing, 0.01, lambda: True)
+
+
+def test_race_streams_closes_loser():
+    closed = []
+
+    def stream(name, first_delay):
+        try:
+            time.sleep(first_delay)
+            yield f"{name}-1"
+            yield f"{name}-2"
+        finally:
+            closed.append(name)
+
+    (first, stream_iter), winner = race(
+        lambda: open_stream(lambda: stream("primary", 0.3)),
+        lambda: open_stream(lambda: stream("backup", 0)),
+        0.01,
+        lambda: True,
+        discard=lambda opened: opened[1].close(),
+    )
+    assert winner == 1
+    assert list(continue_stream(first, stream_iter)) == ["backup-1", "backup-2"]
+    time.sleep(0.5)
+    assert sorted(closed) == ["backup", "primary"]
+
+
+def test_arace_cancels_loser():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "primary"
+
+    async def fast():
+        return "backup"
+
+    result = asyncio.run(arace(slow, fast, 0.01, lambda: True))
+    assert result == ("backup", 1)
+    assert cancelled == [True]
+
+
+def test_arace_cancels_primary_when_cancelled_during_the_delay():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        race_task = asyncio.ensure_future(arace(slow, slow, 0.5, lambda: True))
+        await asyncio.sleep(0.01)
+        race_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await race_task
+        await asyncio.sleep(0)
+        assert cancelled == [True]
+
+    asyncio.run(run())
+
+
+def test_aopen_stream_and_continue():
+    async def create():
+        async def chunks():
+            for chunk in ["a", "b"]:
+                yield chunk
+
+        return chunks()
+
+    async def run():
+        opened = await aopen_stream(create)
+        return [chunk async for chunk in acontinue_stream(*opened)]
+
+    assert asyncio.run(run()) == ["a", "b"]
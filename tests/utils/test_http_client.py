@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+
+from aisuite.utils.http_client import PooledHttpClient
+
+
+def test_from_config_picks_transport_keys():
+    http = PooledHttpClient.from_config(
+        {
+            "api_key": "ignored",
+            "timeout": 12,
+            "max_connections": 50,
+            "max_keepalive_connections": 10,
+            "keepalive_expiry": 30.0,
+        }
+    )
+
+    assert http.timeout == 12
+    assert http.limits == httpx.Limits(
+        max_connections=50, max_keepalive_connections=10, keepalive_expiry=30.0
+    )
+    assert http.http2 is False
+
+
+def test_clients_are_created_once_and_closed():
+    http = PooledHttpClient()
+
+    client = http.client
+    assert isinstance(client, httpx.Client)
+    assert http.client is client
+
+    async_client = http.async_client
+    assert isinstance(async_client, httpx.AsyncClient)
+    assert http.async_client is async_client
+
+    asyncio.run(http.aclose())
+    assert client.is_closed
+    assert async_client.is_closed
+    assert http.client is not client
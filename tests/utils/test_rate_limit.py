@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from aisuite.framework.message import CompletionUsage
+from aisuite.utils.rate_limit import RateLimiter, TokenBucket, estimate_tokens
+
+
+@pytest.fixture
+def clock():
+    with patch("aisuite.utils.rate_limit.time") as mock_time:
+        mock_time.monotonic.return_value = 0.0
+        yield mock_time
+
+
+def test_estimate_tokens_counts_prompt_and_max_tokens():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert 100 <= estimate_tokens(messages, {}) < 120
+    assert estimate_tokens(messages, {"max_tokens": 500}) == (
+        estimate_tokens(messages, {}) + 500
+    )
+
+
+def test_token_bucket_waits_for_debt_to_refill(clock):
+    bucket = TokenBucket(rate_per_minute=60)
+    assert bucket.reserve(60) == 0
+    assert bucket.reserve(3) == pytest.approx(3)
+    assert bucket.reserve(2) == pytest.approx(5)
+
+    clock.monotonic.return_value = 10.0
+    assert bucket.available == pytest.approx(5)
+
+    clock.monotonic.return_value = 1000.0
+    assert bucket.available == 60
+
+
+def test_rate_limiter_admits_within_both_budgets(clock):
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=600)
+    for _ in range(2):
+        limiter.acquire(100)
+    assert clock.sleep.call_args_list[-1].args[0] == 0
+
+    limiter.acquire(100)
+    assert clock.sleep.call_args.args[0] == pytest.approx(30)
+
+    limiter.acquire(400)
+    assert clock.sleep.call_args.args[0] == pytest.approx(60)
+
+
+def test_rate_limiter_reconciles_estimates_with_usage(clock):
+    limiter = RateLimiter(tokens_per_minute=1000)
+    reserved = limiter.acquire(500)
+    limiter.reconcile(reserved, CompletionUsage(total_tokens=200))
+    assert limiter.stats() == {"requests_available": None, "tokens_available": 800}
+
+    reserved = limiter.acquire(100)
+    limiter.reconcile(reserved, None)
+    assert limiter.stats()["tokens_available"] == 700
+
+    limiter.release(limiter.acquire(300))
+    assert limiter.stats()["tokens_available"] == 700
+
+
+def test_rate_limiter_async_cancel_returns_budget():
+    limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=100)
+
+    async def run():
+        await limiter.aacquire(100)
+        waiter = asyncio.ensure_future(limiter.aacquire(100))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(run())
+    stats = limiter.stats()
+    assert stats["requests_available"] == pytest.approx(0, abs=0.01)
+    assert stats["tokens_available"] == pytest.approx(0, abs=1)
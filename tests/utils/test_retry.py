@@ -0,0 +1,127 @@
+import asyncio
+import email.utils
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from aisuite.provider import (
+    LLMError,
+    NonRetryableError,
+    OverloadedError,
+    ProviderConnectionError,
+    ProviderTimeoutError,
+    RateLimitError,
+    classify_error,
+    get_retry_after,
+)
+from aisuite.utils.retry import RetryPolicy
+
+
+def _status_error(status_code, headers=None):
+    request = httpx.Request("POST", "https://example.com")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("failed", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (_status_error(429), RateLimitError),
+        (_status_error(529), OverloadedError),
+        (_status_error(503), OverloadedError),
+        (_status_error(504), ProviderTimeoutError),
+        (_status_error(400), NonRetryableError),
+        (httpx.ReadTimeout("timed out"), ProviderTimeoutError),
+        (httpx.ConnectError("refused"), ProviderConnectionError),
+        (ConnectionResetError(), ProviderConnectionError),
+        (LLMError("Overloaded", status_code=529), OverloadedError),
+        (ValueError("bad message"), NonRetryableError),
+    ],
+)
+def test_classify_error(error, expected):
+    classified = classify_error(error)
+    assert type(classified) is expected
+    assert classified.retryable == (expected is not NonRetryableError)
+
+
+def test_classify_error_follows_wrapped_errors():
+    try:
+        try:
+            raise _status_error(429, headers={"retry-after": "7"})
+        except httpx.HTTPStatusError as e:
+            raise LLMError(f"An error occurred: {e}")
+    except LLMError as e:
+        classified = classify_error(e, "Rate limited")
+
+    assert isinstance(classified, RateLimitError)
+    assert str(classified) == "Rate limited"
+    assert classified.status_code == 429
+    assert classified.retry_after == 7
+
+
+def test_get_retry_after_headers():
+    assert get_retry_after(_status_error(429, {"retry-after-ms": "1500"})) == 1.5
+    retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 28 < get_retry_after(_status_error(503, {"retry-after": retry_at})) <= 30
+    assert get_retry_after(_status_error(429)) is None
+
+
+def test_next_delay_backs_off_and_honors_retry_after():
+    policy = RetryPolicy(max_attempts=4, initial_delay=1, jitter=False)
+    error = RateLimitError("Rate limited")
+
+    assert [policy.next_delay(attempt, error) for attempt in (1, 2, 3, 4)] == [
+        1,
+        2,
+        4,
+        None,
+    ]
+    assert policy.next_delay(1, RateLimitError("Slow down", retry_after=10)) == 10
+    assert policy.next_delay(1, NonRetryableError("Bad request")) is None
+    assert policy.next_delay(1, ValueError("bad message")) is None
+
+
+def test_next_delay_respects_time_budget_and_jitter():
+    policy = RetryPolicy(initial_delay=4, max_elapsed=10)
+    error = OverloadedError("Overloaded")
+
+    assert all(0 <= policy.next_delay(1, error) <= 4 for _ in range(100))
+    assert 3 <= policy.next_delay(1, OverloadedError("Busy", retry_after=3), 6) <= 4
+    assert policy.next_delay(1, OverloadedError("Busy", retry_after=5), 6) is None
+
+
+def test_call_retries_transient_errors():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise OverloadedError("Overloaded")
+        return "ok"
+
+    with patch("aisuite.utils.retry.time.sleep") as mock_sleep:
+        assert RetryPolicy().call(flaky) == "ok"
+    assert len(calls) == 3
+    assert mock_sleep.call_count == 2
+
+    def broken():
+        raise NonRetryableError("Bad request")
+
+    with pytest.raises(NonRetryableError):
+        RetryPolicy().call(broken)
+
+
+def test_acall_gives_up_after_max_attempts():
+    calls = 0
+
+    async def throttled():
+        nonlocal calls
+        calls += 1
+        raise RateLimitError("Rate limited")
+
+    policy = RetryPolicy(max_attempts=3, initial_delay=0.001)
+    with pytest.raises(RateLimitError):
+        asyncio.run(policy.acall(throttled))
+    assert calls == 3
@@ -0,0 +1,237 @@
+import asyncio
+
+import pytest
+
+from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_chunk import ChatCompletionChunk
+from aisuite.framework.message import (
+    ChatCompletionMessageToolCall,
+    CompletionUsage,
+    Function,
+)
+from aisuite.utils.streaming import (
+    StreamAccumulator,
+    ThinkingStreamSplitter,
+    aiter_sse_json,
+    asplit_thinking,
+    iter_sse_json,
+    response_to_chunks,
+    split_thinking,
+)
+
+
+SSE_LINES = [
+    ": keep-alive",
+    'data: {"id": "1", "choices": [{"index": 0, "delta": {"content": "Hel"}}]}',
+    "",
+    'data: {"id": "1", "choices": [{"index": 0, "delta": {"content": "lo"}}]}',
+    "data: [DONE]",
+    'data: {"id": "ignored"}',
+]
+
+
+def test_iter_sse_json_stops_at_done():
+    payloads = list(iter_sse_json(SSE_LINES))
+
+    assert [p["choices"][0]["delta"]["content"] for p in payloads] == ["Hel", "lo"]
+
+
+def test_aiter_sse_json_stops_at_done():
+    async def lines():
+        for line in SSE_LINES:
+            yield line
+
+    async def collect():
+        return [payload async for payload in aiter_sse_json(lines())]
+
+    assert len(asyncio.run(collect())) == 2
+
+
+def test_response_to_chunks_replays_content_tool_calls_and_usage():
+    response = ChatCompletionResponse()
+    response.choices[0].message.content = "Checking."
+    response.choices[0].message.tool_calls = [
+        ChatCompletionMessageToolCall(
+            id="call_1",
+            type="function",
+            function=Function(name="get_score", arguments='{"team": "Dodgers"}'),
+        )
+    ]
+    response.usage = CompletionUsage(
+        prompt_tokens=10, completion_tokens=5, total_tokens=15
+    )
+
+    chunks = list(response_to_chunks(response))
+
+    assert len(chunks) == 2
+    choice = chunks[0].choices[0]
+    assert choice.delta.content == "Checking."
+    assert choice.delta.tool_calls[0].function.name == "get_score"
+    assert choice.finish_reason == "tool_calls"
+    assert chunks[1].choices == []
+    assert chunks[1].usage.total_tokens == 15
+    assert chunks[0].id == chunks[1].id
+
+
+def test_accumulator_assembles_tool_call_fragments():
+    raw_chunks = [
+        {"choices": [{"delta": {"role": "assistant", "content": "Let me "}}]},
+        {"choices": [{"delta": {"content": "check."}}]},
+        {
+            "choices": [
+                {
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "get_score", "arguments": ""},
+                            }
+                        ]
+                    }
+                }
+            ]
+        },
+        {
+            "choices": [
+                {
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '{"team": '}}
+                        ]
+                    }
+                }
+            ]
+        },
+        {
+            "choices": [
+                {
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '"Dodgers"}'}}
+                        ]
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ]
+        },
+        {
+            "choices": [],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": 7},
+        },
+    ]
+
+    accumulator = StreamAccumulator()
+    for raw_chunk in raw_chunks:
+        accumulator.add(ChatCompletionChunk.model_validate(raw_chunk))
+    response = accumulator.response()
+
+    message = response.choices[0].message
+    assert message.content == "Let me check."
+    assert message.tool_calls[0].id == "call_1"
+    assert message.tool_calls[0].function.name == "get_score"
+    assert message.tool_calls[0].function.arguments == '{"team": "Dodgers"}'
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert response.usage.total_tokens == 7
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        {"choices": [{"index": 0, "delta": {}, "finish_reason": None}]},
+        {"choices": [], "usage": None},
+    ],
+)
+def test_accumulator_ignores_empty_chunks(chunk):
+    accumulator = StreamAccumulator()
+    accumulator.add(ChatCompletionChunk.model_validate(chunk))
+
+    assert accumulator.response().choices[0].message.content is None
+
+
+THINKING_TEXT = "<think>\nLet me compare </thin and </th.\n</think>\n\nThe Dodgers won."
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, len(THINKING_TEXT)])
+def test_thinking_splitter_handles_tags_split_across_chunks(size):
+    splitter = ThinkingStreamSplitter()
+    reasoning, content = "", ""
+    for start in range(0, len(THINKING_TEXT), size):
+        piece_reasoning, piece_content = splitter.feed(
+            THINKING_TEXT[start : start + size]
+        )
+        reasoning += piece_reasoning
+        content += piece_content
+    flushed_reasoning, flushed_content = splitter.flush()
+
+    assert reasoning + flushed_reasoning == "Let me compare </thin and </th."
+    assert content + flushed_content == "The Dodgers won."
+
+
+def test_thinking_splitter_emits_answer_as_soon_as_block_closes():
+    splitter = ThinkingStreamSplitter()
+
+    assert splitter.feed("<think>plan") == ("plan", "")
+    assert splitter.feed("</think>The") == ("", "The")
+    assert splitter.feed(" answer") == ("", " answer")
+
+
+@pytest.mark.parametrize(
+    "pieces, expected",
+    [
+        (["No ", "<think> here"], ("", "No <think> here")),
+        (["<thi"], ("", "<thi")),
+        (["<think>unfinished  "], ("unfinished", "")),
+    ],
+)
+def test_thinking_splitter_without_complete_block(pieces, expected):
+    splitter = ThinkingStreamSplitter()
+    reasoning, content = "", ""
+    for piece in pieces + [None]:
+        piece_reasoning, piece_content = (
+            splitter.feed(piece) if piece is not None else splitter.flush()
+        )
+        reasoning += piece_reasoning
+        content += piece_content
+
+    assert (reasoning, content) == expected
+
+
+def _content_chunks(pieces, finish_reason="stop"):
+    chunks = [
+        ChatCompletionChunk.model_validate(
+            {"id": "1", "choices": [{"delta": {"content": piece}}]}
+        )
+        for piece in pieces
+    ]
+    chunks[-1].choices[0].finish_reason = finish_reason
+    return chunks
+
+
+def test_split_thinking_rewrites_chunk_deltas():
+    chunks = list(split_thinking(_content_chunks(["<think>a", "b</th", "ink>Hi"])))
+
+    assert [c.choices[0].delta.reasoning_content for c in chunks] == ["a", "b", None]
+    assert [c.choices[0].delta.content for c in chunks] == [None, None, "Hi"]
+
+
+def test_split_thinking_flushes_held_back_text_on_finish():
+    chunks = list(split_thinking(_content_chunks(["<th"])))
+
+    assert len(chunks) == 1
+    assert chunks[0].choices[0].delta.content == "<th"
+
+
+def test_asplit_thinking_releases_leftover_after_stream():
+    async def chunks():
+        for chunk in _content_chunks(["<think>a", "</thi"], finish_reason=None):
+            yield chunk
+
+    async def collect():
+        return [chunk async for chunk in asplit_thinking(chunks())]
+
+    result = asyncio.run(collect())
+
+    assert len(result) == 3
+    assert result[-1].choices[0].delta.reasoning_content == "</thi"
@@ -1,6 +1,11 @@
+import asyncio
+import gc
+import time
 import unittest
+from unittest.mock import patch
 from pydantic import BaseModel
 from typing import Dict
+from aisuite.utils import tools as tools_module
 from aisuite.utils.tools import Tools  # Import your ToolManager class
 from enum import Enum
 
@@ -38,6 +43,28 @@ def get_current_temperature_v2(
     return {"location": location, "unit": unit, "temperature": "72"}
 
 
+def slow_lookup(key: str, delay: float = 0.2) -> Dict[str, str]:
+    """Looks up a key after a delay."""
+    time.sleep(delay)
+    return {"key": key}
+
+
+async def async_lookup(key: str, delay: float = 0.2) -> Dict[str, str]:
+    """Looks up a key asynchronously after a delay."""
+    await asyncio.sleep(delay)
+    return {"key": key, "source": "async"}
+
+
+def _slow_lookup_call(call_id, key, delay=0.2):
+    return {
+        "id": call_id,
+        "function": {
+            "name": "slow_lookup",
+            "arguments": {"key": key, "delay": delay},
+        },
+    }
+
+
 class TestToolManager(unittest.TestCase):
     def setUp(self):
         self.tool_manager = Tools()
@@ -195,6 +222,171 @@ class TestToolManager(unittest.TestCase):
             tools == expected_tool_spec
         ), f"Expected {expected_tool_spec}, but got {tools}"
 
+    def test_execute_tool_parallel_keeps_order(self):
+        """Test that parallel execution runs tool calls concurrently and in order."""
+        tools = Tools([slow_lookup])
+        tool_calls = [
+            _slow_lookup_call("call_1", "a", delay=0.3),
+            _slow_lookup_call("call_2", "b", delay=0.1),
+            _slow_lookup_call("call_3", "c", delay=0.2),
+        ]
+
+        start = time.monotonic()
+        results, messages = tools.execute_tool(tool_calls, parallel=True)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(results, [{"key": "a"}, {"key": "b"}, {"key": "c"}])
+        self.assertEqual(
+            [message["tool_call_id"] for message in messages],
+            ["call_1", "call_2", "call_3"],
+        )
+
+    def test_execute_tool_parallel_respects_max_workers(self):
+        """Test that max_workers bounds the size of the thread pool."""
+        tools = Tools([slow_lookup], max_workers=1)
+        tool_calls = [
+            _slow_lookup_call("call_1", "a", delay=0.1),
+            _slow_lookup_call("call_2", "b", delay=0.1),
+        ]
+
+        start = time.monotonic()
+        tools.execute_tool(tool_calls, parallel=True)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_execute_tool_timeout(self):
+        """Test that a tool running past its timeout raises a TimeoutError."""
+        tools = Tools([slow_lookup], timeout=0.05)
+
+        with self.assertRaises(TimeoutError):
+            tools.execute_tool(
+                [_slow_lookup_call("call_1", "a", delay=0.5)], parallel=True
+            )
+
+        with self.assertRaises(TimeoutError):
+            tools.execute_tool([_slow_lookup_call("call_1", "a", delay=0.5)])
+
+    def test_aexecute_tool_runs_async_and_sync_tools_together(self):
+        """Test that async tools are awaited and run concurrently with sync tools."""
+        tools = Tools([slow_lookup, async_lookup])
+        tool_calls = [
+            {
+                "id": "call_1",
+                "function": {
+                    "name": "async_lookup",
+                    "arguments": '{"key": "a", "delay": 0.2}',
+                },
+            },
+            _slow_lookup_call("call_2", "b", delay=0.2),
+            {
+                "id": "call_3",
+                "function": {
+                    "name": "async_lookup",
+                    "arguments": {"key": "c", "delay": 0.1},
+                },
+            },
+        ]
+
+        start = time.monotonic()
+        results, messages = asyncio.run(tools.aexecute_tool(tool_calls))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(
+            results,
+            [
+                {"key": "a", "source": "async"},
+                {"key": "b"},
+                {"key": "c", "source": "async"},
+            ],
+        )
+        self.assertEqual(
+            [message["tool_call_id"] for message in messages],
+            ["call_1", "call_2", "call_3"],
+        )
+
+    def test_aexecute_tool_validates_and_times_out(self):
+        """Test that async execution keeps validation and enforces the timeout."""
+        tools = Tools([async_lookup], timeout=0.05)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(
+                tools.aexecute_tool(
+                    {
+                        "id": "call_1",
+                        "function": {"name": "async_lookup", "arguments": {"key": 1}},
+                    }
+                )
+            )
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(
+                tools.aexecute_tool(
+                    {
+                        "id": "call_1",
+                        "function": {
+                            "name": "async_lookup",
+                            "arguments": {"key": "a", "delay": 0.5},
+                        },
+                    }
+                )
+            )
+
+    def test_execute_tool_runs_async_tool_from_sync_code(self):
+        """Test that the synchronous path awaits async tools instead of returning coroutines."""
+        tools = Tools([async_lookup])
+        call = {
+            "id": "call_1",
+            "function": {"name": "async_lookup", "arguments": {"key": "a", "delay": 0}},
+        }
+
+        results, _ = tools.execute_tool(call)
+        self.assertEqual(results, [{"key": "a", "source": "async"}])
+
+        async def inside_running_loop():
+            return tools.execute_tool(call)
+
+        results, _ = asyncio.run(inside_running_loop())
+        self.assertEqual(results, [{"key": "a", "source": "async"}])
+
+    def test_inferred_spec_is_cached_across_instances(self):
+        """Test that signature inference runs once per function across Tools instances."""
+
+        def lookup(key: str) -> Dict[str, str]:
+            """Looks up a key."""
+            return {"key": key}
+
+        with patch.object(
+            tools_module, "create_model", wraps=tools_module.create_model
+        ) as mock_create_model:
+            first = Tools([lookup]).tools()
+            second = Tools([lookup]).tools()
+
+        self.assertEqual(mock_create_model.call_count, 1)
+        self.assertEqual(first, second)
+
+        # Each instance gets its own copy of the cached spec.
+        first[0]["function"]["description"] = "changed"
+        self.assertEqual(Tools([lookup]).tools(), second)
+
+    def test_inferred_spec_cache_does_not_keep_functions_alive(self):
+        """Test that cached entries are dropped once their function is collected."""
+        namespace = {}
+        exec(
+            "def dynamic_tool(key: str) -> str:\n    return key\n",
+            {"str": str},
+            namespace,
+        )
+        Tools([namespace["dynamic_tool"]])
+        self.assertIn(namespace["dynamic_tool"], tools_module._inferred_specs)
+
+        size = len(tools_module._inferred_specs)
+        del namespace["dynamic_tool"]
+        gc.collect()
+
+        self.assertEqual(len(tools_module._inferred_specs), size - 1)
+
 
 if __name__ == "__main__":
     unittest.main()